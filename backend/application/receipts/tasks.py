@@ -0,0 +1,36 @@
+"""
+Background receipt processing tasks.
+"""
+
+from typing import Any, Dict, Optional
+from celery import shared_task
+import logging
+
+from domain.receipts.services import FileValidationService, ReceiptBusinessService
+from infrastructure.database.repositories import DjangoReceiptRepository
+from infrastructure.ocr.services import OCRService, OCRMethod
+from infrastructure.storage.services import FileStorageService
+from .use_cases import ReceiptUploadUseCase
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def process_receipt_ocr_task(receipt_id: str, ocr_method: Optional[str] = None) -> Dict[str, Any]:
+    """Run OCR for an uploaded receipt off the request path and save the result on it."""
+    receipt_repository = DjangoReceiptRepository()
+    receipt = receipt_repository.find_by_id(receipt_id)
+    if receipt is None:
+        logger.warning("Receipt %s no longer exists; skipping OCR", receipt_id)
+        return {'success': False, 'error': 'Receipt not found'}
+    
+    use_case = ReceiptUploadUseCase(
+        receipt_repository=receipt_repository,
+        file_validation_service=FileValidationService(),
+        file_storage_service=FileStorageService(),
+        ocr_service=OCRService(),
+        receipt_business_service=ReceiptBusinessService()
+    )
+    result = use_case.process_ocr(receipt, OCRMethod(ocr_method) if ocr_method else None)
+    logger.info("OCR for receipt %s finished: success=%s", receipt_id, result['success'])
+    return result
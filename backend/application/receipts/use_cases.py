@@ -20,6 +20,7 @@ from domain.accounts.entities import User
 from infrastructure.storage.services import FileStorageService
 from infrastructure.ocr.services import OCRService, OCRMethod
 from django.conf import settings
+from django.db import transaction
 import requests
 
 
@@ -143,9 +144,20 @@ class ReceiptUploadUseCase:
             # Step 5: Save receipt to repository
             saved_receipt = self.receipt_repository.save(receipt)
             
-            # Step 6: Process OCR asynchronously (in real implementation, this would be a background task)
-            # For now, we'll process it synchronously
-            ocr_result = self._process_ocr_async(saved_receipt, ocr_method)
+            # Step 6: Process OCR, reusing the result of an identical earlier upload,
+            # in the Celery worker when OCR_ASYNC_PROCESSING is on
+            checksum = saved_receipt.metadata.custom_fields.get("sha256")
+            duplicate = self.receipt_repository.find_processed_by_checksum(user, checksum) if checksum else None
+            if duplicate is not None and duplicate.ocr_data:
+                ocr_result = self._apply_ocr_data(saved_receipt, duplicate.ocr_data)
+            elif getattr(settings, 'OCR_ASYNC_PROCESSING', False):
+                from .tasks import process_receipt_ocr_task
+                method_value = ocr_method.value if ocr_method else None
+                # Wait for the receipt row to commit before a worker can load it
+                transaction.on_commit(lambda: process_receipt_ocr_task.delay(saved_receipt.id, method_value))
+                ocr_result = {'success': False, 'queued': True}
+            else:
+                ocr_result = self.process_ocr(saved_receipt, ocr_method)
             
             return {
                 'success': True,
@@ -153,6 +165,7 @@ class ReceiptUploadUseCase:
                 'file_url': file_url,
                 'status': saved_receipt.status.value,
                 'ocr_processed': ocr_result['success'],
+                'ocr_queued': ocr_result.get('queued', False),
                 'ocr_data': ocr_result.get('ocr_data'),
                 'ocr_error': ocr_result.get('error')
             }
@@ -163,9 +176,12 @@ class ReceiptUploadUseCase:
                 'error': f'Receipt upload failed: {str(e)}'
             }
     
-    def _process_ocr_async(self, receipt: Receipt, ocr_method: Optional[OCRMethod] = None) -> Dict[str, Any]:
+    def process_ocr(self, receipt: Receipt, ocr_method: Optional[OCRMethod] = None) -> Dict[str, Any]:
         """
-        Process OCR for a receipt (simulated async processing).
+        Process OCR for a saved receipt and store the outcome on it.
+        
+        Runs inline during upload, or in a Celery worker through
+        process_receipt_ocr_task when OCR_ASYNC_PROCESSING is enabled.
         
         Args:
             receipt: The receipt to process
@@ -189,31 +205,7 @@ class ReceiptUploadUseCase:
                 is_valid, validation_errors = self.receipt_validation_service.validate_ocr_data(ocr_data)
                 
                 if is_valid:
-                    # Process OCR data and update receipt
-                    receipt.process_ocr_data(ocr_data)
-                    
-                    # Suggest category based on business rules
-                    suggested_category = self.receipt_business_service.suggest_category(receipt)
-                    if suggested_category:
-                        receipt.metadata.category = suggested_category
-                    
-                    # Determine if it's a business expense
-                    is_business_expense = self.receipt_business_service.is_business_expense(receipt)
-                    receipt.metadata.is_business_expense = is_business_expense
-                    
-                    # Save updated receipt
-                    self.receipt_repository.save(receipt)
-                    
-                    return {
-                        'success': True,
-                        'ocr_data': {
-                            'merchant_name': ocr_data.merchant_name,
-                            'total_amount': str(ocr_data.total_amount) if ocr_data.total_amount else None,
-                            'currency': ocr_data.currency,
-                            'date': ocr_data.date.isoformat() if ocr_data.date else None,
-                            'confidence_score': ocr_data.confidence_score
-                        }
-                    }
+                    return self._apply_ocr_data(receipt, ocr_data)
                 else:
                     # OCR data validation failed
                     receipt.mark_as_failed(f"OCR data validation failed: {', '.join(validation_errors)}")
@@ -242,6 +234,34 @@ class ReceiptUploadUseCase:
                 'success': False,
                 'error': f"OCR processing error: {str(e)}"
             }
+    
+    def _apply_ocr_data(self, receipt: Receipt, ocr_data: OCRData) -> Dict[str, Any]:
+        """Store validated OCR data on a receipt, classify it and save it."""
+        # Process OCR data and update receipt
+        receipt.process_ocr_data(ocr_data)
+        
+        # Suggest category based on business rules
+        suggested_category = self.receipt_business_service.suggest_category(receipt)
+        if suggested_category:
+            receipt.metadata.category = suggested_category
+        
+        # Determine if it's a business expense
+        is_business_expense = self.receipt_business_service.is_business_expense(receipt)
+        receipt.metadata.is_business_expense = is_business_expense
+        
+        # Save updated receipt
+        self.receipt_repository.save(receipt)
+        
+        return {
+            'success': True,
+            'ocr_data': {
+                'merchant_name': ocr_data.merchant_name,
+                'total_amount': str(ocr_data.total_amount) if ocr_data.total_amount else None,
+                'currency': ocr_data.currency,
+                'date': ocr_data.date.isoformat() if ocr_data.date else None,
+                'confidence_score': ocr_data.confidence_score
+            }
+        }
 
 
 class ReceiptReprocessUseCase:
@@ -34,7 +34,7 @@ class SubscriptionTier(Enum):
     ENTERPRISE = "enterprise"
 
 
-@dataclass
+@dataclass(slots=True)
 class BusinessProfile(ValueObject):
     """Value object for business profile information."""
     
@@ -60,7 +60,7 @@ class BusinessProfile(ValueObject):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class NotificationPreferences(ValueObject):
     """Value object for notification preferences."""
     
@@ -158,6 +158,13 @@ class User(AggregateRoot):
     and subscription management.
     """
     
+    __slots__ = (
+        '_email', '_password_hash', '_first_name', '_last_name', '_user_type',
+        '_business_profile', '_phone', '_status', '_subscription_tier',
+        '_notification_preferences', '_timezone', '_language', '_is_verified',
+        '_verified_at', '_last_login',
+    )
+    
     def __init__(
         self,
         email: Email,
@@ -25,6 +25,8 @@ class DomainEvent:
 class ValueObject(ABC):
     """Base class for value objects."""
     
+    __slots__ = ()
+    
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, self.__class__):
             return False
@@ -42,6 +44,8 @@ class ValueObject(ABC):
 class Entity(ABC):
     """Base class for domain entities."""
     
+    __slots__ = ('_id', '_domain_events', '_created_at', '_updated_at')
+    
     def __init__(self, id: Optional[str] = None):
         self._id = id or str(uuid.uuid4())
         self._domain_events: List[DomainEvent] = []
@@ -93,6 +97,8 @@ class Entity(ABC):
 class AggregateRoot(Entity):
     """Base class for aggregate roots."""
     
+    __slots__ = ('_version',)
+    
     def __init__(self, id: Optional[str] = None):
         super().__init__(id)
         self._version = 0
@@ -113,7 +119,7 @@ class AggregateRoot(Entity):
         self._update_timestamp()
 
 
-@dataclass
+@dataclass(slots=True)
 class Money(ValueObject):
     """Value object for monetary amounts."""
     
@@ -146,7 +152,7 @@ class Money(ValueObject):
         return f"{self.currency} {self.amount:.2f}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Email(ValueObject):
     """Value object for email addresses."""
     
@@ -164,7 +170,7 @@ class Email(ValueObject):
         return self.address
 
 
-@dataclass
+@dataclass(slots=True)
 class PhoneNumber(ValueObject):
     """Value object for phone numbers."""
     
@@ -195,7 +201,7 @@ class PhoneNumber(ValueObject):
         return f"{self.country_code} {self.number}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Address(ValueObject):
     """Value object for addresses."""
     
@@ -215,7 +221,7 @@ class Address(ValueObject):
         return f"{self.street}, {self.city}, {self.postal_code}, {self.country}"
 
 
-@dataclass
+@dataclass(slots=True)
 class DateRange(ValueObject):
     """Value object for date ranges."""
     
@@ -33,6 +33,8 @@ class ReceiptType(Enum):
 class FileInfo(ValueObject):
     """Value object for file information."""
     
+    __slots__ = ('filename', 'file_size', 'mime_type', 'file_url')
+    
     def __init__(self, filename: str, file_size: int, mime_type: str, file_url: str):
         self.filename = filename
         self.file_size = file_size
@@ -46,6 +48,12 @@ class FileInfo(ValueObject):
 class OCRData(ValueObject):
     """Value object for OCR extracted data."""
     
+    __slots__ = (
+        'merchant_name', 'total_amount', 'currency', 'date', 'vat_amount',
+        'vat_number', 'receipt_number', 'items', 'confidence_score', 'raw_text',
+        'additional_data',
+    )
+    
     def __init__(self, 
                  merchant_name: Optional[str] = None,
                  total_amount: Optional[Decimal] = None,
@@ -108,6 +116,8 @@ class OCRData(ValueObject):
 class ReceiptMetadata(ValueObject):
     """Value object for receipt metadata."""
     
+    __slots__ = ('category', 'tags', 'notes', 'is_business_expense', 'tax_deductible', 'custom_fields')
+    
     def __init__(self,
                  category: Optional[str] = None,
                  tags: Optional[Union[List[str], Set[str]]] = None,
@@ -176,6 +186,8 @@ class ReceiptProcessedEvent(DomainEvent):
 class Receipt(AggregateRoot):
     """Receipt aggregate root."""
     
+    __slots__ = ('user', 'file_info', 'status', 'receipt_type', 'ocr_data', 'metadata', '_processed_at')
+    
     def __init__(self,
                  id: str,
                  user: User,
@@ -9,4 +9,13 @@ class DatabaseConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'infrastructure.database'
     label = 'infrastructure_database'
-    verbose_name = 'Database Infrastructure' 
\ No newline at end of file
+    verbose_name = 'Database Infrastructure'
+
+    def ready(self):
+        from django.db.models.signals import post_save, post_delete
+        from .models import User
+        from .repositories import invalidate_user_cache
+
+        # Writes that bypass DjangoUserRepository must still retire its cached reads
+        post_save.connect(invalidate_user_cache, sender=User, dispatch_uid='user_repo_cache_save')
+        post_delete.connect(invalidate_user_cache, sender=User, dispatch_uid='user_repo_cache_delete') 
\ No newline at end of file
@@ -0,0 +1,31 @@
+"""
+JSON encoder/decoder pair for model JSONFields backed by orjson.
+"""
+
+import json
+
+import orjson
+from django.core.serializers.json import DjangoJSONEncoder
+
+
+class OrjsonEncoder(DjangoJSONEncoder):
+    """
+    Serialize JSONField values with orjson.
+
+    Datetimes, Decimals and other non-native types are passed through to
+    DjangoJSONEncoder.default so stored values keep the same format.
+    """
+
+    def encode(self, o):
+        return orjson.dumps(
+            o,
+            default=self.default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+        ).decode()
+
+
+class OrjsonDecoder(json.JSONDecoder):
+    """Parse JSONField values with orjson."""
+
+    def decode(self, s, _w=None):
+        return orjson.loads(s)
@@ -0,0 +1,40 @@
+# Generated by hand to add a full-text search index for receipts
+from django.db import migrations
+
+
+def create_search_index(apps, schema_editor):
+    # Only run on PostgreSQL
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    # Expression must match the document built in DjangoReceiptRepository.search_receipts
+    schema_editor.execute(
+        """
+        CREATE INDEX IF NOT EXISTS receipts_search_fts_idx
+        ON receipts USING GIN ((
+            to_tsvector('english',
+                coalesce(filename, '') || ' ' ||
+                coalesce(ocr_data->>'merchant_name', '') || ' ' ||
+                coalesce(ocr_data->>'raw_text', '') || ' ' ||
+                coalesce(metadata->>'notes', ''))
+        ));
+        """
+    )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS receipts_search_fts_idx;")
+
+
+class Migration(migrations.Migration):
+    atomic = True
+
+    dependencies = [
+        ('infrastructure_database', '0013_clientuser_client_address_client_phone_client_status_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,52 @@
+# Generated by hand to add indexes for DjangoUserRepository lookups
+from django.db import migrations, models
+
+
+def create_trigram_index(apps, schema_editor):
+    # Only run on PostgreSQL
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    # Enable pg_trgm for trigram indexes (idempotent)
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm;")
+
+    # Trigram GIN index so company_name__icontains can avoid a sequential scan
+    schema_editor.execute(
+        """
+        CREATE INDEX IF NOT EXISTS users_trgm_company_name_idx
+        ON users USING GIN (company_name gin_trgm_ops);
+        """
+    )
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    # Leave extension installed
+    schema_editor.execute("DROP INDEX IF EXISTS users_trgm_company_name_idx;")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("infrastructure_database", "0014_receipt_search_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="user",
+            index=models.Index(
+                fields=["user_type", "status"], name="users_user_ty_cd71db_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="user",
+            index=models.Index(
+                fields=["status", "is_verified"], name="users_status_f3a800_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="user",
+            index=models.Index(fields=["last_login"], name="users_last_lo_65b80e_idx"),
+        ),
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 4.2.7 on 2026-10-18 10:12
+
+from django.db import migrations, models
+import infrastructure.database.encoders
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("infrastructure_database", "0015_user_lookup_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="receipt",
+            name="metadata",
+            field=models.JSONField(
+                blank=True,
+                decoder=infrastructure.database.encoders.OrjsonDecoder,
+                default=dict,
+                encoder=infrastructure.database.encoders.OrjsonEncoder,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="receipt",
+            name="ocr_data",
+            field=models.JSONField(
+                blank=True,
+                decoder=infrastructure.database.encoders.OrjsonDecoder,
+                default=dict,
+                encoder=infrastructure.database.encoders.OrjsonEncoder,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="user",
+            name="notification_preferences",
+            field=models.JSONField(
+                decoder=infrastructure.database.encoders.OrjsonDecoder,
+                default=dict,
+                encoder=infrastructure.database.encoders.OrjsonEncoder,
+            ),
+        ),
+    ]
@@ -9,6 +9,8 @@ from django.contrib.auth.models import AbstractUser
 from django.core.validators import RegexValidator
 from django.utils import timezone
 
+from .encoders import OrjsonEncoder, OrjsonDecoder
+
 
 class User(AbstractUser):
     """
@@ -86,7 +88,7 @@ class User(AbstractUser):
     language = models.CharField(max_length=10, default='en')
     
     # Notification preferences (stored as JSON)
-    notification_preferences = models.JSONField(default=dict)
+    notification_preferences = models.JSONField(default=dict, encoder=OrjsonEncoder, decoder=OrjsonDecoder)
     
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True)
@@ -113,6 +115,9 @@ class User(AbstractUser):
             models.Index(fields=['company_name']),
             models.Index(fields=['created_at']),
             models.Index(fields=['is_verified']),
+            models.Index(fields=['user_type', 'status']),
+            models.Index(fields=['status', 'is_verified']),
+            models.Index(fields=['last_login']),
         ]
     
     # Authentication fields
@@ -349,10 +354,10 @@ class Receipt(models.Model):
     receipt_type = models.CharField(max_length=20, choices=TYPE_CHOICES, default='purchase')
     
     # OCR extracted data (stored as JSON)
-    ocr_data = models.JSONField(default=dict, blank=True)
+    ocr_data = models.JSONField(default=dict, blank=True, encoder=OrjsonEncoder, decoder=OrjsonDecoder)
     
     # Metadata (stored as JSON)
-    metadata = models.JSONField(default=dict, blank=True)
+    metadata = models.JSONField(default=dict, blank=True, encoder=OrjsonEncoder, decoder=OrjsonDecoder)
     
     # Error information for failed processing
     error_message = models.TextField(blank=True, null=True)
@@ -3,14 +3,27 @@ Repository implementations for Smart Accounts Management System.
 Implements repository interfaces using Django ORM.
 """
 
-from typing import List, Optional, Any
-from decimal import Decimal
+import logging
+import re
+import time
+from typing import List, Optional, Any, Callable, Iterator, Sequence
+from decimal import Decimal, InvalidOperation
 from datetime import datetime
+from dataclasses import dataclass
+from collections import defaultdict, Counter
+from collections.abc import Sequence as SequenceABC
+from itertools import islice
+from functools import partial
 
-from django.db import transaction
+import orjson
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ObjectDoesNotExist
-from django.db.models import Q
+from django.db.models import Q, BooleanField, Count, FloatField
+from django.db.models.expressions import RawSQL
+from django.utils import timezone
 
 from domain.accounts.entities import User as DomainUser, BusinessProfile, UserType, UserStatus, SubscriptionTier, NotificationPreferences
 from domain.accounts.repositories import UserRepository
@@ -28,110 +41,295 @@ from domain.receipts.organization import Folder as DomainFolder, FolderType as D
 
 UserModel = get_user_model()
 
+logger = logging.getLogger(__name__)
+
+_PLACEHOLDER_EMAIL = 'placeholder@example.com'
+
+# Value -> member lookups for enums decoded on every converted row
+_USER_TYPES = {member.value: member for member in UserType}
+_USER_STATUSES = {member.value: member for member in UserStatus}
+_SUBSCRIPTION_TIERS = {member.value: member for member in SubscriptionTier}
+_RECEIPT_STATUSES = {member.value: member for member in ReceiptStatus}
+_RECEIPT_TYPES = {member.value: member for member in ReceiptType}
+
+# Full-text document for receipt search; must match receipts_search_fts_idx (migration 0014)
+_RECEIPT_SEARCH_DOCUMENT_SQL = (
+    "to_tsvector('english', "
+    "coalesce(receipts.filename, '') || ' ' || "
+    "coalesce(receipts.ocr_data->>'merchant_name', '') || ' ' || "
+    "coalesce(receipts.ocr_data->>'raw_text', '') || ' ' || "
+    "coalesce(receipts.metadata->>'notes', '')"
+    ")"
+)
+_RECEIPT_SEARCH_MATCH_SQL = f"{_RECEIPT_SEARCH_DOCUMENT_SQL} @@ to_tsquery('english', %s)"
+_RECEIPT_SEARCH_RANK_SQL = f"ts_rank({_RECEIPT_SEARCH_DOCUMENT_SQL}, to_tsquery('english', %s))"
+_SEARCH_WORD_RX = re.compile(r'\w+')
+# JSON path predicates written to match the expression indexes from migration 0003
+# (receipts_trgm_merchant_idx and receipts_user_amount_id_desc)
+_MERCHANT_MATCH_SQL = "(receipts.ocr_data->>'merchant_name') ILIKE %s"
+_AMOUNT_RANGE_SQL = "((receipts.ocr_data->>'total_amount')::numeric) BETWEEN %s AND %s"
+
+
+def _escape_like(value: str) -> str:
+    """Escape LIKE wildcards so user input is matched literally."""
+    return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+# Attribute defaults served by LazyDomainUser; values are built on access.
+_LAZY_USER_DEFAULTS = {
+    'email': lambda: Email(_PLACEHOLDER_EMAIL),
+    'password_hash': lambda: 'placeholder',
+    'first_name': lambda: 'Unknown',
+    'last_name': lambda: 'User',
+    'full_name': lambda: 'Unknown User',
+    'user_type': lambda: UserType.INDIVIDUAL,
+    'status': lambda: UserStatus.INACTIVE,
+    'subscription_tier': lambda: SubscriptionTier.BASIC,
+    'business_profile': lambda: BusinessProfile(company_name='Unknown Company', business_type='unknown'),
+    'phone': lambda: None,
+    'is_verified': lambda: False,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class LazyDomainUser:
+    """
+    Placeholder owner for receipts whose user row no longer exists.
+
+    Only the id is stored; other user attributes fall back to placeholder
+    values built on first access.
+    """
+
+    id: str
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            factory = _LAZY_USER_DEFAULTS[name]
+        except KeyError:
+            raise AttributeError(name) from None
+        return factory()
+
+
+class DeferredDomainUser:
+    """
+    Receipt owner that builds its DomainUser only on demand.
+
+    Receipt consumers mostly read ``user.id``; the Email, BusinessProfile
+    and DomainUser objects are created by ``factory`` on first access to
+    any other attribute and reused afterwards.
+    """
+
+    __slots__ = ('id', '_factory', '_user')
+
+    def __init__(self, id: str, factory: Callable[[], DomainUser]):
+        self.id = id
+        self._factory = factory
+        self._user: Optional[DomainUser] = None
+
+    def __getattr__(self, name: str) -> Any:
+        # Unset slots (e.g. mid-unpickle) must not recurse into the factory
+        if name in DeferredDomainUser.__slots__ or name.startswith('__'):
+            raise AttributeError(name)
+        if self._user is None:
+            self._user = self._factory()
+        return getattr(self._user, name)
+
+
+class LazyDomainList(SequenceABC):
+    """
+    Read-only sequence that converts queryset rows to domain objects on demand.
+
+    A single pass streams rows with ``QuerySet.iterator()`` and maps them in
+    batches of ``chunk_size`` via ``mapper``, so only one batch of domain
+    objects is held at a time. ``len()``, indexing and truthiness materialize
+    the full result once and later passes reuse it.
+    """
+
+    __slots__ = ('_queryset', '_mapper', '_chunk_size', '_items')
+
+    def __init__(self, queryset, mapper: Callable[[list], List[Any]], chunk_size: int = 500):
+        self._queryset = queryset
+        self._mapper = mapper
+        self._chunk_size = chunk_size
+        self._items: Optional[List[Any]] = None
+
+    def __iter__(self) -> Iterator[Any]:
+        if self._items is not None:
+            return iter(self._items)
+        return self._iter_lazily()
+
+    def __len__(self) -> int:
+        return len(self._materialize())
+
+    def __getitem__(self, index):
+        return self._materialize()[index]
+
+    def __bool__(self) -> bool:
+        return bool(self._materialize())
+
+    def __repr__(self) -> str:
+        return f'<LazyDomainList {self._items!r}>' if self._items is not None else '<LazyDomainList (unevaluated)>'
+
+    def _iter_lazily(self) -> Iterator[Any]:
+        # list() asks for len() after taking the iterator but before the first
+        # row; reuse that materialized result instead of querying a second time
+        if self._items is not None:
+            yield from self._items
+            return
+        yield from self._stream()
+
+    def _stream(self) -> Iterator[Any]:
+        rows = self._queryset.iterator(chunk_size=self._chunk_size)
+        while batch := list(islice(rows, self._chunk_size)):
+            yield from self._mapper(batch)
+
+    def _materialize(self) -> List[Any]:
+        if self._items is None:
+            self._items = list(self._stream())
+        return self._items
+
+
+def _fresh_cache_version() -> int:
+    """Seed for a missing version key; never reuses a namespace that may still hold entries."""
+    return time.time_ns()
+
+
+def invalidate_user_cache(**kwargs) -> None:
+    """Bump the user repository cache version; also wired to User save/delete signals."""
+    try:
+        cache.incr(DjangoUserRepository.CACHE_VERSION_KEY)
+    except ValueError:
+        # Version key missing or evicted; start a fresh namespace
+        cache.set(DjangoUserRepository.CACHE_VERSION_KEY, _fresh_cache_version(), timeout=None)
+
 
 class DjangoUserRepository(UserRepository):
     """Django ORM implementation of UserRepository."""
     
+    # Rows fetched per round-trip when streaming unbounded user queries
+    ITERATOR_CHUNK_SIZE = 500
+    
+    # Columns written when updating an existing user row
+    UPDATE_FIELDS = (
+        'email', 'first_name', 'last_name', 'user_type', 'status',
+        'company_name', 'business_type', 'phone', 'subscription_tier',
+        'is_verified', 'verified_at', 'last_login', 'timezone', 'language',
+        'notification_preferences', 'updated_at',
+    )
+    ADDRESS_FIELDS = ('address_street', 'address_city', 'address_postal_code', 'address_country')
+    
+    # Columns read by _to_domain_user; Stripe linkage, audit and Django admin
+    # columns are left behind on read paths
+    BASE_FIELDS = (
+        'id', 'email', 'password', 'first_name', 'last_name', 'user_type',
+        'status', 'company_name', 'business_type', 'phone', 'subscription_tier',
+        'is_verified', 'verified_at', 'last_login', 'timezone', 'language',
+        'notification_preferences',
+    ) + ADDRESS_FIELDS
+    
+    # Cached reads are namespaced by this counter; any write bumps it
+    CACHE_VERSION_KEY = 'user_repo:version'
+    
+    def __init__(self):
+        # Bound once; saves the manager descriptor lookup on every query
+        self._users = UserModel.objects
+    
     def save(self, user: DomainUser) -> DomainUser:
-        """Save or update a user."""
+        """Save or update a user with a single upsert statement."""
+        django_user = self._to_django_user(user)
+        self._users.bulk_create(
+            [django_user],
+            update_conflicts=True,
+            unique_fields=['id'],
+            update_fields=list(self._update_fields_for(user)),
+        )
+        self._invalidate_cache()
+        
+        # Return domain user
+        return self._to_domain_user(django_user)
+    
+    def save_many(self, users: List[DomainUser], batch_size: int = 500) -> List[DomainUser]:
+        """Save or update many users using batched inserts and updates."""
+        if not users:
+            return []
+        existing_ids = {
+            str(pk) for pk in self._users.filter(id__in=[u.id for u in users]).values_list('id', flat=True)
+        }
+        new_users = []
+        updates = defaultdict(list)
+        for user in users:
+            django_user = self._to_django_user(user)
+            if str(user.id) in existing_ids:
+                updates[self._update_fields_for(user)].append(django_user)
+            else:
+                new_users.append(django_user)
+        
         with transaction.atomic():
-            try:
-                # Try to find existing user
-                django_user = UserModel.objects.get(id=user.id)
-                # Update existing user
-                django_user.email = user.email.address
-                django_user.first_name = user.first_name
-                django_user.last_name = user.last_name
-                django_user.user_type = user.user_type.value
-                django_user.status = user.status.value
-                django_user.company_name = user.business_profile.company_name
-                django_user.business_type = user.business_profile.business_type
-                django_user.phone = user.phone.number if user.phone else None
-                django_user.subscription_tier = user.subscription_tier.value
-                django_user.is_verified = user.is_verified
-                django_user.verified_at = user.verified_at
-                django_user.last_login = user.last_login
-                django_user.timezone = user.timezone
-                django_user.language = user.language
-                django_user.notification_preferences = user.notification_preferences.to_dict()
-                
-                # Update address if available
-                if user.business_profile.address:
-                    django_user.address_street = user.business_profile.address.street
-                    django_user.address_city = user.business_profile.address.city
-                    django_user.address_postal_code = user.business_profile.address.postal_code
-                    django_user.address_country = user.business_profile.address.country
-                
-                django_user.save()
-                
-            except UserModel.DoesNotExist:
-                # Create new user
-                django_user = UserModel.objects.create(
-                    id=user.id,
-                    email=user.email.address,
-                    password=user.password_hash,
-                    first_name=user.first_name,
-                    last_name=user.last_name,
-                    user_type=user.user_type.value,
-                    status=user.status.value,
-                    company_name=user.business_profile.company_name,
-                    business_type=user.business_profile.business_type,
-                    phone=user.phone.number if user.phone else None,
-                    subscription_tier=user.subscription_tier.value,
-                    is_verified=user.is_verified,
-                    verified_at=user.verified_at,
-                    last_login=user.last_login,
-                    timezone=user.timezone,
-                    language=user.language,
-                    notification_preferences=user.notification_preferences.to_dict(),
-                    address_street=user.business_profile.address.street if user.business_profile.address else None,
-                    address_city=user.business_profile.address.city if user.business_profile.address else None,
-                    address_postal_code=user.business_profile.address.postal_code if user.business_profile.address else None,
-                    address_country=user.business_profile.address.country if user.business_profile.address else 'UK'
+            if new_users:
+                self._users.bulk_create(
+                    new_users,
+                    batch_size=batch_size,
+                    update_conflicts=True,
+                    unique_fields=['id'],
+                    update_fields=list(self.UPDATE_FIELDS + self.ADDRESS_FIELDS),
                 )
-            
-            # Return domain user
-            return self._to_domain_user(django_user)
+            for fields, django_users in updates.items():
+                self._users.bulk_update(django_users, fields=list(fields), batch_size=batch_size)
+        self._invalidate_cache()
+        return list(users)
     
     def find_by_id(self, user_id: str) -> Optional[DomainUser]:
         """Find a user by ID."""
-        try:
-            django_user = UserModel.objects.get(id=user_id)
-            return self._to_domain_user(django_user)
-        except UserModel.DoesNotExist:
-            return None
+        return self._cached(f'id:{user_id}', lambda: self._get_one(id=user_id))
     
     def find_by_email(self, email: str) -> Optional[DomainUser]:
         """Find a user by email."""
+        return self._cached(f'email:{email}', lambda: self._get_one(email=email))
+    
+    def _get_one(self, **lookup) -> Optional[DomainUser]:
+        """Load a single domain user from the database, or None."""
         try:
-            django_user = UserModel.objects.get(email=email)
+            django_user = self._read_queryset().get(**lookup)
             return self._to_domain_user(django_user)
         except UserModel.DoesNotExist:
             return None
     
     def find_all(self, limit: int = 100, offset: int = 0) -> List[DomainUser]:
         """Find all users with pagination."""
-        django_users = UserModel.objects.all()[offset:offset + limit]
-        return [self._to_domain_user(user) for user in django_users]
+        rows = self._users.values_list(*self.BASE_FIELDS, named=True)[offset:offset + limit]
+        return [self._to_domain_user(row) for row in rows]
     
     def delete(self, user_id: str) -> bool:
         """Delete a user by ID."""
         try:
-            django_user = UserModel.objects.get(id=user_id)
+            django_user = self._users.get(id=user_id)
             django_user.delete()
+            self._invalidate_cache()
             return True
         except UserModel.DoesNotExist:
             return False
     
+    def _cached(self, key: str, loader):
+        """Read through the cache under the current repository version."""
+        version = cache.get_or_set(self.CACHE_VERSION_KEY, _fresh_cache_version, timeout=None)
+        ttl = getattr(settings, 'USER_REPOSITORY_CACHE_TTL', 60)
+        return cache.get_or_set(f'user_repo:v{version}:{key}', loader, timeout=ttl)
+    
+    def _invalidate_cache(self) -> None:
+        """Retire every cached read by moving to a new version namespace."""
+        invalidate_user_cache()
+    
     def _to_domain_user(self, django_user: UserModel) -> DomainUser:
-        """Convert Django user to domain user."""
-        # Create address
-        address = Address(
-            street=django_user.address_street or '',
-            city=django_user.address_city or '',
-            postal_code=django_user.address_postal_code or '',
-            country=django_user.address_country or 'UK'
-        ) if django_user.address_street else None
+        """Convert Django user (or a named BASE_FIELDS row) to domain user."""
+        # Create address; rows without a street carry no address at all
+        address = None
+        street = django_user.address_street
+        if street:
+            address = Address(
+                street=street,
+                city=django_user.address_city or '',
+                postal_code=django_user.address_postal_code or '',
+                country=django_user.address_country or 'UK'
+            )
         
         # Create business profile
         business_profile = BusinessProfile(
@@ -151,10 +349,10 @@ class DjangoUserRepository(UserRepository):
             password_hash=django_user.password,
             first_name=django_user.first_name,
             last_name=django_user.last_name,
-            user_type=UserType(django_user.user_type),
+            user_type=_USER_TYPES[django_user.user_type],
             business_profile=business_profile,
             phone=phone,
-            subscription_tier=SubscriptionTier(django_user.subscription_tier),
+            subscription_tier=_SUBSCRIPTION_TIERS[django_user.subscription_tier],
             is_verified=django_user.is_verified,
             verified_at=django_user.verified_at,
             last_login=django_user.last_login,
@@ -165,6 +363,52 @@ class DjangoUserRepository(UserRepository):
             )
         )
     
+    def _read_queryset(self):
+        """User queryset projected to the columns needed to build domain users."""
+        return self._users.only(*self.BASE_FIELDS)
+    
+    def _to_django_user(self, user: DomainUser) -> UserModel:
+        """Build an unsaved Django user row from a domain user."""
+        address = user.business_profile.address
+        return UserModel(
+            id=user.id,
+            email=user.email.address,
+            password=user.password_hash,
+            first_name=user.first_name,
+            last_name=user.last_name,
+            user_type=user.user_type.value,
+            status=user.status.value,
+            company_name=user.business_profile.company_name,
+            business_type=user.business_profile.business_type,
+            phone=user.phone.number if user.phone else None,
+            subscription_tier=user.subscription_tier.value,
+            is_verified=user.is_verified,
+            verified_at=user.verified_at,
+            last_login=user.last_login,
+            timezone=user.timezone,
+            language=user.language,
+            notification_preferences=user.notification_preferences.to_dict(),
+            address_street=address.street if address else None,
+            address_city=address.city if address else None,
+            address_postal_code=address.postal_code if address else None,
+            address_country=address.country if address else 'UK',
+            updated_at=timezone.now(),
+        )
+    
+    def _update_fields_for(self, user: DomainUser) -> tuple:
+        """Columns to update for an existing user; the stored address is kept when the domain user has none."""
+        if user.business_profile.address:
+            return self.UPDATE_FIELDS + self.ADDRESS_FIELDS
+        return self.UPDATE_FIELDS
+    
+    def _to_domain_users(self, django_users) -> List[DomainUser]:
+        """Convert a user queryset, streaming named rows instead of model instances."""
+        rows = django_users.values_list(*self.BASE_FIELDS, named=True)
+        return [
+            self._to_domain_user(row)
+            for row in rows.iterator(chunk_size=self.ITERATOR_CHUNK_SIZE)
+        ]
+    
     # Additional abstract method implementations
     def get_by_email(self, email: str) -> Optional[DomainUser]:
         """Get user by email address."""
@@ -172,77 +416,130 @@ class DjangoUserRepository(UserRepository):
     
     def get_by_company_name(self, company_name: str) -> List[DomainUser]:
         """Get users by company name."""
-        django_users = UserModel.objects.filter(company_name__icontains=company_name)
-        return [self._to_domain_user(user) for user in django_users]
+        django_users = self._read_queryset().filter(company_name__icontains=company_name)
+        return self._to_domain_users(django_users)
     
     def get_by_user_type(self, user_type: UserType) -> List[DomainUser]:
         """Get users by user type."""
-        django_users = UserModel.objects.filter(user_type=user_type.value)
-        return [self._to_domain_user(user) for user in django_users]
+        django_users = self._read_queryset().filter(user_type=user_type.value)
+        return self._to_domain_users(django_users)
     
     def get_by_status(self, status: UserStatus) -> List[DomainUser]:
         """Get users by status."""
-        django_users = UserModel.objects.filter(status=status.value)
-        return [self._to_domain_user(user) for user in django_users]
+        return self._cached(
+            f'status:{status.value}',
+            lambda: self._to_domain_users(self._read_queryset().filter(status=status.value))
+        )
     
     def get_by_subscription_tier(self, tier: SubscriptionTier) -> List[DomainUser]:
         """Get users by subscription tier."""
-        django_users = UserModel.objects.filter(subscription_tier=tier.value)
-        return [self._to_domain_user(user) for user in django_users]
+        django_users = self._read_queryset().filter(subscription_tier=tier.value)
+        return self._to_domain_users(django_users)
     
     def get_verified_users(self) -> List[DomainUser]:
         """Get all verified users."""
-        django_users = UserModel.objects.filter(is_verified=True)
-        return [self._to_domain_user(user) for user in django_users]
+        django_users = self._read_queryset().filter(is_verified=True)
+        return self._to_domain_users(django_users)
     
     def get_unverified_users(self) -> List[DomainUser]:
         """Get all unverified users."""
-        django_users = UserModel.objects.filter(is_verified=False)
-        return [self._to_domain_user(user) for user in django_users]
+        django_users = self._read_queryset().filter(is_verified=False)
+        return self._to_domain_users(django_users)
     
     def get_active_users(self) -> List[DomainUser]:
         """Get all active users."""
-        django_users = UserModel.objects.filter(status='active')
-        return [self._to_domain_user(user) for user in django_users]
+        django_users = self._read_queryset().filter(status='active')
+        return self._to_domain_users(django_users)
     
     def get_users_created_between(self, start_date: datetime, end_date: datetime) -> List[DomainUser]:
         """Get users created between two dates."""
-        django_users = UserModel.objects.filter(created_at__range=(start_date, end_date))
-        return [self._to_domain_user(user) for user in django_users]
+        django_users = self._read_queryset().filter(created_at__range=(start_date, end_date))
+        return self._to_domain_users(django_users)
     
     def get_users_with_last_login_before(self, date: datetime) -> List[DomainUser]:
         """Get users who haven't logged in since a specific date."""
-        django_users = UserModel.objects.filter(last_login__lt=date)
-        return [self._to_domain_user(user) for user in django_users]
+        django_users = self._read_queryset().filter(last_login__lt=date)
+        return self._to_domain_users(django_users)
     
     def count_by_user_type(self, user_type: UserType) -> int:
         """Count users by user type."""
-        return UserModel.objects.filter(user_type=user_type.value).count()
+        return self._cached(
+            f'count:user_type:{user_type.value}',
+            lambda: self._users.filter(user_type=user_type.value).count()
+        )
     
     def count_by_status(self, status: UserStatus) -> int:
         """Count users by status."""
-        return UserModel.objects.filter(status=status.value).count()
+        return self._cached(
+            f'count:status:{status.value}',
+            lambda: self._users.filter(status=status.value).count()
+        )
     
     def count_by_subscription_tier(self, tier: SubscriptionTier) -> int:
         """Count users by subscription tier."""
-        return UserModel.objects.filter(subscription_tier=tier.value).count()
+        return self._cached(
+            f'count:subscription_tier:{tier.value}',
+            lambda: self._users.filter(subscription_tier=tier.value).count()
+        )
+    
+    def user_counts_by_dimension(self) -> dict:
+        """Count users by type, status and subscription tier in a single grouped query."""
+        counts = {'user_type': Counter(), 'status': Counter(), 'subscription_tier': Counter()}
+        rows = self._users.values('user_type', 'status', 'subscription_tier').annotate(n=Count('id'))
+        for row in rows:
+            counts['user_type'][_USER_TYPES[row['user_type']]] += row['n']
+            counts['status'][_USER_STATUSES[row['status']]] += row['n']
+            counts['subscription_tier'][_SUBSCRIPTION_TIERS[row['subscription_tier']]] += row['n']
+        return counts
     
     def email_exists(self, email: str) -> bool:
         """Check if email address already exists."""
-        return UserModel.objects.filter(email=email).exists()
+        return self._users.filter(email=email).exists()
     
     def company_name_exists(self, company_name: str) -> bool:
         """Check if company name already exists."""
-        return UserModel.objects.filter(company_name=company_name).exists()
+        return self._users.filter(company_name=company_name).exists()
     
     def exists(self, user_id: str) -> bool:
         """Check if user exists."""
-        return UserModel.objects.filter(id=user_id).exists()
+        return self._users.filter(id=user_id).exists()
+    
+    def check_conflicts(
+        self,
+        email: Optional[str] = None,
+        company_name: Optional[str] = None,
+        user_id: Optional[str] = None
+    ) -> dict:
+        """Check email, company name and id for existing users in one query.
+
+        Returns a flag per key ('email', 'company_name', 'id'); arguments
+        left as None are reported as False without being queried.
+        """
+        probes = {
+            key: Q(**{field: value})
+            for key, field, value in (
+                ('email', 'email', email),
+                ('company_name', 'company_name', company_name),
+                ('id', 'id', user_id),
+            )
+            if value is not None
+        }
+        result = {'email': False, 'company_name': False, 'id': False}
+        if not probes:
+            return result
+        any_match = Q()
+        for probe in probes.values():
+            any_match |= probe
+        counts = self._users.filter(any_match).aggregate(
+            **{f'{key}_matches': Count('id', filter=probe) for key, probe in probes.items()}
+        )
+        result.update({key: bool(counts[f'{key}_matches']) for key in probes})
+        return result
     
     def get_all(self) -> List[DomainUser]:
         """Get all users."""
-        django_users = UserModel.objects.all()
-        return [self._to_domain_user(user) for user in django_users]
+        django_users = self._read_queryset()
+        return self._to_domain_users(django_users)
     
     def get_by_id(self, user_id: str) -> Optional[DomainUser]:
         """Get user by ID."""
@@ -253,106 +550,83 @@ class DjangoUserRepository(UserRepository):
         return self.save(user)
     
     def update(self, user: DomainUser) -> DomainUser:
-        """Update an existing user."""
-        return self.save(user)
+        """Update an existing user with a single UPDATE; falls back to save() if the row is missing."""
+        django_user = self._to_django_user(user)
+        values = {field: getattr(django_user, field) for field in self._update_fields_for(user)}
+        if not self._users.filter(id=user.id).update(**values):
+            return self.save(user)
+        self._invalidate_cache()
+        return self._to_domain_user(django_user)
 
 
 class DjangoReceiptRepository(ReceiptRepository):
     """Django ORM implementation of ReceiptRepository."""
     
+    # Rows fetched per round trip when streaming receipt lists
+    ITERATOR_CHUNK_SIZE = 500
+    
+    # Columns written when updating an existing receipt row
+    UPDATE_FIELDS = (
+        'user', 'filename', 'file_size', 'mime_type', 'file_url', 'status',
+        'receipt_type', 'processed_at', 'updated_at',
+    )
+    
+    def __init__(self):
+        # Bound once; saves the manager descriptor lookup on every query
+        self._receipts = Receipt.objects
+        self._users = UserModel.objects
+    
     def save(self, receipt: DomainReceipt) -> DomainReceipt:
-        """Save or update a receipt."""
+        """Save or update a receipt with a single upsert statement."""
+        django_receipt = self._to_django_receipt(receipt)
+        self._receipts.bulk_create(
+            [django_receipt],
+            update_conflicts=True,
+            unique_fields=['id'],
+            update_fields=list(self._update_fields_for(receipt)),
+        )
+        
+        # Return domain receipt
+        return self._to_domain_receipt(django_receipt)
+    
+    def save_many(self, receipts: List[DomainReceipt], batch_size: int = 500) -> List[DomainReceipt]:
+        """Save or update many receipts using batched inserts and updates."""
+        if not receipts:
+            return []
+        existing_ids = {
+            str(pk) for pk in self._receipts.filter(id__in=[r.id for r in receipts]).values_list('id', flat=True)
+        }
+        new_receipts = []
+        updates = defaultdict(list)
+        for receipt in receipts:
+            django_receipt = self._to_django_receipt(receipt)
+            if str(receipt.id) in existing_ids:
+                updates[self._update_fields_for(receipt)].append(django_receipt)
+            else:
+                new_receipts.append(django_receipt)
+        
         with transaction.atomic():
-            try:
-                # Try to find existing receipt
-                django_receipt = Receipt.objects.get(id=receipt.id)
-                # Update existing receipt
-                django_receipt.user_id = receipt.user.id
-                django_receipt.filename = receipt.file_info.filename
-                django_receipt.file_size = receipt.file_info.file_size
-                django_receipt.mime_type = receipt.file_info.mime_type
-                django_receipt.file_url = receipt.file_info.file_url
-                django_receipt.status = receipt.status.value
-                django_receipt.receipt_type = receipt.receipt_type.value
-                django_receipt.processed_at = receipt.processed_at
-                django_receipt.updated_at = receipt.updated_at
-                
-                # Update OCR data
-                if receipt.ocr_data:
-                    django_receipt.ocr_data = {
-                        'merchant_name': receipt.ocr_data.merchant_name,
-                        'total_amount': str(receipt.ocr_data.total_amount) if receipt.ocr_data.total_amount else None,
-                        'currency': receipt.ocr_data.currency,
-                        'date': receipt.ocr_data.date.isoformat() if receipt.ocr_data.date else None,
-                        'vat_amount': str(receipt.ocr_data.vat_amount) if receipt.ocr_data.vat_amount else None,
-                        'vat_number': receipt.ocr_data.vat_number,
-                        'receipt_number': receipt.ocr_data.receipt_number,
-                        'items': receipt.ocr_data.items,
-                        'confidence_score': receipt.ocr_data.confidence_score,
-                        'raw_text': receipt.ocr_data.raw_text
-                    }
-                
-                # Update metadata
-                if receipt.metadata:
-                    django_receipt.metadata = {
-                        'category': receipt.metadata.category,
-                        'tags': list(receipt.metadata.tags) if hasattr(receipt.metadata, 'tags') and receipt.metadata.tags is not None else [],
-                        'notes': receipt.metadata.notes,
-                        'is_business_expense': receipt.metadata.is_business_expense,
-                        'tax_deductible': receipt.metadata.tax_deductible,
-                        'custom_fields': receipt.metadata.custom_fields
-                    }
-                
-                django_receipt.save()
-                
-            except Receipt.DoesNotExist:
-                # Create new receipt
-                django_receipt = Receipt.objects.create(
-                    id=receipt.id,
-                    user_id=receipt.user.id,
-                    filename=receipt.file_info.filename,
-                    file_size=receipt.file_info.file_size,
-                    mime_type=receipt.file_info.mime_type,
-                    file_url=receipt.file_info.file_url,
-                    status=receipt.status.value,
-                    receipt_type=receipt.receipt_type.value,
-                    processed_at=receipt.processed_at,
-                    created_at=receipt.created_at,
-                    updated_at=receipt.updated_at,
-                    ocr_data={
-                        'merchant_name': receipt.ocr_data.merchant_name,
-                        'total_amount': str(receipt.ocr_data.total_amount) if receipt.ocr_data.total_amount else None,
-                        'currency': receipt.ocr_data.currency,
-                        'date': receipt.ocr_data.date.isoformat() if receipt.ocr_data.date else None,
-                        'vat_amount': str(receipt.ocr_data.vat_amount) if receipt.ocr_data.vat_amount else None,
-                        'vat_number': receipt.ocr_data.vat_number,
-                        'receipt_number': receipt.ocr_data.receipt_number,
-                        'items': receipt.ocr_data.items,
-                        'confidence_score': receipt.ocr_data.confidence_score,
-                        'raw_text': receipt.ocr_data.raw_text
-                    } if receipt.ocr_data else {},
-                    metadata={
-                        'category': receipt.metadata.category,
-                        'tags': list(receipt.metadata.tags) if hasattr(receipt.metadata, 'tags') and receipt.metadata.tags is not None else [],
-                        'notes': receipt.metadata.notes,
-                        'is_business_expense': receipt.metadata.is_business_expense,
-                        'tax_deductible': receipt.metadata.tax_deductible,
-                        'custom_fields': receipt.metadata.custom_fields
-                    } if receipt.metadata else {}
+            if new_receipts:
+                self._receipts.bulk_create(
+                    new_receipts,
+                    batch_size=batch_size,
+                    update_conflicts=True,
+                    unique_fields=['id'],
+                    update_fields=list(self.UPDATE_FIELDS + ('ocr_data', 'metadata')),
                 )
-            
-            # Return domain receipt
-            return self._to_domain_receipt(django_receipt)
+            for fields, django_receipts in updates.items():
+                self._receipts.bulk_update(django_receipts, fields=list(fields), batch_size=batch_size)
+        return list(receipts)
     
     def find_by_id(self, receipt_id: str) -> Optional[DomainReceipt]:
         """Find a receipt by ID."""
         try:
-            django_receipt = Receipt.objects.get(id=receipt_id)
+            django_receipt = self._receipts.select_related('user').get(id=receipt_id)
             return self._to_domain_receipt(django_receipt)
         except Receipt.DoesNotExist:
             return None
     
-    def find_by_user(self, user: Any, limit: int = 100, offset: int = 0) -> List[DomainReceipt]:
+    def find_by_user(self, user: Any, limit: int = 100, offset: int = 0) -> Sequence[DomainReceipt]:
         """Find receipts by user with pagination.
         Accepts either a DomainUser or a raw user_id string/UUID for convenience.
         """
@@ -360,23 +634,350 @@ class DjangoReceiptRepository(ReceiptRepository):
             user_id = user.id  # DomainUser
         except AttributeError:
             user_id = str(user)  # assume id
-        django_receipts = Receipt.objects.filter(user_id=user_id)[offset:offset + limit]
-        return [self._to_domain_receipt(receipt) for receipt in django_receipts]
+        django_receipts = self._receipts.select_related('user').filter(user_id=user_id)[offset:offset + limit]
+        return LazyDomainList(django_receipts, self._to_domain_receipts, self.ITERATOR_CHUNK_SIZE)
     
-    def find_by_status(self, user: DomainUser, status: ReceiptStatus, limit: int = 100, offset: int = 0) -> List[DomainReceipt]:
+    def find_by_status(self, user: DomainUser, status: ReceiptStatus, limit: int = 100, offset: int = 0) -> Sequence[DomainReceipt]:
         """Find receipts by status for a specific user."""
-        django_receipts = Receipt.objects.filter(
+        django_receipts = self._receipts.select_related('user').filter(
             user_id=user.id, 
             status=status.value
         )[offset:offset + limit]
-        return [self._to_domain_receipt(receipt) for receipt in django_receipts]
+        return LazyDomainList(django_receipts, self._to_domain_receipts, self.ITERATOR_CHUNK_SIZE)
+    
+    def find_by_type(self, user: DomainUser, receipt_type: ReceiptType, limit: int = 100, offset: int = 0) -> Sequence[DomainReceipt]:
+        """Find receipts by type for a specific user."""
+        django_receipts = self._receipts.select_related('user').filter(
+            user_id=user.id, 
+            receipt_type=receipt_type.value
+        )[offset:offset + limit]
+        return LazyDomainList(django_receipts, self._to_domain_receipts, self.ITERATOR_CHUNK_SIZE)
+    
+    def find_by_date_range(self, user: DomainUser, start_date, end_date, limit: int = 100, offset: int = 0) -> Sequence[DomainReceipt]:
+        """Find receipts within a date range for a specific user."""
+        django_receipts = self._receipts.select_related('user').filter(
+            user_id=user.id,
+            created_at__range=[start_date, end_date]
+        )[offset:offset + limit]
+        return LazyDomainList(django_receipts, self._to_domain_receipts, self.ITERATOR_CHUNK_SIZE)
+    
+    def find_by_merchant(self, user: DomainUser, merchant_name: str, limit: int = 100, offset: int = 0) -> Sequence[DomainReceipt]:
+        """Find receipts by merchant name for a specific user."""
+        django_receipts = self._receipts.select_related('user').filter(user_id=user.id)
+        if connection.vendor == 'postgresql':
+            # ->> text extraction so the trigram GIN index applies
+            django_receipts = django_receipts.filter(
+                RawSQL(_MERCHANT_MATCH_SQL, (f'%{_escape_like(merchant_name)}%',), output_field=BooleanField())
+            )
+        else:
+            django_receipts = django_receipts.filter(ocr_data__merchant_name__icontains=merchant_name)
+        django_receipts = django_receipts[offset:offset + limit]
+        return LazyDomainList(django_receipts, self._to_domain_receipts, self.ITERATOR_CHUNK_SIZE)
+    
+    def find_by_amount_range(self, user: DomainUser, min_amount: float, max_amount: float, limit: int = 100, offset: int = 0) -> Sequence[DomainReceipt]:
+        """Find receipts within an amount range for a specific user."""
+        django_receipts = self._receipts.select_related('user').filter(user_id=user.id)
+        if connection.vendor == 'postgresql':
+            # Numeric comparison on the indexed cast; totals are stored as decimal strings
+            django_receipts = django_receipts.filter(
+                RawSQL(_AMOUNT_RANGE_SQL, (min_amount, max_amount), output_field=BooleanField())
+            )
+        else:
+            django_receipts = django_receipts.filter(ocr_data__total_amount__range=[min_amount, max_amount])
+        django_receipts = django_receipts[offset:offset + limit]
+        return LazyDomainList(django_receipts, self._to_domain_receipts, self.ITERATOR_CHUNK_SIZE)
+    
+    def search_receipts(self, user: DomainUser, query: str, limit: int = 100, offset: int = 0) -> Sequence[DomainReceipt]:
+        """Search receipts by text query for a specific user."""
+        django_receipts = self._receipts.select_related('user').filter(user_id=user.id)
+        if connection.vendor == 'postgresql':
+            # GIN-indexed full-text match instead of four unanchored LIKE scans.
+            # Every word is a prefix match so partial input ("tes") still finds "Tesco".
+            words = _SEARCH_WORD_RX.findall(query)
+            if not words:
+                return LazyDomainList(django_receipts.none(), self._to_domain_receipts, self.ITERATOR_CHUNK_SIZE)
+            ts_query = ' & '.join(f'{word}:*' for word in words)
+            django_receipts = django_receipts.filter(
+                RawSQL(_RECEIPT_SEARCH_MATCH_SQL, (ts_query,), output_field=BooleanField())
+            ).annotate(
+                rank=RawSQL(_RECEIPT_SEARCH_RANK_SQL, (ts_query,), output_field=FloatField())
+            ).order_by('-rank', '-id')
+        else:
+            # Fallback for SQLite or other backends without full-text search
+            django_receipts = django_receipts.filter(
+                Q(filename__icontains=query) |
+                Q(ocr_data__merchant_name__icontains=query) |
+                Q(ocr_data__raw_text__icontains=query) |
+                Q(metadata__notes__icontains=query)
+            ).order_by('-created_at', '-id')
+        django_receipts = django_receipts[offset:offset + limit]
+        return LazyDomainList(django_receipts, self._to_domain_receipts, self.ITERATOR_CHUNK_SIZE)
+    
+    def find_processed_by_checksum(self, user: DomainUser, sha256: str) -> Optional[DomainReceipt]:
+        """Find a user's processed receipt whose file has the given SHA-256 checksum."""
+        django_receipt = (
+            self._receipts.select_related('user')
+            .filter(user_id=user.id, status='processed', metadata__custom_fields__sha256=sha256)
+            .order_by('-processed_at')
+            .first()
+        )
+        return self._to_domain_receipt(django_receipt) if django_receipt else None
+    
+    def delete(self, receipt_id: str) -> bool:
+        """Delete a receipt by ID."""
+        try:
+            django_receipt = self._receipts.get(id=receipt_id)
+            django_receipt.delete()
+            return True
+        except Receipt.DoesNotExist:
+            return False
+    
+    def count_by_user(self, user: DomainUser) -> int:
+        """Count total receipts for a user."""
+        return self._receipts.filter(user_id=user.id).count()
+    
+    def count_by_status(self, user: DomainUser, status: ReceiptStatus) -> int:
+        """Count receipts by status for a user."""
+        return self._receipts.filter(user_id=user.id, status=status.value).count()
+    
+    def get_processing_receipts(self) -> Sequence[DomainReceipt]:
+        """Get all receipts that are currently being processed."""
+        django_receipts = self._receipts.select_related('user').filter(status='processing')
+        return LazyDomainList(django_receipts, self._to_domain_receipts, self.ITERATOR_CHUNK_SIZE)
+    
+    def get_failed_receipts(self) -> Sequence[DomainReceipt]:
+        """Get all receipts that failed processing."""
+        django_receipts = self._receipts.select_related('user').filter(status='failed')
+        return LazyDomainList(django_receipts, self._to_domain_receipts, self.ITERATOR_CHUNK_SIZE)
+    
+    def _serialize_ocr_data(self, ocr_data: Optional[OCRData]) -> dict:
+        """Convert domain OCR data to its JSON column representation."""
+        if not ocr_data:
+            return {}
+        return {
+            'merchant_name': ocr_data.merchant_name,
+            'total_amount': str(ocr_data.total_amount) if ocr_data.total_amount else None,
+            'currency': ocr_data.currency,
+            'date': ocr_data.date.isoformat() if ocr_data.date else None,
+            'vat_amount': str(ocr_data.vat_amount) if ocr_data.vat_amount else None,
+            'vat_number': ocr_data.vat_number,
+            'receipt_number': ocr_data.receipt_number,
+            'items': ocr_data.items,
+            'confidence_score': ocr_data.confidence_score,
+            'raw_text': ocr_data.raw_text
+        }
+    
+    def _serialize_metadata(self, metadata: Optional[ReceiptMetadata]) -> dict:
+        """Convert domain receipt metadata to its JSON column representation."""
+        if not metadata:
+            return {}
+        return {
+            'category': metadata.category,
+            'tags': list(metadata.tags) if hasattr(metadata, 'tags') and metadata.tags is not None else [],
+            'notes': metadata.notes,
+            'is_business_expense': metadata.is_business_expense,
+            'tax_deductible': metadata.tax_deductible,
+            'custom_fields': metadata.custom_fields
+        }
+    
+    def _to_django_receipt(self, receipt: DomainReceipt) -> Receipt:
+        """Build an unsaved Django receipt row from a domain receipt."""
+        return Receipt(
+            id=receipt.id,
+            user_id=receipt.user.id,
+            filename=receipt.file_info.filename,
+            file_size=receipt.file_info.file_size,
+            mime_type=receipt.file_info.mime_type,
+            file_url=receipt.file_info.file_url,
+            status=receipt.status.value,
+            receipt_type=receipt.receipt_type.value,
+            processed_at=receipt.processed_at,
+            created_at=receipt.created_at,
+            updated_at=receipt.updated_at,
+            ocr_data=self._serialize_ocr_data(receipt.ocr_data),
+            metadata=self._serialize_metadata(receipt.metadata)
+        )
+    
+    def _update_fields_for(self, receipt: DomainReceipt) -> tuple:
+        """Columns to update for an existing receipt; empty OCR data or metadata leaves the stored JSON untouched."""
+        fields = self.UPDATE_FIELDS
+        if receipt.ocr_data:
+            fields += ('ocr_data',)
+        if receipt.metadata:
+            fields += ('metadata',)
+        return fields
+    
+    def _to_domain_receipts(self, django_receipts) -> List[DomainReceipt]:
+        """Convert a batch of receipts, building each distinct owner only once."""
+        django_receipts = list(django_receipts)
+        # Hydrate owners not already joined via select_related with one in_bulk query
+        user_field = Receipt._meta.get_field('user')
+        unjoined = [receipt for receipt in django_receipts if not user_field.is_cached(receipt)]
+        if unjoined:
+            django_users = self._users.in_bulk({receipt.user_id for receipt in unjoined})
+            for receipt in unjoined:
+                django_user = django_users.get(receipt.user_id)
+                if django_user is not None:
+                    user_field.set_cached_value(receipt, django_user)
+        owners: dict = {}
+        return [self._to_domain_receipt(receipt, owners) for receipt in django_receipts]
+    
+    def _to_receipt_owner(self, django_user: UserModel) -> DomainUser:
+        """Create the minimal domain user attached to receipts."""
+        return DomainUser(
+            id=str(django_user.id),
+            email=Email(django_user.email),
+            password_hash=django_user.password,
+            first_name=django_user.first_name,
+            last_name=django_user.last_name,
+            user_type=_USER_TYPES[django_user.user_type],
+            business_profile=BusinessProfile(
+                company_name=django_user.company_name,
+                business_type=django_user.business_type
+            )
+        )
+    
+    def _to_domain_receipt(self, django_receipt: Receipt, owners: Optional[dict] = None) -> DomainReceipt:
+        """Convert Django receipt to domain receipt.
+
+        ``owners`` memoizes domain users for the current batch, keyed by
+        (user id, updated_at) so a row changed mid-batch is rebuilt.
+        """
+        # Get user from the joined row (read paths use select_related('user'))
+        user = None
+        try:
+            django_user = django_receipt.user
+            owner_key = (django_user.pk, django_user.updated_at)
+            user = owners.get(owner_key) if owners is not None else None
+            if user is None:
+                # Minimal domain user for receipt, built only if more than the id is read
+                user = DeferredDomainUser(
+                    id=str(django_user.id),
+                    factory=partial(self._to_receipt_owner, django_user)
+                )
+                if owners is not None:
+                    owners[owner_key] = user
+        except UserModel.DoesNotExist:
+            # Handle case where user doesn't exist - use a lazy placeholder
+            user = LazyDomainUser(id=str(django_receipt.user_id))
+        
+        # Create file info with defensive programming
+        try:
+            file_info = FileInfo(
+                filename=django_receipt.filename or 'unknown',
+                file_size=django_receipt.file_size or 0,
+                mime_type=django_receipt.mime_type or 'application/octet-stream',
+                file_url=django_receipt.file_url or ''
+            )
+        except (TypeError, ValueError, KeyError, AttributeError) as e:
+            logger.warning("Could not create file info for receipt %s: %s", django_receipt.id, e)
+            # Create minimal file info
+            file_info = FileInfo(
+                filename='unknown',
+                file_size=0,
+                mime_type='application/octet-stream',
+                file_url=''
+            )
+        
+        # Create OCR data (robust parsing)
+        ocr_data = None
+        if django_receipt.ocr_data:
+            try:
+                raw = django_receipt.ocr_data or {}
+                # Legacy rows may carry OCR data as serialized JSON text
+                if isinstance(raw, (bytes, bytearray, memoryview, str)):
+                    raw = orjson.loads(raw)
+                # Safe decimal parse
+                def _to_decimal(val):
+                    if val is None or val == '':
+                        return None
+                    try:
+                        return Decimal(str(val).replace(',', ''))
+                    except (TypeError, ValueError, InvalidOperation):
+                        return None
+                # Safe date parse: dispatch on shape (YYYY-MM-DD, DD/MM/YYYY, ISO)
+                def _to_datetime(val):
+                    if not val:
+                        return None
+                    # Already datetime
+                    if isinstance(val, datetime):
+                        return val
+                    s = str(val)
+                    if len(s) == 10:
+                        try:
+                            if s[4] == '-' and s[7] == '-':
+                                return datetime(int(s[0:4]), int(s[5:7]), int(s[8:10]))
+                            if s[2] == '/' and s[5] == '/':
+                                return datetime(int(s[6:10]), int(s[3:5]), int(s[0:2]))
+                        except ValueError:
+                            return None
+                    # Handle trailing 'Z' as UTC
+                    if s.endswith('Z'):
+                        s = s[:-1] + '+00:00'
+                    try:
+                        return datetime.fromisoformat(s)
+                    except ValueError:
+                        return None
+                ocr_data = OCRData(
+                    merchant_name=raw.get('merchant_name'),
+                    total_amount=_to_decimal(raw.get('total_amount')),
+                    currency=raw.get('currency', 'GBP'),
+                    date=_to_datetime(raw.get('date')),
+                    vat_amount=_to_decimal(raw.get('vat_amount')),
+                    vat_number=raw.get('vat_number'),
+                    receipt_number=raw.get('receipt_number'),
+                    items=raw.get('items', []),
+                    confidence_score=raw.get('confidence_score'),
+                    raw_text=raw.get('raw_text')
+                )
+            except (TypeError, ValueError, KeyError, AttributeError, InvalidOperation) as e:
+                logger.warning("Could not create OCR data for receipt %s: %s", django_receipt.id, e)
+                ocr_data = None
+        
+        # Create metadata with defensive programming
+        metadata = None
+        if django_receipt.metadata:
+            try:
+                metadata = ReceiptMetadata(
+                    category=django_receipt.metadata.get('category'),
+                    tags=django_receipt.metadata.get('tags', []),
+                    notes=django_receipt.metadata.get('notes'),
+                    is_business_expense=django_receipt.metadata.get('is_business_expense', False),
+                    tax_deductible=django_receipt.metadata.get('tax_deductible', False),
+                    custom_fields=django_receipt.metadata.get('custom_fields', {})
+                )
+            except (TypeError, ValueError, KeyError, AttributeError) as e:
+                logger.warning("Could not create metadata for receipt %s: %s", django_receipt.id, e)
+                metadata = None
+        
+        # Create domain receipt with defensive programming
+        try:
+            domain_receipt = DomainReceipt(
+                id=str(django_receipt.id),
+                user=user,
+                file_info=file_info,
+                status=_RECEIPT_STATUSES[django_receipt.status],
+                receipt_type=_RECEIPT_TYPES[django_receipt.receipt_type],
+                ocr_data=ocr_data,
+                metadata=metadata,
+                processed_at=django_receipt.processed_at
+            )
+            return domain_receipt
+        except (TypeError, ValueError, KeyError, AttributeError) as e:
+            logger.error("Could not create domain receipt for %s: %s", django_receipt.id, e)
+            # Return None to indicate failure - the calling code should handle this
+            return None
 
 
 class DjangoTransactionRepository(TransactionRepository):
+    def __init__(self):
+        # Bound once; saves the manager descriptor lookup on every query
+        self._transactions = TxModel.objects
+
     def save(self, tx: DomainTx) -> DomainTx:
         with transaction.atomic():
             if not tx.id:
-                obj = TxModel.objects.create(
+                obj = self._transactions.create(
                     user_id=tx.user.id,
                     receipt_id=tx.receipt_id,
                     description=tx.description,
@@ -387,7 +988,7 @@ class DjangoTransactionRepository(TransactionRepository):
                     category=tx.category.name if tx.category else None,
                 )
             else:
-                obj = TxModel.objects.get(id=tx.id)
+                obj = self._transactions.get(id=tx.id)
                 obj.description = tx.description
                 obj.amount = tx.amount.amount
                 obj.currency = tx.amount.currency
@@ -400,12 +1001,12 @@ class DjangoTransactionRepository(TransactionRepository):
 
     def find_by_id(self, tx_id: str) -> Optional[DomainTx]:
         try:
-            return self._to_domain_tx(TxModel.objects.get(id=tx_id))
+            return self._to_domain_tx(self._transactions.get(id=tx_id))
         except TxModel.DoesNotExist:
             return None
 
     def find_by_user(self, user: DomainUser, limit: int = 100, offset: int = 0) -> List[DomainTx]:
-        qs = TxModel.objects.filter(user_id=user.id).order_by('-transaction_date', '-created_at')[offset:offset+limit]
+        qs = self._transactions.filter(user_id=user.id).order_by('-transaction_date', '-created_at')[offset:offset+limit]
         return [self._to_domain_tx(o) for o in qs]
 
     def _to_domain_tx(self, obj: TxModel) -> DomainTx:
@@ -430,23 +1031,20 @@ class DjangoTransactionRepository(TransactionRepository):
             receipt_id=str(obj.receipt_id) if obj.receipt_id else None,
             category=Category(obj.category) if obj.category else None,
         )
-    
-    def find_by_type(self, user: DomainUser, receipt_type: ReceiptType, limit: int = 100, offset: int = 0) -> List[DomainReceipt]:
-        """Find receipts by type for a specific user."""
-        django_receipts = Receipt.objects.filter(
-            user_id=user.id, 
-            receipt_type=receipt_type.value
-        )[offset:offset + limit]
-        return [self._to_domain_receipt(receipt) for receipt in django_receipts]
 
 
 class DjangoFolderRepository(FolderRepository):
     """Django ORM implementation of FolderRepository."""
 
+    def __init__(self):
+        # Bound once; saves the manager descriptor lookup on every query
+        self._folders = FolderModel.objects
+        self._folder_receipts = FolderReceiptModel.objects
+
     def save(self, folder: DomainFolder) -> DomainFolder:
         with transaction.atomic():
             try:
-                obj = FolderModel.objects.get(id=folder.id)
+                obj = self._folders.get(id=folder.id)
             except FolderModel.DoesNotExist:
                 obj = FolderModel(id=folder.id)
 
@@ -466,13 +1064,13 @@ class DjangoFolderRepository(FolderRepository):
             # Sync membership for non-smart folders (best-effort)
             if folder.folder_type != DomainFolderType.SMART:
                 # Remove existing not in set
-                FolderReceiptModel.objects.filter(folder=obj).exclude(receipt_id__in=list(folder.receipt_ids)).delete()
+                self._folder_receipts.filter(folder=obj).exclude(receipt_id__in=list(folder.receipt_ids)).delete()
                 # Add missing
-                existing = set(FolderReceiptModel.objects.filter(folder=obj).values_list('receipt_id', flat=True))
+                existing = set(self._folder_receipts.filter(folder=obj).values_list('receipt_id', flat=True))
                 to_create = [rid for rid in folder.receipt_ids if rid not in existing]
                 for rid in to_create:
                     try:
-                        FolderReceiptModel.objects.create(folder=obj, receipt_id=rid)
+                        self._folder_receipts.create(folder=obj, receipt_id=rid)
                     except Exception:
                         pass
 
@@ -480,38 +1078,38 @@ class DjangoFolderRepository(FolderRepository):
 
     def find_by_id(self, folder_id: str) -> Optional[DomainFolder]:
         try:
-            return self._to_domain_folder(FolderModel.objects.get(id=folder_id))
+            return self._to_domain_folder(self._folders.get(id=folder_id))
         except FolderModel.DoesNotExist:
             return None
 
     def find_by_user(self, user_id: str) -> List[DomainFolder]:
-        qs = FolderModel.objects.filter(user_id=user_id).order_by('name', 'created_at')
+        qs = self._folders.filter(user_id=user_id).order_by('name', 'created_at')
         return [self._to_domain_folder(o) for o in qs]
 
     def find_by_user_and_type(self, user_id: str, folder_type: DomainFolderType) -> List[DomainFolder]:
-        qs = FolderModel.objects.filter(user_id=user_id, folder_type=folder_type.value).order_by('name')
+        qs = self._folders.filter(user_id=user_id, folder_type=folder_type.value).order_by('name')
         return [self._to_domain_folder(o) for o in qs]
 
     def find_by_parent(self, parent_id: str) -> List[DomainFolder]:
-        qs = FolderModel.objects.filter(parent_id=parent_id).order_by('name')
+        qs = self._folders.filter(parent_id=parent_id).order_by('name')
         return [self._to_domain_folder(o) for o in qs]
 
     def find_system_folder(self, user_id: str, folder_name: str) -> Optional[DomainFolder]:
         try:
-            o = FolderModel.objects.get(user_id=user_id, folder_type='system', name=folder_name)
+            o = self._folders.get(user_id=user_id, folder_type='system', name=folder_name)
             return self._to_domain_folder(o)
         except FolderModel.DoesNotExist:
             return None
 
     def delete(self, folder_id: str) -> bool:
         try:
-            FolderModel.objects.get(id=folder_id).delete()
+            self._folders.get(id=folder_id).delete()
             return True
         except FolderModel.DoesNotExist:
             return False
 
     def exists_by_name(self, user_id: str, name: str, parent_id: Optional[str] = None) -> bool:
-        qs = FolderModel.objects.filter(user_id=user_id, name=name)
+        qs = self._folders.filter(user_id=user_id, name=name)
         if parent_id is None:
             qs = qs.filter(parent__isnull=True)
         else:
@@ -535,259 +1133,52 @@ class DjangoFolderRepository(FolderRepository):
             ),
         )
         if obj.folder_type != 'smart':
-            folder.receipt_ids = set(str(rid) for rid in FolderReceiptModel.objects.filter(folder_id=obj.id).values_list('receipt_id', flat=True))
+            folder.receipt_ids = set(str(rid) for rid in self._folder_receipts.filter(folder_id=obj.id).values_list('receipt_id', flat=True))
         return folder
-    
-    def find_by_date_range(self, user: DomainUser, start_date, end_date, limit: int = 100, offset: int = 0) -> List[DomainReceipt]:
-        """Find receipts within a date range for a specific user."""
-        django_receipts = Receipt.objects.filter(
-            user_id=user.id,
-            created_at__range=[start_date, end_date]
-        )[offset:offset + limit]
-        return [self._to_domain_receipt(receipt) for receipt in django_receipts]
-    
-    def find_by_merchant(self, user: DomainUser, merchant_name: str, limit: int = 100, offset: int = 0) -> List[DomainReceipt]:
-        """Find receipts by merchant name for a specific user."""
-        django_receipts = Receipt.objects.filter(
-            user_id=user.id,
-            ocr_data__merchant_name__icontains=merchant_name
-        )[offset:offset + limit]
-        return [self._to_domain_receipt(receipt) for receipt in django_receipts]
-    
-    def find_by_amount_range(self, user: DomainUser, min_amount: float, max_amount: float, limit: int = 100, offset: int = 0) -> List[DomainReceipt]:
-        """Find receipts within an amount range for a specific user."""
-        django_receipts = Receipt.objects.filter(
-            user_id=user.id,
-            ocr_data__total_amount__range=[min_amount, max_amount]
-        )[offset:offset + limit]
-        return [self._to_domain_receipt(receipt) for receipt in django_receipts]
-    
-    def search_receipts(self, user: DomainUser, query: str, limit: int = 100, offset: int = 0) -> List[DomainReceipt]:
-        """Search receipts by text query for a specific user."""
-        django_receipts = Receipt.objects.filter(
-            user_id=user.id
-        ).filter(
-            Q(filename__icontains=query) |
-            Q(ocr_data__merchant_name__icontains=query) |
-            Q(ocr_data__raw_text__icontains=query) |
-            Q(metadata__notes__icontains=query)
-        )[offset:offset + limit]
-        return [self._to_domain_receipt(receipt) for receipt in django_receipts]
-    
-    def delete(self, receipt_id: str) -> bool:
-        """Delete a receipt by ID."""
-        try:
-            django_receipt = Receipt.objects.get(id=receipt_id)
-            django_receipt.delete()
-            return True
-        except Receipt.DoesNotExist:
-            return False
-    
-    def count_by_user(self, user: DomainUser) -> int:
-        """Count total receipts for a user."""
-        return Receipt.objects.filter(user_id=user.id).count()
-    
-    def count_by_status(self, user: DomainUser, status: ReceiptStatus) -> int:
-        """Count receipts by status for a user."""
-        return Receipt.objects.filter(user_id=user.id, status=status.value).count()
-    
-    def get_processing_receipts(self) -> List[DomainReceipt]:
-        """Get all receipts that are currently being processed."""
-        django_receipts = Receipt.objects.filter(status='processing')
-        return [self._to_domain_receipt(receipt) for receipt in django_receipts]
-    
-    def get_failed_receipts(self) -> List[DomainReceipt]:
-        """Get all receipts that failed processing."""
-        django_receipts = Receipt.objects.filter(status='failed')
-        return [self._to_domain_receipt(receipt) for receipt in django_receipts]
-    
-    def _to_domain_receipt(self, django_receipt: Receipt) -> DomainReceipt:
-        """Convert Django receipt to domain receipt."""
-        # Get user (simplified - in real implementation, you'd inject user repository)
-        user = None
-        try:
-            django_user = UserModel.objects.get(id=django_receipt.user_id)
-            # Create minimal domain user for receipt
-            user = DomainUser(
-                id=str(django_user.id),
-                email=Email(django_user.email),
-                password_hash=django_user.password,
-                first_name=django_user.first_name,
-                last_name=django_user.last_name,
-                user_type=UserType(django_user.user_type),
-                business_profile=BusinessProfile(
-                    company_name=django_user.company_name,
-                    business_type=django_user.business_type
-                )
-            )
-        except UserModel.DoesNotExist:
-            # Handle case where user doesn't exist - create a minimal placeholder
-            try:
-                user = DomainUser(
-                    id=str(django_receipt.user_id),
-                    email=Email('placeholder@example.com'),
-                    password_hash='placeholder',
-                    first_name='Unknown',
-                    last_name='User',
-                    user_type=UserType.INDIVIDUAL,
-                    business_profile=BusinessProfile(
-                        company_name='Unknown Company',
-                        business_type='unknown'
-                    )
-                )
-            except Exception as e:
-                # If even placeholder creation fails, log and continue with None
-                print(f"Warning: Could not create user placeholder for receipt {django_receipt.id}: {e}")
-                user = None
-        
-        # Create file info with defensive programming
-        try:
-            file_info = FileInfo(
-                filename=django_receipt.filename or 'unknown',
-                file_size=django_receipt.file_size or 0,
-                mime_type=django_receipt.mime_type or 'application/octet-stream',
-                file_url=django_receipt.file_url or ''
-            )
-        except Exception as e:
-            print(f"Warning: Could not create file info for receipt {django_receipt.id}: {e}")
-            # Create minimal file info
-            file_info = FileInfo(
-                filename='unknown',
-                file_size=0,
-                mime_type='application/octet-stream',
-                file_url=''
-            )
-        
-        # Create OCR data (robust parsing)
-        ocr_data = None
-        if django_receipt.ocr_data:
-            try:
-                raw = django_receipt.ocr_data or {}
-                # Safe decimal parse
-                def _to_decimal(val):
-                    if val is None or val == '':
-                        return None
-                    try:
-                        return Decimal(str(val).replace(',', ''))
-                    except Exception:
-                        return None
-                # Safe date parse: try ISO, then YYYY-MM-DD, then DD/MM/YYYY
-                def _to_datetime(val):
-                    if not val:
-                        return None
-                    # Already datetime
-                    if isinstance(val, datetime):
-                        return val
-                    s = str(val)
-                    # Handle trailing 'Z' as UTC
-                    if s.endswith('Z'):
-                        s = s[:-1] + '+00:00'
-                    try:
-                        return datetime.fromisoformat(s)
-                    except Exception:
-                        try:
-                            from datetime import datetime as _dt
-                            return _dt.strptime(s, '%Y-%m-%d')
-                        except Exception:
-                            try:
-                                from datetime import datetime as _dt
-                                return _dt.strptime(s, '%d/%m/%Y')
-                            except Exception:
-                                return None
-                ocr_data = OCRData(
-                    merchant_name=raw.get('merchant_name'),
-                    total_amount=_to_decimal(raw.get('total_amount')),
-                    currency=raw.get('currency', 'GBP'),
-                    date=_to_datetime(raw.get('date')),
-                    vat_amount=_to_decimal(raw.get('vat_amount')),
-                    vat_number=raw.get('vat_number'),
-                    receipt_number=raw.get('receipt_number'),
-                    items=raw.get('items', []),
-                    confidence_score=raw.get('confidence_score'),
-                    raw_text=raw.get('raw_text')
-                )
-            except Exception as e:
-                print(f"Warning: Could not create OCR data for receipt {django_receipt.id}: {e}")
-                ocr_data = None
-        
-        # Create metadata with defensive programming
-        metadata = None
-        if django_receipt.metadata:
-            try:
-                metadata = ReceiptMetadata(
-                    category=django_receipt.metadata.get('category'),
-                    tags=django_receipt.metadata.get('tags', []),
-                    notes=django_receipt.metadata.get('notes'),
-                    is_business_expense=django_receipt.metadata.get('is_business_expense', False),
-                    tax_deductible=django_receipt.metadata.get('tax_deductible', False),
-                    custom_fields=django_receipt.metadata.get('custom_fields', {})
-                )
-            except Exception as e:
-                print(f"Warning: Could not create metadata for receipt {django_receipt.id}: {e}")
-                metadata = None
-        
-        # Create domain receipt with defensive programming
-        try:
-            domain_receipt = DomainReceipt(
-                id=str(django_receipt.id),
-                user=user,
-                file_info=file_info,
-                status=ReceiptStatus(django_receipt.status),
-                receipt_type=ReceiptType(django_receipt.receipt_type),
-                ocr_data=ocr_data,
-                metadata=metadata,
-                processed_at=django_receipt.processed_at
-            )
-            return domain_receipt
-        except Exception as e:
-            print(f"Error: Could not create domain receipt for {django_receipt.id}: {e}")
-            # Return None to indicate failure - the calling code should handle this
-            return None
+
 
 
 class DjangoCategoryRepository(CategoryRepository):
     """Django ORM implementation of CategoryRepository."""
 
+    def __init__(self):
+        # Bound once; saves the manager descriptor lookup on every query
+        self._categories = CategoryModel.objects
+
     def save(self, category: DomainCategory) -> DomainCategory:
-        """Save or update a category."""
-        with transaction.atomic():
-            try:
-                # Try to find existing category
-                django_category = CategoryModel.objects.get(id=category.id)
-                # Update existing category
-                django_category.name = category.name
-                django_category.description = category.description
-                django_category.parent_id = category.parent_id
-                django_category.user_id = category.user.id
-                django_category.save()
-            except CategoryModel.DoesNotExist:
-                # Create new category
-                django_category = CategoryModel.objects.create(
-                    id=category.id,
-                    user_id=category.user.id,
-                    name=category.name,
-                    description=category.description,
-                    parent_id=category.parent_id
-                )
+        """Save or update a category with a single upsert statement."""
+        django_category = CategoryModel(
+            id=category.id,
+            user_id=category.user.id,
+            name=category.name,
+            description=category.description,
+            parent_id=category.parent_id
+        )
+        self._categories.bulk_create(
+            [django_category],
+            update_conflicts=True,
+            unique_fields=['id'],
+            update_fields=['user', 'name', 'description', 'parent', 'updated_at'],
+        )
         return self._to_domain_category(django_category)
 
     def find_by_id(self, category_id: str) -> Optional[DomainCategory]:
         """Find a category by its ID."""
         try:
-            django_category = CategoryModel.objects.get(id=category_id)
+            django_category = self._categories.get(id=category_id)
             return self._to_domain_category(django_category)
         except CategoryModel.DoesNotExist:
             return None
 
     def find_by_user(self, user: DomainUser) -> List[DomainCategory]:
         """Find all categories for a specific user."""
-        django_categories = CategoryModel.objects.filter(user=user)
+        django_categories = self._categories.filter(user=user)
         return [self._to_domain_category(c) for c in django_categories]
 
     def find_by_name(self, user: DomainUser, name: str) -> Optional[DomainCategory]:
         """Find a category by name for a specific user."""
         try:
-            django_category = CategoryModel.objects.get(user=user, name=name)
+            django_category = self._categories.get(user=user, name=name)
             return self._to_domain_category(django_category)
         except CategoryModel.DoesNotExist:
             return None
@@ -795,7 +1186,7 @@ class DjangoCategoryRepository(CategoryRepository):
     def delete(self, category_id: str) -> bool:
         """Delete a category by its ID."""
         try:
-            category = CategoryModel.objects.get(id=category_id)
+            category = self._categories.get(id=category_id)
             category.delete()
             return True
         except CategoryModel.DoesNotExist:
@@ -811,5 +1202,5 @@ class DjangoCategoryRepository(CategoryRepository):
             user=user,
             name=django_category.name,
             description=django_category.description,
-            parent_id=str(django_category.parent.id) if django_category.parent else None
+            parent_id=str(django_category.parent_id) if django_category.parent_id else None
         )
\ No newline at end of file
@@ -1,48 +1,121 @@
 """
 AWS SES Email Backend for Smart Accounts Management System.
 """
+import asyncio
+import functools
+import hashlib
+import json
+import threading
+import time
 import boto3
+from asgiref.sync import async_to_sync
+from botocore.config import Config
 from django.core.mail.backends.base import BaseEmailBackend
 from django.core.mail import EmailMultiAlternatives
 from django.conf import settings
+from django.utils.functional import cached_property
 from botocore.exceptions import ClientError
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def _get_ses_client(region, access_key_id, secret_access_key):
+    """
+    Process-wide SES client.
+
+    Django builds a new backend for every get_connection() call; sharing the
+    client keeps botocore's service model and keep-alive pool across sends.
+    """
+    return boto3.client(
+        'ses',
+        aws_access_key_id=access_key_id,
+        aws_secret_access_key=secret_access_key,
+        region_name=region,
+        config=Config(max_pool_connections=50, tcp_keepalive=True)
+    )
+
+
+class _TokenBucket:
+    """
+    Thread-safe token bucket for the SES sending rate.
+    
+    reserve() takes the tokens straight away and returns how long the caller
+    has to wait before sending, so blocking and async senders can share one
+    bucket. Requests larger than the bucket run it into debt instead of
+    blocking forever.
+    """
+    
+    def __init__(self, rate):
+        self.rate = rate
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def reserve(self, tokens=1):
+        """Take tokens and return the delay in seconds before they may be used."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            return max(0.0, -self._tokens / self.rate)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_rate_limiter(rate):
+    """Process-wide token bucket; the SES quota applies to the whole account, not one backend."""
+    return _TokenBucket(rate)
+
+
 class AWSSESBackend(BaseEmailBackend):
     """
     Custom email backend using AWS SES.
     """
     
-    def __init__(self, fail_silently=False, **kwargs):
-        super().__init__(fail_silently=fail_silently, **kwargs)
-        self.connection = None
-        self._initialize_client()
+    # SES accepts at most 50 destinations per SendBulkTemplatedEmail call
+    BULK_BATCH_SIZE = 50
+    # Fixed bulk templates; the message content travels as template data, so
+    # SES only ever holds these two however many distinct messages are sent
+    BULK_TEMPLATES = {
+        'smart-accounts-bulk-html': {
+            'SubjectPart': '{{{subject}}}',
+            'TextPart': '{{{text}}}',
+            'HtmlPart': '{{{html}}}',
+        },
+        'smart-accounts-bulk-text': {
+            'SubjectPart': '{{{subject}}}',
+            'TextPart': '{{{text}}}',
+        },
+    }
+    # Bulk templates known to exist in SES, checked once per process
+    _registered_templates = set()
     
-    def _initialize_client(self):
-        """Initialize AWS SES client."""
-        try:
-            self.connection = boto3.client(
-                'ses',
-                aws_access_key_id=getattr(settings, 'AWS_SES_ACCESS_KEY_ID', None),
-                aws_secret_access_key=getattr(settings, 'AWS_SES_SECRET_ACCESS_KEY', None),
-                region_name=getattr(settings, 'AWS_SES_REGION', 'us-east-1')
-            )
-            logger.info("AWS SES client initialized successfully")
-        except Exception as e:
-            logger.error(f"Failed to initialize AWS SES client: {e}")
-            if not self.fail_silently:
-                raise
+    @cached_property
+    def connection(self):
+        """
+        AWS SES client, resolved on first send.
+        
+        get_connection() only constructs the backend; errors building the
+        client surface in the send methods, which honour fail_silently.
+        """
+        return _get_ses_client(
+            getattr(settings, 'AWS_SES_REGION', 'us-east-1'),
+            getattr(settings, 'AWS_SES_ACCESS_KEY_ID', None),
+            getattr(settings, 'AWS_SES_SECRET_ACCESS_KEY', None)
+        )
     
-    def open(self):
-        """Open connection - SES doesn't need persistent connections."""
-        return True
+    @cached_property
+    def rate_limiter(self):
+        """Token bucket keeping sends under AWS_SES_MAX_RPS messages per second."""
+        return _get_rate_limiter(getattr(settings, 'AWS_SES_MAX_RPS', 13))
     
-    def close(self):
-        """Close connection - SES doesn't need persistent connections."""
-        pass
+    def _throttle(self, tokens=1):
+        """Block until the SES sending rate allows another `tokens` messages."""
+        delay = self.rate_limiter.reserve(tokens)
+        if delay:
+            time.sleep(delay)
     
     def send_messages(self, email_messages):
         """Send email messages via AWS SES."""
@@ -50,104 +123,333 @@ class AWSSESBackend(BaseEmailBackend):
             return 0
             
         sent_count = 0
-        for message in email_messages:
-            if self._send_message(message):
-                sent_count += 1
+        for batch in self._batches(email_messages):
+            if len(batch) == 1:
+                if self._send_message(batch[0]):
+                    sent_count += 1
+            else:
+                sent_count += self._send_bulk(batch)
         
         return sent_count
     
-    def _send_message(self, message):
-        """Send a single email message."""
+    def _batches(self, email_messages):
+        """
+        Group messages for sending.
+        
+        Identical messages to different recipients are grouped into batches of
+        up to BULK_BATCH_SIZE for one bulk call; all others come out alone.
+        """
+        buckets = {}
+        for message in self._unique_messages(email_messages):
+            buckets.setdefault(self._bulk_key(message), []).append(message)
+        
+        for messages in buckets.values():
+            if len(messages) == 1:
+                for message in messages:
+                    yield [message]
+                continue
+            for start in range(0, len(messages), self.BULK_BATCH_SIZE):
+                yield messages[start:start + self.BULK_BATCH_SIZE]
+    
+    def _unique_messages(self, email_messages):
+        """
+        Drop exact duplicates, keeping the first occurrence.
+        
+        Retried notifications can enqueue the same message twice; sending it
+        again only spends SES quota.
+        """
+        seen = set()
+        for message in email_messages:
+            key = (
+                message.from_email, message.subject, message.body, self._html_content(message),
+                tuple(message.to), tuple(message.cc), tuple(message.bcc), tuple(message.reply_to),
+            )
+            if key in seen:
+                continue
+            seen.add(key)
+            yield message
+    
+    def _html_content(self, message):
+        """Return the text/html alternative of a message, if any."""
+        if isinstance(message, EmailMultiAlternatives):
+            for content, mimetype in message.alternatives:
+                if mimetype == 'text/html':
+                    return content
+        return None
+    
+    def _bulk_key(self, message):
+        """Grouping key for bulk sending: same sender, reply-to and content."""
+        html_content = self._html_content(message)
+        parts = (message.subject, message.body, html_content or '')
+        digest = hashlib.sha256('\x00'.join(parts).encode('utf-8')).hexdigest()
+        return (message.from_email, tuple(message.reply_to), digest)
+    
+    def _template_name(self, message):
+        """Name of the bulk template matching the message's parts."""
+        if self._html_content(message):
+            return 'smart-accounts-bulk-html'
+        return 'smart-accounts-bulk-text'
+    
+    def _template_data(self, name):
+        """Build the CreateTemplate payload for a bulk template."""
+        return {'TemplateName': name, **self.BULK_TEMPLATES[name]}
+    
+    def _ensure_template(self, message):
+        """Make sure the bulk template for the message exists in SES, once per process."""
+        name = self._template_name(message)
+        if name in self._registered_templates:
+            return name
         try:
-            # Prepare email data
-            destination = {
-                'ToAddresses': message.to,
-                'CcAddresses': message.cc,
-                'BccAddresses': message.bcc,
-            }
-            
-            # Handle multipart messages (HTML + Text)
-            if isinstance(message, EmailMultiAlternatives) and message.alternatives:
-                # Find HTML content
-                html_content = None
-                for content, mimetype in message.alternatives:
-                    if mimetype == 'text/html':
-                        html_content = content
-                        break
-                
-                email_data = {
-                    'Source': message.from_email,
-                    'Destination': destination,
-                    'Message': {
-                        'Subject': {
-                            'Data': message.subject,
-                            'Charset': 'UTF-8'
-                        },
-                        'Body': {
-                            'Text': {
-                                'Data': message.body,
-                                'Charset': 'UTF-8'
-                            }
-                        }
-                    }
+            self.connection.create_template(Template=self._template_data(name))
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'AlreadyExists':
+                raise
+        self._registered_templates.add(name)
+        return name
+    
+    def _bulk_email_data(self, messages, template_name):
+        """Build the SendBulkTemplatedEmail payload for identical-content messages."""
+        first = messages[0]
+        # Substituted values are not parsed as Handlebars, so content is sent verbatim
+        content = {'subject': first.subject, 'text': first.body, 'html': self._html_content(first) or ''}
+        email_data = {
+            'Source': first.from_email,
+            'Template': template_name,
+            'DefaultTemplateData': json.dumps(content),
+            'Destinations': [
+                {
+                    'Destination': {
+                        'ToAddresses': message.to,
+                        'CcAddresses': message.cc,
+                        'BccAddresses': message.bcc,
+                    },
+                    'ReplacementTemplateData': '{}',
                 }
+                for message in messages
+            ],
+        }
+        if first.reply_to:
+            email_data['ReplyToAddresses'] = list(first.reply_to)
+        return email_data
+    
+    def _count_bulk_sent(self, messages, response):
+        """Count accepted destinations in a bulk response, logging the rejected ones."""
+        statuses = response.get('Status', [])
+        sent = sum(1 for status in statuses if status.get('Status') == 'Success')
+            
+        logger.info("Bulk email sent via SES: %s/%s accepted", sent, len(messages))
+        logger.info("Subject: %s", messages[0].subject)
+        for message, status in zip(messages, statuses):
+            if status.get('Status') != 'Success':
+                logger.error(
+                    "SES bulk destination failed (%s): %s - %s",
+                    status.get('Status'), ', '.join(message.to), status.get('Error')
+                )
+            
+        return sent
+    
+    def _send_bulk(self, messages):
+        """Send identical-content messages with one SendBulkTemplatedEmail call."""
+        try:
+            template_name = self._ensure_template(messages[0])
+            # SES counts every destination against the sending rate
+            self._throttle(len(messages))
+            response = self.connection.send_bulk_templated_email(
+                **self._bulk_email_data(messages, template_name)
+            )
+            return self._count_bulk_sent(messages, response)
+            
+        except ClientError as e:
+            self._log_client_error(e)
+            if not self.fail_silently:
+                raise
+            return 0
+            
+        except Exception as e:
+            logger.error("Unexpected error sending bulk email via SES: %s", e)
+            if not self.fail_silently:
+                raise
+            return 0
+    
+    def _email_data(self, message):
+        """Build the SendEmail payload for a single message."""
+        # Prepare email data
+        destination = {
+            'ToAddresses': message.to,
+            'CcAddresses': message.cc,
+            'BccAddresses': message.bcc,
+        }
                 
-                if html_content:
-                    email_data['Message']['Body']['Html'] = {
-                        'Data': html_content,
+        email_data = {
+            'Source': message.from_email,
+            'Destination': destination,
+            'Message': {
+                'Subject': {
+                    'Data': message.subject,
+                    'Charset': 'UTF-8'
+                },
+                'Body': {
+                    'Text': {
+                        'Data': message.body,
                         'Charset': 'UTF-8'
                     }
-            else:
-                # Plain text message
-                email_data = {
-                    'Source': message.from_email,
-                    'Destination': destination,
-                    'Message': {
-                        'Subject': {
-                            'Data': message.subject,
-                            'Charset': 'UTF-8'
-                        },
-                        'Body': {
-                            'Text': {
-                                'Data': message.body,
-                                'Charset': 'UTF-8'
-                            }
-                        }
-                    }
                 }
+            }
+        }
+                
+        # Handle multipart messages (HTML + Text)
+        html_content = self._html_content(message)
+        if html_content:
+            email_data['Message']['Body']['Html'] = {
+                'Data': html_content,
+                'Charset': 'UTF-8'
+            }
             
-            # Send via SES
-            response = self.connection.send_email(**email_data)
-            message_id = response['MessageId']
+        return email_data
+    
+    def _log_sent(self, message, response):
+        """Log a successful single send."""
+        message_id = response['MessageId']
             
-            logger.info(f"Email sent successfully via SES. MessageId: {message_id}")
-            logger.info(f"Subject: {message.subject}")
-            logger.info(f"To: {', '.join(message.to)}")
+        logger.info("Email sent successfully via SES. MessageId: %s", message_id)
+        logger.info("Subject: %s", message.subject)
+        logger.info("To: %s", ', '.join(message.to))
+    
+    def _send_message(self, message):
+        """Send a single email message."""
+        try:
+            # Send via SES
+            self._throttle()
+            response = self.connection.send_email(**self._email_data(message))
+            self._log_sent(message, response)
             
             return True
             
         except ClientError as e:
-            error_code = e.response['Error']['Code']
-            error_message = e.response['Error']['Message']
-            
-            # Handle specific SES errors
-            if error_code == 'MessageRejected':
-                logger.error(f"SES Message Rejected: {error_message}")
-                if 'Email address not verified' in error_message:
-                    logger.error("Email address not verified in SES. Please verify the sender email in AWS SES console.")
-            elif error_code == 'SendingPausedException':
-                logger.error("SES sending is paused for your account")
-            elif error_code == 'MailFromDomainNotVerifiedException':
-                logger.error("Mail-from domain not verified in SES")
-            else:
-                logger.error(f"SES ClientError: {error_code} - {error_message}")
+            self._log_client_error(e)
+            if not self.fail_silently:
+                raise
+            return False
             
+        except Exception as e:
+            logger.error("Unexpected error sending email via SES: %s", e)
             if not self.fail_silently:
                 raise
             return False
+    
+    def _log_client_error(self, e):
+        """Log an SES ClientError with hints for the common account issues."""
+        error_code = e.response['Error']['Code']
+        error_message = e.response['Error']['Message']
+        
+        # Handle specific SES errors
+        if error_code == 'MessageRejected':
+            logger.error("SES Message Rejected: %s", error_message)
+            if 'Email address not verified' in error_message:
+                logger.error("Email address not verified in SES. Please verify the sender email in AWS SES console.")
+        elif error_code == 'SendingPausedException':
+            logger.error("SES sending is paused for your account")
+        elif error_code == 'MailFromDomainNotVerifiedException':
+            logger.error("Mail-from domain not verified in SES")
+        else:
+            logger.error("SES ClientError: %s - %s", error_code, error_message)
+
+
+class AsyncAWSSESBackend(AWSSESBackend):
+    """
+    AWS SES backend built on aioboto3.
+    
+    ``asend_messages`` issues all SES calls for a batch concurrently on the
+    event loop. ``send_messages`` wraps it for synchronous callers such as
+    ``send_mail``.
+    """
+    
+    @cached_property
+    def _session(self):
+        """aioboto3 session, created on first send; clients are opened per batch."""
+        import aioboto3
+        
+        return aioboto3.Session(
+            aws_access_key_id=getattr(settings, 'AWS_SES_ACCESS_KEY_ID', None),
+            aws_secret_access_key=getattr(settings, 'AWS_SES_SECRET_ACCESS_KEY', None),
+            region_name=getattr(settings, 'AWS_SES_REGION', 'us-east-1')
+        )
+    
+    def send_messages(self, email_messages):
+        """Send email messages via AWS SES from synchronous code."""
+        return async_to_sync(self.asend_messages)(email_messages)
+    
+    async def asend_messages(self, email_messages):
+        """Send email messages via AWS SES, overlapping the round-trips."""
+        if not email_messages:
+            return 0
+        
+        async with self._session.client('ses') as ses:
+            results = await asyncio.gather(*(
+                self._asend_message(ses, batch[0]) if len(batch) == 1 else self._asend_bulk(ses, batch)
+                for batch in self._batches(email_messages)
+            ))
+        
+        return sum(int(result) for result in results)
+    
+    async def _athrottle(self, tokens=1):
+        """Async counterpart of _throttle."""
+        delay = self.rate_limiter.reserve(tokens)
+        if delay:
+            await asyncio.sleep(delay)
+    
+    async def _aensure_template(self, ses, message):
+        """Async counterpart of _ensure_template."""
+        name = self._template_name(message)
+        if name in self._registered_templates:
+            return name
+        try:
+            await ses.create_template(Template=self._template_data(name))
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'AlreadyExists':
+                raise
+        self._registered_templates.add(name)
+        return name
+    
+    async def _asend_bulk(self, ses, messages):
+        """Async counterpart of _send_bulk."""
+        try:
+            template_name = await self._aensure_template(ses, messages[0])
+            await self._athrottle(len(messages))
+            response = await ses.send_bulk_templated_email(
+                **self._bulk_email_data(messages, template_name)
+            )
+            return self._count_bulk_sent(messages, response)
+        
+        except ClientError as e:
+            self._log_client_error(e)
+            if not self.fail_silently:
+                raise
+            return 0
+        
+        except Exception as e:
+            logger.error("Unexpected error sending bulk email via SES: %s", e)
+            if not self.fail_silently:
+                raise
+            return 0
+    
+    async def _asend_message(self, ses, message):
+        """Async counterpart of _send_message."""
+        try:
+            await self._athrottle()
+            response = await ses.send_email(**self._email_data(message))
+            self._log_sent(message, response)
             
+            return True
+        
+        except ClientError as e:
+            self._log_client_error(e)
+            if not self.fail_silently:
+                raise
+            return False
+        
         except Exception as e:
-            logger.error(f"Unexpected error sending email via SES: {e}")
+            logger.error("Unexpected error sending email via SES: %s", e)
             if not self.fail_silently:
                 raise
             return False
@@ -160,16 +462,17 @@ class DevelopmentAWSSESBackend(AWSSESBackend):
     
     def _send_message(self, message):
         """Send message with development-specific logging."""
-        logger.info("=" * 50)
-        logger.info("DEVELOPMENT EMAIL VIA AWS SES")
-        logger.info("=" * 50)
-        logger.info(f"From: {message.from_email}")
-        logger.info(f"To: {', '.join(message.to)}")
-        logger.info(f"Subject: {message.subject}")
-        logger.info("-" * 50)
-        logger.info("Body:")
-        logger.info(message.body)
-        logger.info("=" * 50)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("=" * 50)
+            logger.info("DEVELOPMENT EMAIL VIA AWS SES")
+            logger.info("=" * 50)
+            logger.info("From: %s", message.from_email)
+            logger.info("To: %s", ', '.join(message.to))
+            logger.info("Subject: %s", message.subject)
+            logger.info("-" * 50)
+            logger.info("Body:")
+            logger.info(message.body)
+            logger.info("=" * 50)
         
         # Try to send via SES
         result = super()._send_message(message)
@@ -179,4 +482,4 @@ class DevelopmentAWSSESBackend(AWSSESBackend):
         else:
             logger.warning("❌ Email failed to send via AWS SES")
             
-        return result
\ No newline at end of file
+        return result
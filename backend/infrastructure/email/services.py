@@ -3,13 +3,15 @@ Email service infrastructure.
 Handles email sending for the application.
 """
 
-from typing import Optional
-from django.core.mail import send_mail
+from asgiref.sync import sync_to_async
+from django.core.mail import EmailMultiAlternatives, get_connection
 from django.conf import settings
-from django.template.loader import render_to_string
-from django.utils.html import strip_tags
+from django.db import transaction
+from django.template.loader import get_template
 import logging
 
+from .tasks import send_email_task
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,6 +25,16 @@ class EmailService:
         self.site_name = getattr(settings, 'SITE_NAME', 'Smart Accounts')
         self.site_url = getattr(settings, 'SITE_URL', 'http://localhost:8000')
         
+        # Compiled once per service instead of rebuilding HTML per send
+        self._tpl_verification = get_template('email/verification.html')
+        self._tpl_verification_txt = get_template('email/verification.txt')
+        self._tpl_password_reset = get_template('email/password_reset.html')
+        self._tpl_password_reset_txt = get_template('email/password_reset.txt')
+        self._tpl_welcome = get_template('email/welcome.html')
+        self._tpl_welcome_txt = get_template('email/welcome.txt')
+        self._tpl_receipt_processed = get_template('email/receipt_processed.html')
+        self._tpl_receipt_processed_txt = get_template('email/receipt_processed.txt')
+        
         # Email bypass settings - gives you control over email verification
         self.bypass_email_verification = getattr(settings, 'BYPASS_EMAIL_VERIFICATION', False)
         self.auto_verify_development_users = getattr(settings, 'AUTO_VERIFY_DEVELOPMENT_USERS', False)
@@ -42,64 +54,105 @@ class EmailService:
             verification_token: Verification token
             
         Returns:
-            True if email sent successfully, False otherwise
+            True if the email was queued for delivery
         """
         # Check if email verification is bypassed
         if self.bypass_email_verification:
-            logger.info(f"📧 Email verification bypassed for {to_email} (BYPASS_EMAIL_VERIFICATION=True)")
-            logger.info(f"🔗 Verification URL would be: {self.site_url}/verify-email?token={verification_token}")
+            logger.info("📧 Email verification bypassed for %s (BYPASS_EMAIL_VERIFICATION=True)", to_email)
+            logger.info("🔗 Verification URL would be: %s/verify-email?token=%s", self.site_url, verification_token)
             return True
             
         # Log email sending attempt
-        logger.info(f"📧 Sending verification email to {to_email}")
-        logger.info(f"📧 Using email backend: {settings.EMAIL_BACKEND}")
+        logger.info("📧 Sending verification email to %s", to_email)
+        logger.info("📧 Using email backend: %s", settings.EMAIL_BACKEND)
+        subject, plain_text, html_content = self._verification_email_content(user_name, verification_token)
+        return self._enqueue(subject, plain_text, html_content, to_email)
+    
+    async def send_verification_email_async(
+        self,
+        to_email: str,
+        user_name: str,
+        verification_token: str
+    ) -> bool:
+        """
+        Send email verification email without blocking the event loop.
+        
+        Uses the backend's ``asend_messages`` when it has one (e.g.
+        AsyncAWSSESBackend); otherwise runs send_verification_email in a
+        worker thread.
+        """
+        connection = get_connection(fail_silently=False)
+        if self.bypass_email_verification or not hasattr(connection, 'asend_messages'):
+            return await sync_to_async(self.send_verification_email)(
+                to_email, user_name, verification_token
+            )
+        
+        logger.info("📧 Sending verification email to %s", to_email)
+        subject, plain_text, html_content = self._verification_email_content(user_name, verification_token)
+        message = EmailMultiAlternatives(
+            subject=subject,
+            body=plain_text,
+            from_email=self.from_email,
+            to=[to_email],
+            connection=connection
+        )
+        message.attach_alternative(html_content, 'text/html')
+        
+        try:
+            sent = await connection.asend_messages([message])
+            if sent:
+                logger.info("✅ Verification email sent successfully to %s", to_email)
+            return bool(sent)
+        except Exception as e:
+            self._log_verification_failure(to_email, e)
+            return False
+    
+    def _verification_email_content(self, user_name: str, verification_token: str):
+        """Build the subject, plain-text and HTML bodies of the verification email."""
         subject = f"Verify your {self.site_name} account"
         
         # Create verification URL
         verification_url = f"{self.site_url}/verify-email?token={verification_token}"
         
         # Email content
-        html_content = f"""
-        <html>
-        <body>
-            <h2>Welcome to {self.site_name}!</h2>
-            <p>Hi {user_name},</p>
-            <p>Thank you for registering with {self.site_name}. To complete your registration, please verify your email address by clicking the link below:</p>
-            <p><a href="{verification_url}" style="background-color: #007bff; color: white; padding: 10px 20px; text-decoration: none; border-radius: 5px;">Verify Email Address</a></p>
-            <p>Or copy and paste this link into your browser:</p>
-            <p>{verification_url}</p>
-            <p>This link will expire in 24 hours.</p>
-            <p>If you didn't create an account with {self.site_name}, please ignore this email.</p>
-            <p>Best regards,<br>The {self.site_name} Team</p>
-        </body>
-        </html>
+        context = {
+            'site_name': self.site_name,
+            'user_name': user_name,
+            'verification_url': verification_url,
+        }
+        html_content = self._tpl_verification.render(context)
+        plain_text = self._tpl_verification_txt.render(context)
+        
+        return subject, plain_text, html_content
+    
+    def _log_verification_failure(self, to_email: str, e: Exception) -> None:
+        """Log a failed verification send, with the SES sandbox hint when relevant."""
+        logger.error("❌ Failed to send verification email to %s: %s", to_email, e)
+        logger.error("📧 Email backend: %s", settings.EMAIL_BACKEND)
+        logger.error("📧 From email: %s", self.from_email)
+        
+        # Check if this is a SES sandbox limitation
+        if 'Email address not verified' in str(e):
+            logger.error("🚨 SES SANDBOX MODE: The recipient email must be verified in AWS SES console!")
+            logger.error("🔧 To fix: Go to AWS SES Console → Verified identities → Add %s", to_email)
+            logger.error("🔧 Or move SES out of sandbox mode to send to any email address")
+    
+    def _enqueue(self, subject: str, plain_text: str, html_content: str, to_email: str) -> bool:
         """
+        Queue an email for background delivery once the current transaction commits.
         
-        plain_text = strip_tags(html_content)
-        
-        try:
-            send_mail(
-                subject=subject,
-                message=plain_text,
-                from_email=self.from_email,
-                recipient_list=[to_email],
-                html_message=html_content,
-                fail_silently=False
-            )
-            logger.info(f"✅ Verification email sent successfully to {to_email}")
-            return True
-        except Exception as e:
-            logger.error(f"❌ Failed to send verification email to {to_email}: {e}")
-            logger.error(f"📧 Email backend: {settings.EMAIL_BACKEND}")
-            logger.error(f"📧 From email: {self.from_email}")
-            
-            # Check if this is a SES sandbox limitation
-            if 'Email address not verified' in str(e):
-                logger.error("🚨 SES SANDBOX MODE: The recipient email must be verified in AWS SES console!")
-                logger.error(f"🔧 To fix: Go to AWS SES Console → Verified identities → Add {to_email}")
-                logger.error("🔧 Or move SES out of sandbox mode to send to any email address")
-                
-            return False
+        Returns True as soon as the email is scheduled; SES errors are
+        handled and retried by send_email_task in the worker.
+        """
+        def dispatch():
+            try:
+                send_email_task.delay(subject, plain_text, html_content, self.from_email, [to_email])
+            except Exception as e:
+                logger.error("❌ Failed to queue email to %s: %s", to_email, e)
+        
+        # Wait for the user row to commit before a worker can act on it
+        transaction.on_commit(dispatch)
+        return True
     
     def send_password_reset_email(
         self,
@@ -116,7 +169,7 @@ class EmailService:
             reset_token: Password reset token
             
         Returns:
-            True if email sent successfully, False otherwise
+            True if the email was queued for delivery
         """
         subject = f"Reset your {self.site_name} password"
         
@@ -124,38 +177,15 @@ class EmailService:
         reset_url = f"{self.site_url}/reset-password?token={reset_token}"
         
         # Email content
-        html_content = f"""
-        <html>
-        <body>
-            <h2>Password Reset Request</h2>
-            <p>Hi {user_name},</p>
-            <p>We received a request to reset your password for your {self.site_name} account. Click the link below to reset your password:</p>
-            <p><a href="{reset_url}" style="background-color: #dc3545; color: white; padding: 10px 20px; text-decoration: none; border-radius: 5px;">Reset Password</a></p>
-            <p>Or copy and paste this link into your browser:</p>
-            <p>{reset_url}</p>
-            <p>This link will expire in 1 hour.</p>
-            <p>If you didn't request a password reset, please ignore this email. Your password will remain unchanged.</p>
-            <p>Best regards,<br>The {self.site_name} Team</p>
-        </body>
-        </html>
-        """
-        
-        plain_text = strip_tags(html_content)
-        
-        try:
-            send_mail(
-                subject=subject,
-                message=plain_text,
-                from_email=self.from_email,
-                recipient_list=[to_email],
-                html_message=html_content,
-                fail_silently=False
-            )
-            return True
-        except Exception as e:
-            # Log the error (in production, use proper logging)
-            print(f"Failed to send password reset email to {to_email}: {e}")
-            return False
+        context = {
+            'site_name': self.site_name,
+            'user_name': user_name,
+            'reset_url': reset_url,
+        }
+        html_content = self._tpl_password_reset.render(context)
+        plain_text = self._tpl_password_reset_txt.render(context)
+        
+        return self._enqueue(subject, plain_text, html_content, to_email)
     
     def send_welcome_email(
         self,
@@ -170,47 +200,20 @@ class EmailService:
             user_name: User's full name
             
         Returns:
-            True if email sent successfully, False otherwise
+            True if the email was queued for delivery
         """
         subject = f"Welcome to {self.site_name}!"
         
         # Email content
-        html_content = f"""
-        <html>
-        <body>
-            <h2>Welcome to {self.site_name}!</h2>
-            <p>Hi {user_name},</p>
-            <p>Your email has been verified successfully! You can now log in to your {self.site_name} account and start managing your receipts and expenses.</p>
-            <p><a href="{self.site_url}/login" style="background-color: #28a745; color: white; padding: 10px 20px; text-decoration: none; border-radius: 5px;">Log In Now</a></p>
-            <p>Here's what you can do with {self.site_name}:</p>
-            <ul>
-                <li>Upload and digitize receipts</li>
-                <li>Track expenses and income</li>
-                <li>Generate reports for tax purposes</li>
-                <li>Manage your business finances</li>
-            </ul>
-            <p>If you have any questions, feel free to contact our support team.</p>
-            <p>Best regards,<br>The {self.site_name} Team</p>
-        </body>
-        </html>
-        """
-        
-        plain_text = strip_tags(html_content)
-        
-        try:
-            send_mail(
-                subject=subject,
-                message=plain_text,
-                from_email=self.from_email,
-                recipient_list=[to_email],
-                html_message=html_content,
-                fail_silently=False
-            )
-            return True
-        except Exception as e:
-            # Log the error (in production, use proper logging)
-            print(f"Failed to send welcome email to {to_email}: {e}")
-            return False
+        context = {
+            'site_name': self.site_name,
+            'site_url': self.site_url,
+            'user_name': user_name,
+        }
+        html_content = self._tpl_welcome.render(context)
+        plain_text = self._tpl_welcome_txt.render(context)
+        
+        return self._enqueue(subject, plain_text, html_content, to_email)
     
     def send_receipt_processed_email(
         self,
@@ -229,38 +232,19 @@ class EmailService:
             total_amount: Total amount from receipts
             
         Returns:
-            True if email sent successfully, False otherwise
+            True if the email was queued for delivery
         """
         subject = f"Receipts processed - {self.site_name}"
         
         # Email content
-        html_content = f"""
-        <html>
-        <body>
-            <h2>Receipts Processed Successfully</h2>
-            <p>Hi {user_name},</p>
-            <p>Great news! We've successfully processed {receipt_count} receipt(s) from your recent upload.</p>
-            <p>Total amount processed: £{total_amount:.2f}</p>
-            <p><a href="{self.site_url}/dashboard" style="background-color: #007bff; color: white; padding: 10px 20px; text-decoration: none; border-radius: 5px;">View Dashboard</a></p>
-            <p>You can now view and manage these receipts in your dashboard.</p>
-            <p>Best regards,<br>The {self.site_name} Team</p>
-        </body>
-        </html>
-        """
-        
-        plain_text = strip_tags(html_content)
-        
-        try:
-            send_mail(
-                subject=subject,
-                message=plain_text,
-                from_email=self.from_email,
-                recipient_list=[to_email],
-                html_message=html_content,
-                fail_silently=False
-            )
-            return True
-        except Exception as e:
-            # Log the error (in production, use proper logging)
-            print(f"Failed to send receipt processed email to {to_email}: {e}")
-            return False 
\ No newline at end of file
+        context = {
+            'site_name': self.site_name,
+            'site_url': self.site_url,
+            'user_name': user_name,
+            'receipt_count': receipt_count,
+            'total_amount': total_amount,
+        }
+        html_content = self._tpl_receipt_processed.render(context)
+        plain_text = self._tpl_receipt_processed_txt.render(context)
+        
+        return self._enqueue(subject, plain_text, html_content, to_email)
\ No newline at end of file
@@ -0,0 +1,46 @@
+"""
+Background email delivery tasks.
+"""
+
+from typing import List
+from botocore.exceptions import ClientError
+from celery import shared_task
+from celery.utils.time import get_exponential_backoff_interval
+from django.core.mail import send_mail
+import logging
+
+logger = logging.getLogger(__name__)
+
+# SES errors worth retrying; rejections and account problems are not
+RETRYABLE_SES_ERRORS = {'Throttling', 'ThrottlingException', 'ServiceUnavailable', 'InternalFailure'}
+
+
+@shared_task(bind=True, max_retries=5)
+def send_email_task(
+    self,
+    subject: str,
+    plain_text: str,
+    html_content: str,
+    from_email: str,
+    to: List[str]
+) -> None:
+    """Send one email through the configured backend, backing off on SES throttling."""
+    try:
+        send_mail(
+            subject=subject,
+            message=plain_text,
+            from_email=from_email,
+            recipient_list=to,
+            html_message=html_content,
+            fail_silently=False
+        )
+    except ClientError as e:
+        if e.response['Error']['Code'] not in RETRYABLE_SES_ERRORS:
+            raise
+        # Exponential backoff with full jitter to spread retries across workers
+        countdown = get_exponential_backoff_interval(
+            factor=1, retries=self.request.retries, maximum=600, full_jitter=True
+        )
+        logger.warning("SES throttled email to %s; retrying in %ss", ', '.join(to), countdown)
+        raise self.retry(exc=e, countdown=countdown)
+    logger.info("✅ Email '%s' sent to %s", subject, ', '.join(to))
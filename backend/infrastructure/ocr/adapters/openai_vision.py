@@ -1,16 +1,22 @@
 """
 OpenAI Vision adapter that produces a normalized ReceiptExtraction.
-If provided bytes, it uploads to Cloudinary first via StorageProvider.
+If provided bytes, small images are sent inline as a data URL while the
+Cloudinary upload runs alongside; larger ones are uploaded first.
 """
 
 from __future__ import annotations
 
-import json
+import base64
+import functools
+import mimetypes
 import os
 import time
 import logging
-from typing import Optional, Dict, Any
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Final, Optional, Dict, Any, List, NamedTuple, Tuple, Union
 
+import httpx
+import orjson
 from django.conf import settings
 from pydantic import BaseModel
 
@@ -18,39 +24,67 @@ from application.receipts.ports import OCRProvider, ReceiptExtraction, StoragePr
 
 logger = logging.getLogger(__name__)
 
+# Images up to this size are sent to the model inline instead of by URL
+_INLINE_IMAGE_MAX_BYTES = 5 * 1024 * 1024
+# Storage uploads that run alongside the model call
+_upload_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="receipt-upload")
+
+_SYSTEM_PROMPT: Final[str] = (
+    "Extract structured fields from the receipt image. Return strict JSON with keys: "
+    "merchant, date (YYYY-MM-DD), currency (GBP/EUR/USD if inferable), subtotal (number), "
+    "tax (number), tax_rate (number or null), total (number), ocr_confidence (0-100), raw_text (string)."
+)
+# Fixed message parts shared by every request; only the image parts vary per call
+_SYSTEM_MESSAGE: Final[Dict[str, str]] = {"role": "system", "content": _SYSTEM_PROMPT}
+_PARSE_ONE_TEXT: Final[Dict[str, str]] = {"type": "text", "text": "Parse this receipt."}
+
+
+class _OpenAIConfig(NamedTuple):
+    api_key: Optional[str]
+    model: str
+
+
+@functools.lru_cache(maxsize=1)
+def _openai_config() -> _OpenAIConfig:
+    """Environment/settings lookup, resolved once per process rather than per call."""
+    return _OpenAIConfig(
+        api_key=os.getenv("OPENAI_API_KEY", getattr(settings, "OPENAI_API_KEY", None)),
+        model=getattr(settings, "OPENAI_VISION_MODEL", "gpt-4o-mini"),
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _openai_client(api_key: str):
+    """Process-wide OpenAI client, so the HTTP/2 connection stays warm between parses."""
+    from openai import OpenAI  # lazy import
+
+    return OpenAI(
+        api_key=api_key,
+        http_client=httpx.Client(http2=True, limits=httpx.Limits(max_keepalive_connections=20)),
+    )
+
 
 class OpenAIVisionAdapter(OCRProvider):
     def __init__(self, storage: StorageProvider):
-        api_key = os.getenv("OPENAI_API_KEY", getattr(settings, "OPENAI_API_KEY", None))
+        api_key, self.model = _openai_config()
         if not api_key:
             raise RuntimeError("OPENAI_API_KEY is not configured")
-        from openai import OpenAI  # lazy import
-        self.client = OpenAI(api_key=api_key)
+        self.client = _openai_client(api_key)
         self.storage = storage
 
-    def _build_prompt(self) -> str:
-        return (
-            "Extract structured fields from the receipt image. Return strict JSON with keys: "
-            "merchant, date (YYYY-MM-DD), currency (GBP/EUR/USD if inferable), subtotal (number), "
-            "tax (number), tax_rate (number or null), total (number), ocr_confidence (0-100), raw_text (string)."
-        )
-
     def _call_model(self, image_url: str) -> Dict[str, Any]:
         # Use responses with JSON mode when available
         try:
-            t0 = time.time()
+            t0 = time.perf_counter_ns()
             resp = self.client.chat.completions.create(
-                model=getattr(settings, "OPENAI_VISION_MODEL", "gpt-4o-mini"),
+                model=self.model,
                 temperature=0.1,
                 messages=[
-                    {
-                        "role": "system",
-                        "content": self._build_prompt(),
-                    },
+                    _SYSTEM_MESSAGE,
                     {
                         "role": "user",
                         "content": [
-                            {"type": "text", "text": "Parse this receipt."},
+                            _PARSE_ONE_TEXT,
                             {
                                 "type": "image_url",
                                 "image_url": {"url": image_url},
@@ -60,43 +94,120 @@ class OpenAIVisionAdapter(OCRProvider):
                 ],
                 response_format={"type": "json_object"},
             )
-            latency_ms = int((time.time() - t0) * 1000)
+            latency_ms = (time.perf_counter_ns() - t0) // 1_000_000
             content = resp.choices[0].message.content or "{}"
-            data = json.loads(content)
+            data = orjson.loads(content)
             data["_latency_ms"] = latency_ms
             return data
         except Exception as e:
             logger.error("OpenAI Vision call failed: %s", e)
             raise
 
+    def _call_model_batch(self, image_urls: List[str]) -> Tuple[List[Dict[str, Any]], int]:
+        """One chat completion for several images; returns per-image dicts and the call latency."""
+        count = len(image_urls)
+        try:
+            t0 = time.perf_counter_ns()
+            resp = self.client.chat.completions.create(
+                model=self.model,
+                temperature=0.1,
+                messages=[
+                    _SYSTEM_MESSAGE,
+                    {
+                        "role": "user",
+                        "content": [
+                            {
+                                "type": "text",
+                                "text": (
+                                    f"Parse these {count} receipts. Return a JSON object "
+                                    f'{{"receipts": [...]}} whose array has exactly {count} objects, '
+                                    "one per image in the order given, each with the keys above."
+                                ),
+                            },
+                            *({"type": "image_url", "image_url": {"url": u}} for u in image_urls),
+                        ],
+                    },
+                ],
+                response_format={"type": "json_object"},
+            )
+            latency_ms = (time.perf_counter_ns() - t0) // 1_000_000
+            content = resp.choices[0].message.content or "{}"
+            receipts = orjson.loads(content).get("receipts")
+            if not isinstance(receipts, list) or len(receipts) != count:
+                raise RuntimeError(f"OpenAI Vision returned {len(receipts or [])} receipts for {count} images")
+            return receipts, latency_ms
+        except Exception as e:
+            logger.error("OpenAI Vision batch call failed: %s", e)
+            raise
+
+    def _prepare_image(
+        self, file_bytes: Optional[bytes], url: Optional[str], options: Dict[str, Any]
+    ) -> Tuple[str, Optional[str], Optional[Future]]:
+        """Return (image_url for the model, stored source_url, pending upload) for one input."""
+        if url or file_bytes is None:
+            return url, url, None
+        filename = options.get("filename", "receipt.jpg")
+        skip_storage = bool(options.get("skip_storage"))
+        if skip_storage or len(file_bytes) <= _INLINE_IMAGE_MAX_BYTES:
+            # Inline data URL: the model call no longer waits on the storage round-trip
+            mime = options.get("mime") or mimetypes.guess_type(filename)[0] or "image/jpeg"
+            image_url = f"data:{mime};base64,{base64.b64encode(file_bytes).decode('ascii')}"
+            upload = None
+            if not skip_storage:
+                upload = _upload_executor.submit(
+                    self.storage.upload, file_bytes=file_bytes, filename=filename, mime=options.get("mime")
+                )
+            return image_url, None, upload
+        asset = self.storage.upload(file_bytes=file_bytes, filename=filename, mime=options.get("mime"))
+        return asset.secure_url, asset.secure_url, None
+
+    def _to_extraction(self, raw: Dict[str, Any], source_url: Optional[str], latency_ms: int) -> ReceiptExtraction:
+        # The prompt asks for the model's field names; validate in one pass
+        return ReceiptExtraction.model_validate({
+            **raw,
+            "engine": "openai",
+            "currency": raw.get("currency") or "GBP",
+            "source_url": source_url,
+            "latency_ms": latency_ms,
+            "raw_response": raw,
+        })
+
     def parse_receipt(self, *, file_bytes: Optional[bytes] = None, url: Optional[str] = None, options: Optional[Dict[str, Any]] = None) -> ReceiptExtraction:
         if not url and not file_bytes:
             raise ValueError("Provide either file_bytes or url")
 
-        source_url: Optional[str] = url
-        # Upload if bytes
-        if file_bytes is not None and not source_url:
-            filename = (options or {}).get("filename", "receipt.jpg")
-            asset = self.storage.upload(file_bytes=file_bytes, filename=filename, mime=(options or {}).get("mime"))
-            source_url = asset.secure_url
-
-        raw = self._call_model(source_url)
+        image_url, source_url, upload = self._prepare_image(file_bytes, url, options or {})
+        raw = self._call_model(image_url)
+        if upload is not None:
+            source_url = upload.result().secure_url
         latency_ms = int(raw.pop("_latency_ms", 0))
+        return self._to_extraction(raw, source_url, latency_ms)
 
-        return ReceiptExtraction(
-            engine="openai",
-            merchant=raw.get("merchant"),
-            date=raw.get("date"),
-            total=raw.get("total"),
-            currency=raw.get("currency") or "GBP",
-            tax=raw.get("tax"),
-            tax_rate=raw.get("tax_rate"),
-            subtotal=raw.get("subtotal"),
-            ocr_confidence=raw.get("ocr_confidence"),
-            raw_text=raw.get("raw_text"),
-            source_url=source_url,
-            latency_ms=latency_ms,
-            raw_response=raw,
-        )
+    def parse_receipts(
+        self, items: List[Union[bytes, str]], options: Optional[List[Dict[str, Any]]] = None
+    ) -> List[ReceiptExtraction]:
+        """Parse several receipts with a single model call.
+
+        ``str`` items are URLs and ``bytes`` items image content; ``options``
+        optionally gives per-item options as for parse_receipt. Results keep
+        input order and share the batch latency.
+        """
+        if not items:
+            return []
+        prepared = [
+            self._prepare_image(
+                item if isinstance(item, bytes) else None,
+                item if isinstance(item, str) else None,
+                (options[i] if options else None) or {},
+            )
+            for i, item in enumerate(items)
+        ]
+        raws, latency_ms = self._call_model_batch([image_url for image_url, _, _ in prepared])
+        extractions = []
+        for raw, (_, source_url, upload) in zip(raws, prepared):
+            if upload is not None:
+                source_url = upload.result().secure_url
+            extractions.append(self._to_extraction(raw, source_url, latency_ms))
+        return extractions
 
 
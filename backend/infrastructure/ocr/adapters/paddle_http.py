@@ -5,65 +5,213 @@ Reads service URLs from environment and maps responses into ReceiptExtraction.
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import io
 import os
 import time
+import uuid
 import logging
-from typing import Optional, Dict, Any
+from typing import IO, Optional, Dict, Any, List, NamedTuple, Union
 
+import httpx
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 from django.conf import settings
 
 from application.receipts.ports import OCRProvider, ReceiptExtraction
 
 logger = logging.getLogger(__name__)
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _quote_param(value: str) -> str:
+    """Escape a multipart header parameter the way browsers (and urllib3) do."""
+    return value.replace('"', "%22").replace("\r", "%0D").replace("\n", "%0A")
+
+
+class _MultipartFileBody:
+    """``multipart/form-data`` body for a single file part, read lazily.
+
+    The part headers and closing boundary are small ``bytes``; the file itself
+    is read from ``stream`` in chunks as the connection sends it, so an upload
+    is never copied into memory. The body is sized and seekable, which lets
+    requests send a ``Content-Length`` and urllib3 rewind it before a retry.
+    """
+
+    chunk_size = 64 * 1024
+
+    def __init__(self, field: str, filename: str, content_type: Optional[str], stream: IO[bytes]):
+        boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+        self._head = (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="{_quote_param(field)}"; filename="{_quote_param(filename)}"\r\n'
+            f"Content-Type: {content_type or 'application/octet-stream'}\r\n\r\n"
+        ).encode()
+        self._tail = f"\r\n--{boundary}--\r\n".encode()
+        self._stream = stream
+        self._start = stream.tell()
+        self._size = stream.seek(0, io.SEEK_END) - self._start
+        stream.seek(self._start)
+        self._pos = 0
+
+    def __len__(self) -> int:
+        return len(self._head) + self._size + len(self._tail)
+
+    def __iter__(self):
+        while chunk := self.read(self.chunk_size):
+            yield chunk
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._pos, io.SEEK_END: len(self)}[whence]
+        self._pos = min(max(base + offset, 0), len(self))
+        body_offset = self._pos - len(self._head)
+        self._stream.seek(self._start + min(max(body_offset, 0), self._size))
+        return self._pos
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = len(self) - self._pos
+        out = []
+        while size > 0 and self._pos < len(self):
+            head_len = len(self._head)
+            if self._pos < head_len:
+                piece = self._head[self._pos:self._pos + size]
+            elif self._pos < head_len + self._size:
+                piece = self._stream.read(min(size, head_len + self._size - self._pos))
+                if not piece:
+                    raise IOError("upload stream ended before its reported size")
+            else:
+                offset = self._pos - head_len - self._size
+                piece = self._tail[offset:offset + size]
+            out.append(piece)
+            self._pos += len(piece)
+            size -= len(piece)
+        return b"".join(out)
+
+
+class _PaddleConfig(NamedTuple):
+    url_file: str
+    url_by_url: str
+    timeout: int
+
+
+@functools.lru_cache(maxsize=1)
+def _paddle_config() -> _PaddleConfig:
+    """Environment/settings lookup, resolved once per process rather than per adapter."""
+    return _PaddleConfig(
+        url_file=os.getenv("PADDLE_OCR_URL", getattr(settings, "PADDLE_OCR_URL", "http://127.0.0.1:8089/ocr/receipt")),
+        url_by_url=os.getenv("PADDLE_OCR_URL_BY_URL", getattr(settings, "PADDLE_OCR_URL_BY_URL", "http://127.0.0.1:8089/ocr/receipt-by-url")),
+        timeout=int(os.getenv("OCR_TIMEOUT_SECONDS", getattr(settings, "OCR_TIMEOUT_SECONDS", 25))),
+    )
+
 
 class PaddleOCRHTTPAdapter(OCRProvider):
     def __init__(self):
-        self.url_file = os.getenv("PADDLE_OCR_URL", getattr(settings, "PADDLE_OCR_URL", "http://127.0.0.1:8089/ocr/receipt"))
-        self.url_by_url = os.getenv("PADDLE_OCR_URL_BY_URL", getattr(settings, "PADDLE_OCR_URL_BY_URL", "http://127.0.0.1:8089/ocr/receipt-by-url"))
-        self.timeout = int(os.getenv("OCR_TIMEOUT_SECONDS", getattr(settings, "OCR_TIMEOUT_SECONDS", 25)))
+        self.url_file, self.url_by_url, self.timeout = _paddle_config()
         self.retries = 3
+        # One pooled keep-alive session per adapter instead of a new connection per request;
+        # jittered exponential backoff keeps concurrent workers from retrying in lockstep
+        self._session = requests.Session()
+        retry = Retry(
+            total=self.retries,
+            backoff_factor=0.3,
+            backoff_jitter=0.5,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({"POST"}),
+            respect_retry_after_header=True,
+        )
+        pool = HTTPAdapter(pool_connections=20, pool_maxsize=50, max_retries=retry)
+        self._session.mount("http://", pool)
+        self._session.mount("https://", pool)
+        self._session.headers.update({"Connection": "keep-alive"})
 
     def _map(self, payload: Dict[str, Any], source_url: Optional[str], latency_ms: int) -> ReceiptExtraction:
-        return ReceiptExtraction(
-            engine="paddle",
-            merchant=payload.get("merchant"),
-            date=payload.get("date"),
-            total=payload.get("total"),
-            currency=payload.get("currency"),
-            tax=payload.get("tax"),
-            tax_rate=payload.get("tax_rate"),
-            subtotal=payload.get("subtotal"),
-            ocr_confidence=payload.get("ocr_confidence"),
-            raw_text=payload.get("raw_text"),
-            source_url=source_url,
-            latency_ms=latency_ms,
-            raw_response=payload,
-        )
+        # Service keys match the model's fields, so validate the payload in one
+        # pydantic-core pass; keys the model does not declare are ignored
+        return ReceiptExtraction.model_validate({
+            **payload,
+            "engine": "paddle",
+            "source_url": source_url,
+            "latency_ms": latency_ms,
+            "raw_response": payload,
+        })
+
+    def parse_receipt(self, *, file_bytes: Optional[bytes] = None, url: Optional[str] = None, options: Optional[Dict[str, Any]] = None, file_stream: Optional[IO[bytes]] = None) -> ReceiptExtraction:
+        """Parse a receipt from a URL, raw bytes, or a readable file object.
 
-    def parse_receipt(self, *, file_bytes: Optional[bytes] = None, url: Optional[str] = None, options: Optional[Dict[str, Any]] = None) -> ReceiptExtraction:
-        last_err: Optional[Exception] = None
-        assert (file_bytes is not None) or (url is not None), "Provide file_bytes or url"
-        for attempt in range(1, self.retries + 1):
-            try:
-                t0 = time.time()
-                if url:
-                    resp = requests.post(self.url_by_url, json={"url": url}, timeout=self.timeout)
+        Prefer ``file_stream`` for uploads: a seekable stream is sent in chunks
+        as the request body goes out, without first being read into memory.
+        """
+        if file_bytes is None and url is None and file_stream is None:
+            raise ValueError("Provide file_bytes, file_stream or url")
+        try:
+            t0 = time.perf_counter_ns()
+            if url:
+                resp = self._session.post(self.url_by_url, data=orjson.dumps({"url": url}), headers=_JSON_HEADERS, timeout=self.timeout)
+            else:
+                options = options or {}
+                # BytesIO over existing bytes shares the buffer rather than copying it
+                stream = file_stream if file_stream is not None else io.BytesIO(file_bytes)
+                filename = options.get("filename") or "receipt.jpg"
+                if stream.seekable():
+                    body = _MultipartFileBody("file", filename, options.get("content_type"), stream)
+                    resp = self._session.post(self.url_file, data=body, headers={"Content-Type": body.content_type}, timeout=self.timeout)
                 else:
-                    files = {"file": (options.get("filename") if options else "receipt.jpg", file_bytes)}
-                    resp = requests.post(self.url_file, files=files, timeout=self.timeout)
-                latency_ms = int((time.time() - t0) * 1000)
-                request_id = resp.headers.get("x-request-id") or resp.headers.get("X-Request-ID")
-                logger.info("PaddleOCRHTTPAdapter status=%s latency_ms=%s req_id=%s", resp.status_code, latency_ms, request_id)
-                resp.raise_for_status()
-                payload = resp.json()
-                if not payload.get("success", True):
-                    raise RuntimeError(f"Paddle service reported failure: {payload}")
-                return self._map(payload, source_url=url, latency_ms=latency_ms)
-            except Exception as e:
-                last_err = e
-                logger.warning("PaddleOCR attempt %s/%s failed: %s", attempt, self.retries, e)
-        raise RuntimeError(f"PaddleOCRHTTPAdapter failed after {self.retries} retries: {last_err}")
+                    files = {"file": (filename, stream, options.get("content_type"))}
+                    resp = self._session.post(self.url_file, files=files, timeout=self.timeout)
+            latency_ms = (time.perf_counter_ns() - t0) // 1_000_000
+            request_id = resp.headers.get("x-request-id") or resp.headers.get("X-Request-ID")
+            logger.info("PaddleOCRHTTPAdapter status=%s latency_ms=%s req_id=%s", resp.status_code, latency_ms, request_id)
+            resp.raise_for_status()
+            payload = orjson.loads(resp.content)
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
+            # RetryError, ConnectionError, Timeout, HTTPError once the session's retries are spent
+            logger.warning("PaddleOCR request failed: %s", e)
+            raise RuntimeError(f"PaddleOCRHTTPAdapter failed after {self.retries} retries: {e}") from e
+        if not payload.get("success", True):
+            raise RuntimeError(f"Paddle service reported failure: {payload}")
+        return self._map(payload, source_url=url, latency_ms=latency_ms)
+
+    async def parse_receipts_batch(self, items: List[Union[bytes, str]]) -> List[Union[ReceiptExtraction, Exception]]:
+        """Parse several receipts concurrently.
+
+        ``str`` items are treated as URLs and ``bytes`` as image content. Results
+        keep input order; an item that failed is returned as its exception.
+        """
+        # Connect errors are retried by the transport; the client is scoped to the
+        # batch because its pool is bound to the running event loop
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            retries=self.retries,
+            limits=httpx.Limits(max_connections=32),
+        )
+        async with httpx.AsyncClient(transport=transport, timeout=self.timeout) as client:
+            return await asyncio.gather(
+                *(self._parse_async(client, item) for item in items),
+                return_exceptions=True,
+            )
+
+    async def _parse_async(self, client: httpx.AsyncClient, item: Union[bytes, str]) -> ReceiptExtraction:
+        url = item if isinstance(item, str) else None
+        t0 = time.perf_counter_ns()
+        if url:
+            resp = await client.post(self.url_by_url, content=orjson.dumps({"url": url}), headers=_JSON_HEADERS)
+        else:
+            resp = await client.post(self.url_file, files={"file": ("receipt.jpg", item)})
+        latency_ms = (time.perf_counter_ns() - t0) // 1_000_000
+        logger.info("PaddleOCRHTTPAdapter batch status=%s latency_ms=%s req_id=%s", resp.status_code, latency_ms, resp.headers.get("x-request-id"))
+        resp.raise_for_status()
+        payload = orjson.loads(resp.content)
+        if not payload.get("success", True):
+            raise RuntimeError(f"Paddle service reported failure: {payload}")
+        return self._map(payload, source_url=url, latency_ms=latency_ms)
 
 
@@ -7,12 +7,20 @@ existing projects that expect `EnhancedPaddleOCRService.process_receipt_image(..
 
 from __future__ import annotations
 
+import copy
+import itertools
 import os
+import queue
 import re
+import sys
+import threading
 import time
 import hashlib
+from bisect import bisect_right
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
 
 # Optional deps
 try:
@@ -27,6 +35,11 @@ try:
 except Exception:  # pragma: no cover
     psutil = None  # type: ignore
 
+try:
+    import xxhash  # type: ignore
+except Exception:  # pragma: no cover
+    xxhash = None  # type: ignore
+
 try:
     # PaddleOCR is the only heavy dependency we rely on.
     from paddleocr import PaddleOCR  # type: ignore
@@ -37,17 +50,99 @@ except Exception:  # pragma: no cover
 # ----------------------------- Utilities -----------------------------
 
 def _sha(image_bgr: "np.ndarray") -> str:
+    """
+    64-bit identity hash of the pixel data, as 16 hex chars.
+    Not security-relevant, so use xxh3 when available and 8-byte BLAKE2b
+    otherwise; both are several times faster than SHA-256.
+    """
     if image_bgr is None:
         return ""
-    h = hashlib.sha256()
-    h.update(image_bgr.data.tobytes())
-    return h.hexdigest()[:16]
+    h = xxhash.xxh3_64() if xxhash is not None else hashlib.blake2b(digest_size=8)
+    # Hash the pixel buffer in place; ascontiguousarray only copies when the array is a strided view
+    h.update(np.ascontiguousarray(image_bgr))
+    return h.hexdigest()
 
 
 def _now() -> float:
     return time.time()
 
 
+def _trie_pattern(words: Any) -> str:
+    """
+    Regex alternation for `words` with shared prefixes factored out, e.g.
+    {"TOTAL", "TOTAL DUE", "TO PAY"} -> "TO(?: PAY|TAL(?: DUE)?)" (before escaping).
+    """
+    trie: Dict[str, Any] = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: Dict[str, Any]) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        if "" in node:
+            return "(?:" + "|".join(branches) + ")?"
+        if len(branches) == 1:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")"
+
+    return build(trie)
+
+
+# Linux exposes resident set size in /proc/self/statm (in pages)
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if sys.platform.startswith("linux") else 0
+
+
+def _rss_mb() -> float:
+    """Resident memory of this process in MiB, for tracing."""
+    if _PAGE_SIZE:
+        try:
+            with open("/proc/self/statm", "rb") as f:
+                return int(f.read().split()[1]) * _PAGE_SIZE / (1024 * 1024)
+        except OSError:
+            pass
+    if psutil is None:
+        return 0
+    return psutil.Process().memory_info().rss / (1024 * 1024)
+
+
+# End-of-stream marker passed between pipeline stages
+_DONE = object()
+
+
+def _sorted_boxes(boxes: List[Any]) -> List[Any]:
+    """Reading order for detected boxes: top to bottom, left to right within a line (as PaddleOCR does)."""
+    boxes = sorted(boxes, key=lambda b: (b[0][1], b[0][0]))
+    for i in range(len(boxes) - 1):
+        for j in range(i, -1, -1):
+            if abs(boxes[j + 1][0][1] - boxes[j][0][1]) < 10 and boxes[j + 1][0][0] < boxes[j][0][0]:
+                boxes[j], boxes[j + 1] = boxes[j + 1], boxes[j]
+            else:
+                break
+    return boxes
+
+
+def _crop_box(image_bgr: "np.ndarray", box: List[List[float]]) -> "np.ndarray":
+    """Perspective-crop one detected text box, rotating tall crops upright (as PaddleOCR does)."""
+    pts = np.array(box, dtype=np.float32)
+    width = int(max(np.linalg.norm(pts[0] - pts[1]), np.linalg.norm(pts[2] - pts[3])))
+    height = int(max(np.linalg.norm(pts[0] - pts[3]), np.linalg.norm(pts[1] - pts[2])))
+    target = np.float32([[0, 0], [width, 0], [width, height], [0, height]])
+    crop = cv2.warpPerspective(
+        image_bgr,
+        cv2.getPerspectiveTransform(pts, target),
+        (width, height),
+        borderMode=cv2.BORDER_REPLICATE,
+        flags=cv2.INTER_CUBIC,
+    )
+    if crop.shape[0] / max(1, crop.shape[1]) >= 1.5:
+        crop = np.rot90(crop)
+    return crop
+
+
 @dataclass
 class ExtractedReceipt:
     merchant: Optional[str] = None
@@ -61,6 +156,17 @@ class ExtractedReceipt:
     needs_review: bool = False
 
 
+class _Amount(NamedTuple):
+    """A money candidate in `_find_total`, with its line's keyword flags computed once."""
+    value: float
+    text: str
+    line_idx: int
+    has_currency: bool
+    priority_kw: bool
+    context_kw: bool
+    not_total: bool  # subtotal / VAT / TAX line
+
+
 # --------------------------- Main Service ----------------------------
 
 class EnhancedPaddleOCRService:
@@ -72,6 +178,11 @@ class EnhancedPaddleOCRService:
     # Money patterns
     MONEY_RX = re.compile(r"[£€$]?\s*\d{1,3}(?:,\d{3})*(?:\.\d{1,2})?p?\b", re.I)
     CURRENCY_MONEY_RX = re.compile(r"([£€$])\s*\d{1,3}(?:,\d{3})*(?:\.\d{1,2})?\b", re.I)
+    # MONEY_RX for scanning a whole receipt at once: the gap after the symbol may not cross a line break.
+    # Deliberately stdlib `re`: on receipt-sized text google-re2 measured ~3x slower for this
+    # finditer (and ~10x for the symbol scan), its per-call str/UTF-8 conversion outweighing the DFA.
+    _TEXT_MONEY_RX = re.compile(r"[£€$]?[^\S\n]*\d{1,3}(?:,\d{3})*(?:\.\d{1,2})?p?\b", re.I)
+    _CURRENCY_SYMBOL_RX = re.compile(r"[£€$]")
 
     # Date patterns (UK and ISO-ish)
     DATE_PATTERNS = [
@@ -80,18 +191,83 @@ class EnhancedPaddleOCRService:
         re.compile(r"\b\d{1,2}\s+[A-Za-z]{3,9}\s+\d{2,4}\b", re.I),  # 16 Sep 2022
     ]
 
+    # OCR look-alike letters mapped to the digits they usually are
+    _DIGIT_TRANS = str.maketrans({
+        "O": "0", "o": "0", "U": "0", "D": "0", "Q": "0",
+        "S": "5", "s": "5", "I": "1", "l": "1", "B": "8", "Z": "2"
+    })
+    # Same mapping for bytes.translate, which does not slow down on non-ASCII
+    # text the way str.translate does (a "£" costs str.translate its fast path)
+    _DIGIT_TRANS_BYTES = bytes.maketrans(b"OoUDQSsIlBZ", b"00000551182")
+
+    # Parsing helpers compiled once instead of per line / per call
+    _AMOUNT_CLEAN_RX = re.compile(r"[^\d.p]")
+    _MERCHANT_CLEAN_RX = re.compile(r"[^A-Z ]")
+    _MERCHANT_CLEAN_AMP_RX = re.compile(r"[^A-Z &]")
+    _VAT_RX = re.compile(r"\bVAT\b|\bTAX\b", re.I)
+    _CARD_RX = re.compile(r"\bCARD\b|MASTERCARD|VISA|CONTACTLESS", re.I)
+
+    # The date, VAT and card-payment patterns above, found in one pass over the
+    # text. Each alternative sits in a lookahead, so a match never consumes text
+    # another pattern could start in; the first hit per name is what the
+    # individual searches would have returned.
+    _DATE_FIELDS = ("date0", "date1", "date2")
+    _FIELDS_RX = re.compile(
+        "(?=" + "|".join(
+            f"(?P<{name}>{rx.pattern})"
+            for name, rx in (*zip(_DATE_FIELDS, DATE_PATTERNS), ("vat", _VAT_RX), ("card", _CARD_RX))
+        ) + ")",
+        re.I,
+    )
+    _FIELD_COUNT = len(_DATE_FIELDS) + 2
+
     # Keywords for total scoring
-    TOTAL_KW_PRIORITY = {"TOTAL", "AMOUNT DUE", "AMOUNT DUE:", "BALANCE DUE", "TO PAY", "CARD", "CASH", "CHANGE DUE", "TOTAL DUE"}
-    TOTAL_KW_CONTEXT = {"SUBTOTAL", "SUB-TOTAL", "DISCOUNT", "VAT", "TAX", "EPS"}
+    TOTAL_KW_PRIORITY = frozenset({"TOTAL", "AMOUNT DUE", "AMOUNT DUE:", "BALANCE DUE", "TO PAY", "CARD", "CASH", "CHANGE DUE", "TOTAL DUE"})
+    TOTAL_KW_CONTEXT = frozenset({"SUBTOTAL", "SUB-TOTAL", "DISCOUNT", "VAT", "TAX", "EPS"})
     TOTAL_KW = TOTAL_KW_PRIORITY | TOTAL_KW_CONTEXT
-    SUBTOTAL_KW = {"SUBTOTAL", "SUB-TOTAL"}
+    SUBTOTAL_KW = frozenset({"SUBTOTAL", "SUB-TOTAL"})
+
+    # Keyword sets compiled to one case-insensitive scan each; substring
+    # semantics match the `k in line.upper()` checks they replace
+    _PRIORITY_RX = re.compile(_trie_pattern(TOTAL_KW_PRIORITY), re.I)
+    _CONTEXT_RX = re.compile(_trie_pattern(TOTAL_KW_CONTEXT), re.I)
+    _NOT_TOTAL_RX = re.compile(_trie_pattern(SUBTOTAL_KW | {"VAT", "TAX"}), re.I)
 
     # Quick merchant dictionary (extend as needed)
     KNOWN_MERCHANTS = ["ASDA", "TESCO", "ALDI", "SAINSBURY", "MORRISONS", "LIDL", "ACE HARDWARE", "ACE", "COOP", "WALMART"]
 
-    def __init__(self, lang: str = "en", use_gpu: Optional[bool] = None) -> None:
+    # Recognized lines below this score are dropped (PaddleOCR's default drop_score)
+    DROP_SCORE = 0.5
+    # Longer image side handed to OCR; detector cost grows with H*W and phone
+    # photos of receipts are far larger than the text needs
+    OCR_MAX_SIDE = 1600
+
+    # Finished payloads keyed by (lang, image hash), so re-submitted images skip
+    # OCR. Shared by all instances since callers construct the service per call.
+    RESULT_CACHE_SIZE = 256
+    _result_cache: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+    _result_cache_lock = threading.Lock()
+
+    def __init__(
+        self,
+        lang: str = "en",
+        use_gpu: Optional[bool] = None,
+        max_batch: int = 16,
+        max_wait_ms: int = 50,
+        precision: str = "fp32",
+        cpu_threads: Optional[int] = None,
+    ) -> None:
         self.lang = lang
         self.use_gpu = bool(use_gpu) if use_gpu is not None else False
+        # "fp32" (default), "fp16" or "int8"; int8 on CPU needs quantized det/rec
+        # inference models, taken from PADDLE_OCR_DET_INT8_MODEL_DIR / PADDLE_OCR_REC_INT8_MODEL_DIR
+        self.precision = precision
+        # CPU inference threads; defaults to half the cores so concurrent workers don't oversubscribe
+        self.cpu_threads = cpu_threads or max(2, (os.cpu_count() or 2) // 2)
+        # Micro-batching for process_receipt_images_batch: flush at max_batch
+        # receipts or once the oldest queued one has waited max_wait_ms
+        self.max_batch = max(1, max_batch)
+        self.max_wait_ms = max(0, max_wait_ms)
         print(f"INFO: Initializing Enhanced PaddleOCR with PP-OCRv5 models (Lang={self.lang}, GPU={self.use_gpu})")
 
         if PaddleOCR is None:
@@ -101,34 +277,58 @@ class EnhancedPaddleOCRService:
             # PaddleOCR downloads proper models automatically. No explicit v5 flag,
             # but defaults are compatible with PP-OCR(mobile/server) pipelines.
             # Build kwargs based on PaddleOCR's signature to avoid 'Unknown argument' errors (Windows/env variations)
+            wanted: Dict[str, Any] = {
+                'use_angle_cls': True,
+                'lang': self.lang,
+                'use_gpu': self.use_gpu,
+                'show_log': False,
+            }
+            if not self.use_gpu:
+                # oneDNN (MKLDNN) kernels use AVX2/AVX-512/VNNI where the CPU has them;
+                # with precision="int8" on a VNNI host that roughly doubles throughput again
+                wanted['enable_mkldnn'] = True
+                wanted['cpu_threads'] = self.cpu_threads
+            if self.precision != "fp32":
+                wanted['precision'] = self.precision
+            if self.precision == "int8":
+                for key, env_var in (('det_model_dir', 'PADDLE_OCR_DET_INT8_MODEL_DIR'),
+                                     ('rec_model_dir', 'PADDLE_OCR_REC_INT8_MODEL_DIR')):
+                    if os.getenv(env_var):
+                        wanted[key] = os.getenv(env_var)
             try:
                 import inspect
                 sig = inspect.signature(PaddleOCR.__init__)
-                kwargs = {k: v for k, v in {
-                    'use_angle_cls': True,
-                    'lang': self.lang,
-                    'use_gpu': self.use_gpu,
-                    'show_log': False,
-                }.items() if k in sig.parameters}
+                # PaddleOCR 2.x takes everything through **kwargs
+                accepts_any = any(p.kind is inspect.Parameter.VAR_KEYWORD for p in sig.parameters.values())
+                kwargs = {k: v for k, v in wanted.items() if accepts_any or k in sig.parameters}
             except Exception:
                 kwargs = {'use_angle_cls': True, 'lang': self.lang}
                 if hasattr(PaddleOCR.__init__, '__code__') and 'use_gpu' in PaddleOCR.__init__.__code__.co_varnames:
                     kwargs['use_gpu'] = self.use_gpu
             self.ocr = PaddleOCR(**kwargs)
-        print(f"INFO: Enhanced PaddleOCR ready (lang={self.lang}, gpu={self.use_gpu})")
+        # Resolve once which per-call flags this PaddleOCR build's ocr() accepts
+        self._ocr_kwargs: Dict[str, Any] = {}
+        if self.ocr is not None:
+            try:
+                import inspect
+                params = set(inspect.signature(self.ocr.ocr).parameters)
+            except Exception:
+                params = set()
+            self._ocr_kwargs = {k: v for k, v in (('det', True), ('rec', True), ('cls', True)) if k in params}
+        print(f"INFO: Enhanced PaddleOCR ready (lang={self.lang}, gpu={self.use_gpu}, precision={self.precision})")
 
     # --------------------- OCR & Parsing helpers ---------------------
 
     def _norm_digits(self, s: str) -> str:
-        table = str.maketrans({
-            "O": "0", "o": "0", "U": "0", "D": "0", "Q": "0",
-            "S": "5", "s": "5", "I": "1", "l": "1", "B": "8", "Z": "2"
-        })
-        return s.translate(table)
-
-    def _to_float(self, s: str) -> Optional[float]:
-        s = self._norm_digits(s)
-        s_clean = re.sub(r"[^\d.p]", "", s.lower())
+        try:
+            return s.encode("latin-1").translate(self._DIGIT_TRANS_BYTES).decode("latin-1")
+        except UnicodeEncodeError:  # e.g. "€"
+            return s.translate(self._DIGIT_TRANS)
+
+    def _to_float(self, s: str, already_normalized: bool = False) -> Optional[float]:
+        if not already_normalized:
+            s = self._norm_digits(s)
+        s_clean = self._AMOUNT_CLEAN_RX.sub("", s.lower())
         if not s_clean:
             return None
         # pence like "50p"
@@ -148,63 +348,116 @@ class EnhancedPaddleOCRService:
             return None
 
     
-    def _extract_text(self, image_path: str) -> Tuple[str, List[Tuple[str, float]]]:
+    def _extract_text(self, image: Union[str, "np.ndarray"]) -> Tuple[str, List[Tuple[str, float]]]:
         """
-        Returns (full_text, [(line_text, confidence), ...])
+        Returns (full_text, [(line_text, confidence), ...]) for an image path or decoded BGR array.
         """
         if self.ocr is None:
             # Fallback: read bytes and pretend
             try:
-                with open(image_path, "rb") as f:
+                with open(image, "rb") as f:
                     data = f.read()
                 fake = f"FAKE_OCR_{len(data)}"
                 return fake, [(fake, 0.0)]
             except Exception:
                 return "", []
 
-        # Some PaddleOCR builds on Windows don't accept 'cls' or other kwargs.
-        # Try the safest call first, then progressively add flags only if needed.
-        result = None
-        errors = []
-        for kwargs in ({}, {'det': True, 'rec': True}, {'cls': True}, {'det': True, 'rec': True, 'cls': True}):
+        # Some PaddleOCR builds on Windows don't accept 'cls' or other kwargs;
+        # _ocr_kwargs only holds the ones the signature declares, and a bare call is the fallback.
+        try:
+            result = self.ocr.ocr(image, **self._ocr_kwargs)
+        except Exception as first:
+            if not self._ocr_kwargs:
+                raise RuntimeError(f"PaddleOCR.ocr failed: {first}") from first
             try:
-                result = self.ocr.ocr(image_path, **{k:v for k,v in kwargs.items()
-                                                     if k in getattr(self.ocr.ocr, '__code__', type('x',(object,),{'co_varnames':()})()).co_varnames})
-                break
-            except TypeError as e:
-                errors.append(str(e))
-                continue
+                result = self.ocr.ocr(image)
             except Exception as e:
-                errors.append(str(e))
-                continue
+                raise RuntimeError(f"PaddleOCR.ocr failed: {first} | {e}") from e
 
-        if result is None:
-            raise RuntimeError("PaddleOCR.ocr failed: " + " | ".join(errors))
-
-        lines: List[Tuple[str, float]] = []
-        for page in result:
-            for line in page:
-                txt = line[1][0] if isinstance(line, list) else ""
-                conf = float(line[1][1]) if isinstance(line, list) else 0.0
-                if txt:
-                    lines.append((txt.strip(), conf))
+        # PaddleOCR returns pages of [box, (text, score)]
+        try:
+            lines: List[Tuple[str, float]] = [
+                (line[1][0].strip(), float(line[1][1]))
+                for line in itertools.chain.from_iterable(result)
+                if line and line[1] and line[1][0]
+            ]
+        except (TypeError, IndexError):
+            # Unexpected shape (e.g. a None page when nothing was detected): walk it defensively
+            lines = []
+            for page in result or []:
+                for line in page or []:
+                    txt = line[1][0] if isinstance(line, list) else ""
+                    conf = float(line[1][1]) if isinstance(line, list) else 0.0
+                    if txt:
+                        lines.append((txt.strip(), conf))
         full_text = "\n".join(t for t, _ in lines)
         return full_text, lines
-    def _extract_date(self, full: str) -> Optional[str]:
-        from datetime import datetime
-        for pattern in self.DATE_PATTERNS:
-            m = pattern.search(full)
-            if not m:
+
+    def _extract_text_batch(self, images: List["np.ndarray"]) -> List[Tuple[str, List[Tuple[str, float]]]]:
+        """
+        OCR several decoded receipts, recognizing all their text boxes in one call.
+
+        PaddleOCR 2.x only accepts a list of images with detection switched
+        off, so detection runs per receipt and the crops from the whole batch
+        go through the recognizer together, which batches them internally.
+        """
+        crops: List["np.ndarray"] = []
+        owners: List[int] = []
+        for idx, img in enumerate(images):
+            detected = self.ocr.ocr(img, rec=False)
+            boxes = detected[0] if detected and detected[0] else []
+            for box in _sorted_boxes(boxes):
+                crops.append(_crop_box(img, box))
+                owners.append(idx)
+
+        per_image: List[List[Tuple[str, float]]] = [[] for _ in images]
+        if crops:
+            recognized = self.ocr.ocr([crops], det=False)[0]
+            for idx, (txt, conf) in zip(owners, recognized):
+                if txt and conf >= self.DROP_SCORE:
+                    per_image[idx].append((txt.strip(), float(conf)))
+        return [("\n".join(t for t, _ in lines), lines) for lines in per_image]
+
+    def _ocr_many(self, inputs: List[Union[str, "np.ndarray"]]) -> List[Any]:
+        """OCR a micro-batch; each entry is (full_text, lines) or the exception it raised."""
+        if len(inputs) > 1 and self.ocr is not None:
+            try:
+                return self._extract_text_batch(inputs)
+            except Exception:
+                pass  # retry one by one so a single bad receipt only fails itself
+        results: List[Any] = []
+        for image in inputs:
+            try:
+                results.append(self._extract_text(image))
+            except Exception as e:
+                results.append(e)
+        return results
+    def _scan_fields(self, text: str) -> Dict[str, str]:
+        """First match of each _FIELDS_RX pattern in `text`, by group name."""
+        found: Dict[str, str] = {}
+        for m in self._FIELDS_RX.finditer(text):
+            name = m.lastgroup
+            if name not in found:
+                found[name] = m.group(name)
+                if len(found) == self._FIELD_COUNT:
+                    break
+        return found
+
+    def _extract_date(self, full: str, fields: Optional[Dict[str, str]] = None) -> Optional[str]:
+        fields = self._scan_fields(full) if fields is None else fields
+        for name in self._DATE_FIELDS:
+            raw = fields.get(name)
+            if raw is None:
                 continue
-            raw = m.group()
+            slashed = raw.replace("-", "/")
             # Try common UK/ISO
-            candidates = [
-                ("%d/%m/%Y", raw.replace("-", "/")),
-                ("%d/%m/%y", raw.replace("-", "/")),
-                ("%Y/%m/%d", raw.replace("-", "/")),
+            candidates = (
+                ("%d/%m/%Y", slashed),
+                ("%d/%m/%y", slashed),
+                ("%Y/%m/%d", slashed),
                 ("%d %b %Y", raw),
                 ("%d %B %Y", raw),
-            ]
+            )
             for fmt, s in candidates:
                 try:
                     return datetime.strptime(s, fmt).strftime("%Y-%m-%d")
@@ -223,68 +476,91 @@ class EnhancedPaddleOCRService:
 
     def _find_merchant(self, lines: List[str]) -> Optional[str]:
         # Take the first block of up to 5 upper-ish lines, check against dictionary
-        for s in lines[:8]:
-            s_up = re.sub(r"[^A-Z ]", "", s.upper()).strip()
+        upper = [s.upper() for s in lines[:8]]
+        for s in upper:
+            s_up = self._MERCHANT_CLEAN_RX.sub("", s).strip()
             for m in self.KNOWN_MERCHANTS:
                 if m in s_up:
                     return m
         # fallback: the first upper line
-        for s in lines[:5]:
-            s_up = re.sub(r"[^A-Z &]", "", s.upper()).strip()
+        for s in upper[:5]:
+            s_up = self._MERCHANT_CLEAN_AMP_RX.sub("", s).strip()
             if len(s_up) >= 3:
                 return s_up[:40]
         return None
 
     def _find_total(self, lines: List[str]) -> Optional[float]:
         """Enhanced logic to find the total amount (PP-OCRv5 friendly)."""
-        amounts: List[Tuple[float, str, int, bool]] = []  # (value, line_text, line_index, has_currency)
-
-        for i, line in enumerate(lines):
-            line_norm = self._norm_digits(line)
-            has_currency = bool(self.CURRENCY_MONEY_RX.search(line_norm)) or any(sym in line_norm for sym in ('£','€','$'))
-            for m in self.MONEY_RX.finditer(line_norm):
-                val = self._to_float(m.group())
-                if val is not None:
-                    amounts.append((val, line, i, has_currency))
+        # Fast path for the common layout: walking up from the bottom, the first
+        # line with both a total keyword and a currency symbol holds the total
+        tail_start = max(0, len(lines) - 10)
+        for i in range(len(lines) - 1, tail_start - 1, -1):
+            line = lines[i]
+            if self._CURRENCY_SYMBOL_RX.search(line) and self._PRIORITY_RX.search(line):
+                values = [
+                    val
+                    for m in self._TEXT_MONEY_RX.finditer(self._norm_digits(line))
+                    if (val := self._to_float(m.group(), already_normalized=True)) is not None
+                ]
+                if values:
+                    return max(values)
+
+        amounts: List[_Amount] = []
+        line_flags: Dict[int, Tuple[bool, bool, bool]] = {}
+
+        # One scan over the whole receipt; match offsets map back to lines via their start offsets
+        text_norm = self._norm_digits("\n".join(lines))
+        line_starts = list(itertools.accumulate((len(line) + 1 for line in lines[:-1]), initial=0))
+        currency_lines = {bisect_right(line_starts, m.start()) - 1 for m in self._CURRENCY_SYMBOL_RX.finditer(text_norm)}
+        # Hot-loop lookups bound to locals
+        to_float = self._to_float
+        priority_search = self._PRIORITY_RX.search
+        context_search = self._CONTEXT_RX.search
+        not_total_search = self._NOT_TOTAL_RX.search
+        for m in self._TEXT_MONEY_RX.finditer(text_norm):
+            val = to_float(m.group(), already_normalized=True)
+            if val is not None:
+                i = bisect_right(line_starts, m.start()) - 1
+                line = lines[i]
+                flags = line_flags.get(i)
+                if flags is None:
+                    flags = line_flags[i] = (
+                        priority_search(line) is not None,
+                        context_search(line) is not None,
+                        not_total_search(line) is not None,
+                    )
+                amounts.append(_Amount(val, line, i, i in currency_lines, *flags))
 
         if not amounts:
             return None
 
-        def score(value: float, text: str, idx: int, has_currency: bool) -> tuple:
-            up = text.upper()
-            kw = 0
-            if any(k in up for k in self.TOTAL_KW_PRIORITY):
-                kw += 3
-            if any(k in up for k in self.TOTAL_KW_CONTEXT):
-                kw += 1
-            if has_currency:
-                kw += 2
-            return (kw, idx, value)
+        def score(a: _Amount) -> tuple:
+            return (3 * a.priority_kw + a.context_kw + 2 * a.has_currency, a.line_idx, a.value)
 
-        tail_start = max(0, len(lines) - 10)
-        tail = [a for a in amounts if a[2] >= tail_start]
+        tail = [a for a in amounts if a.line_idx >= tail_start]
         if tail:
-            best = max(tail, key=lambda a: score(*a))
-            if score(*best)[0] >= 2:
-                return best[0]
+            best = max(tail, key=score)
+            if score(best)[0] >= 2:
+                return best.value
 
-        curr = [a for a in amounts if a[3]]
+        curr = [a for a in amounts if a.has_currency]
         if curr:
-            curr.sort(key=lambda a: (a[2], a[0]))
+            curr.sort(key=lambda a: (a.line_idx, a.value))
             for cand in reversed(curr):
-                if any(k in cand[1].upper() for k in self.TOTAL_KW_PRIORITY):
-                    return cand[0]
-            return curr[-1][0]
+                if cand.priority_kw:
+                    return cand.value
+            return curr[-1].value
 
-        safe = [a for a in amounts if not any(k in a[1].upper() for k in (['VAT','TAX'] + list(self.SUBTOTAL_KW)))]
+        safe = [a for a in amounts if not a.not_total]
         if safe:
-            return max(safe, key=lambda a: a[0])[0]
+            return max(safe, key=lambda a: a.value).value
 
-        return max(amounts, key=lambda a: a[0])[0]
+        return max(amounts, key=lambda a: a.value).value
 
-    def _vat_details(self, text: str) -> Optional[str]:
+    def _vat_details(self, text: str, fields: Optional[Dict[str, str]] = None) -> Optional[str]:
         # Simple VAT presence indicator
-        if re.search(r"\bVAT\b|\bTAX\b", text, re.I):
+        fields = self._scan_fields(text) if fields is None else fields
+        if "vat" in fields:
             return "VAT/TAX detected"
         return None
 
@@ -299,26 +575,195 @@ class EnhancedPaddleOCRService:
         start = _now()
 
         if cv2 is None or np is None:
-            return {
-                "success": False,
-                "message": "OpenCV / NumPy not available",
-                "processing_time": 0.0,
-            }
+            return self._missing_deps_payload()
 
         img = cv2.imread(image_path)
         if img is None:
-            return {"success": False, "message": "Image not found", "processing_time": 0.0}
+            return self._not_found_payload()
+
+        img_hash = _sha(img)
+        cached = self._cached_payload(img_hash, start)
+        if cached is not None:
+            return cached
+
+        full_text, lines_with_conf = self._extract_text(self._ocr_input(image_path, img))
+        return self._build_payload(img, img_hash, full_text, lines_with_conf, start)
+
+    def process_receipt_images(self, image_paths: List[str], queue_size: int = 4) -> List[Dict[str, Any]]:
+        """
+        Pipelined `process_receipt_image` over several receipts.
+
+        Decoding + hashing and OCR each run on their own thread and parsing runs
+        on the caller's, linked by bounded queues, so consecutive receipts
+        overlap instead of waiting on PaddleOCR one by one. Results come back in
+        input order; a receipt whose OCR fails gets an unsuccessful payload
+        rather than aborting the batch.
+        """
+        return self._run_pipeline(image_paths, queue_size, max_batch=1, max_wait_ms=0)
+
+    def process_receipt_images_batch(
+        self,
+        image_paths: List[str],
+        max_batch: Optional[int] = None,
+        max_wait_ms: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Like `process_receipt_images`, but the OCR stage takes receipts in
+        micro-batches of up to `max_batch`, flushing early once the oldest has
+        waited `max_wait_ms`. Defaults come from the constructor.
+        """
+        max_batch = self.max_batch if max_batch is None else max(1, max_batch)
+        max_wait_ms = self.max_wait_ms if max_wait_ms is None else max(0, max_wait_ms)
+        return self._run_pipeline(image_paths, 2 * max_batch, max_batch, max_wait_ms)
+
+    def _run_pipeline(
+        self,
+        image_paths: List[str],
+        queue_size: int,
+        max_batch: int,
+        max_wait_ms: int,
+    ) -> List[Dict[str, Any]]:
+        if cv2 is None or np is None:
+            return [self._missing_deps_payload() for _ in image_paths]
+
+        decoded: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        recognized: "queue.Queue" = queue.Queue(maxsize=queue_size)
+
+        def load() -> None:
+            try:
+                for idx, path in enumerate(image_paths):
+                    start = _now()
+                    img = cv2.imread(path)
+                    img_hash = _sha(img)
+                    cached = self._cached_payload(img_hash, start) if img is not None else None
+                    ocr_input = self._ocr_input(path, img) if img is not None and cached is None else None
+                    decoded.put((idx, path, start, img, img_hash, cached, ocr_input))
+            finally:
+                decoded.put(_DONE)
+
+        def next_batch() -> List[Any]:
+            first = decoded.get()
+            if first is _DONE:
+                return []
+            batch = [first]
+            deadline = time.monotonic() + max_wait_ms / 1000.0
+            while len(batch) < max_batch:
+                try:
+                    item = decoded.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is _DONE:
+                    decoded.put(_DONE)  # seen again by the next call, which ends the stage
+                    break
+                batch.append(item)
+            return batch
+
+        def recognize() -> None:
+            try:
+                while batch := next_batch():
+                    readable = [item for item in batch if item[3] is not None and item[5] is None]
+                    ocr_results = self._ocr_many([item[6] for item in readable])
+                    by_idx = {item[0]: ocr for item, ocr in zip(readable, ocr_results)}
+                    for idx, _path, start, img, img_hash, cached, _ocr_input in batch:
+                        recognized.put((idx, start, img, img_hash, cached if cached is not None else by_idx.get(idx)))
+            finally:
+                recognized.put(_DONE)
+
+        stages = [
+            threading.Thread(target=load, name="receipt-ocr-load", daemon=True),
+            threading.Thread(target=recognize, name="receipt-ocr-infer", daemon=True),
+        ]
+        for stage in stages:
+            stage.start()
+
+        results: List[Dict[str, Any]] = [self._not_found_payload() for _ in image_paths]
+        while (item := recognized.get()) is not _DONE:
+            idx, start, img, img_hash, ocr = item
+            if img is None:
+                continue
+            if isinstance(ocr, dict):  # cache hit
+                results[idx] = ocr
+                continue
+            if isinstance(ocr, Exception):
+                results[idx] = {"success": False, "message": str(ocr), "processing_time": round(_now() - start, 3)}
+                continue
+            full_text, lines_with_conf = ocr
+            results[idx] = self._build_payload(img, img_hash, full_text, lines_with_conf, start)
+
+        for stage in stages:
+            stage.join()
+        return results
+
+    def _ocr_input(self, image_path: str, img: "np.ndarray") -> Union[str, "np.ndarray"]:
+        """
+        What to hand PaddleOCR: the already-decoded (and possibly downscaled)
+        array, so the file is not read and decoded a second time.
+        """
+        if self.ocr is None:
+            return image_path  # the dummy OCR reads the file itself
+        small = self._downscale(img)
+        return small if small is not None else img
+
+    def _downscale(self, img: "np.ndarray") -> Optional["np.ndarray"]:
+        """
+        Copy of `img` shrunk so its longer side is OCR_MAX_SIDE, or None when it
+        is already small enough. The original stays the source for hashing and
+        reported dimensions.
+        """
+        scale = self.OCR_MAX_SIDE / max(img.shape[:2])
+        if scale >= 1.0:
+            return None
+        return cv2.resize(img, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+
+    def _missing_deps_payload(self) -> Dict[str, Any]:
+        return {
+            "success": False,
+            "message": "OpenCV / NumPy not available",
+            "processing_time": 0.0,
+        }
+
+    def _not_found_payload(self) -> Dict[str, Any]:
+        return {"success": False, "message": "Image not found", "processing_time": 0.0}
+
+    def _cached_payload(self, img_hash: str, start: float) -> Optional[Dict[str, Any]]:
+        """Copy of the cached payload for this image, with a fresh processing_time."""
+        key = (self.lang, img_hash)
+        with self._result_cache_lock:
+            payload = self._result_cache.get(key)
+            if payload is None:
+                return None
+            self._result_cache.move_to_end(key)
+        payload = copy.deepcopy(payload)
+        payload["processing_time"] = round(_now() - start, 3)
+        return payload
 
-        full_text, lines_with_conf = self._extract_text(image_path)
+    def _remember_payload(self, img_hash: str, payload: Dict[str, Any]) -> None:
+        key = (self.lang, img_hash)
+        with self._result_cache_lock:
+            self._result_cache[key] = copy.deepcopy(payload)
+            self._result_cache.move_to_end(key)
+            while len(self._result_cache) > self.RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+
+    def _build_payload(
+        self,
+        img: "np.ndarray",
+        img_hash: str,
+        full_text: str,
+        lines_with_conf: List[Tuple[str, float]],
+        start: float,
+    ) -> Dict[str, Any]:
+        """Parse OCR output into the flattened receipt payload."""
         lines = [t for t, _ in lines_with_conf]
         avg_conf = round(sum(c for _, c in lines_with_conf) / max(1, len(lines_with_conf)) * 100.0, 1) if lines_with_conf else 0.0
 
+        fields = self._scan_fields(full_text)
         rec = ExtractedReceipt()
         rec.currency = self._guess_currency(full_text)
-        rec.date = self._extract_date(full_text)
+        rec.date = self._extract_date(full_text, fields)
         rec.total = self._find_total(lines)
         rec.merchant = self._find_merchant(lines)
-        rec.payment_method = "CARD" if re.search(r"\bCARD\b|MASTERCARD|VISA|CONTACTLESS", full_text, re.I) else None
+        rec.payment_method = "CARD" if "card" in fields else None
         rec.receipt_type = "thermal" if img.shape[1] <= 900 and img.shape[0] > img.shape[1] else "a4"
         rec.confidence = avg_conf
         rec.needs_review = rec.total is None or rec.merchant is None
@@ -346,13 +791,14 @@ class EnhancedPaddleOCRService:
             "payment_method": rec.payment_method,
             "is_thermal": rec.receipt_type == "thermal",
             "layout_type": rec.receipt_type,
-            "vat_info": self._vat_details(full_text),
+            "vat_info": self._vat_details(full_text, fields),
 
             # tracing
             "raw_text": full_text,
-            "image_hash": _sha(img),
+            "image_hash": img_hash,
             "image_dimensions": f"{img.shape[1]}x{img.shape[0]}",
-            "rss_mb": psutil.Process(os.getpid()).memory_info().rss / (1024 * 1024) if psutil else 0,
+            "rss_mb": _rss_mb(),
         }
         # DO NOT include 'category' to avoid legacy OCRData(**payload) errors
+        self._remember_payload(img_hash, payload)
         return payload
@@ -6,20 +6,353 @@ Users can choose their preferred OCR method.
 
 import os
 import re
+import time
+import asyncio
+import copy
+import hashlib
+import tempfile
+import threading
+import weakref
+import httpx
 import requests
 import base64
-import json
+import functools
+import orjson
+from collections import OrderedDict
 from typing import Optional, Dict, Any, List, Tuple
 from decimal import Decimal
 from datetime import datetime
 import logging
 from enum import Enum
 
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 from django.conf import settings
+from django.core.cache import cache
 from domain.receipts.entities import OCRData
 
 logger = logging.getLogger(__name__)
 
+# Process-wide LRU caches; OCRService is constructed per request so they cannot live on the instance.
+OCR_CACHE_SIZE = 1024
+_text_cache: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+_parse_cache: "OrderedDict[str, OCRData]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+# Receipt parsing patterns, tried in order per line
+_ADDR_DIGIT_RX = re.compile(r'\d{4,}')
+# Total amount tiers by priority: labelled amounts, then currency-marked ones, then any number
+_TOTAL_TIERS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'(?:total|amount)[:\s]*£?\s*(\d+\.?\d*)',
+    r'£\s*(\d+\.?\d*)|(\d+\.?\d*)\s*£',
+    r'(\d+\.?\d*)',
+))
+# UK date patterns in priority order. Each optional lookahead captures that
+# format's leftmost match on the line, so one match() call covers all three.
+_DATE_RX = re.compile(
+    r'(?=.*?(?P<dmy>(?<!\d)(?P<dmy_d>\d{1,2})[/-](?P<dmy_m>\d{1,2})[/-](?P<dmy_y>\d{2,4})(?!\d)))?'  # DD/MM/YYYY or DD-MM-YYYY
+    r'(?=.*?(?P<dmn>(?<!\d)(?P<dmn_d>\d{1,2})\s+(?P<dmn_m>\w+)\s+(?P<dmn_y>\d{2,4})(?!\d)))?'  # DD Month YYYY
+    r'(?=.*?(?P<ymd>(?P<ymd_y>\d{4})-(?P<ymd_m>\d{1,2})-(?P<ymd_d>\d{1,2})))?'  # YYYY-MM-DD
+)
+_DATE_FORMATS = tuple((name, (f'{name}_d', f'{name}_m', f'{name}_y')) for name in ('dmy', 'dmn', 'ymd'))
+_MONTHS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4,
+    'may': 5, 'jun': 6, 'jul': 7, 'aug': 8,
+    'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
+}
+_VAT_AMOUNT_RXS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'vat[:\s]*£?\s*(\d+\.?\d*)',
+    r'tax[:\s]*£?\s*(\d+\.?\d*)',
+    r'gst[:\s]*£?\s*(\d+\.?\d*)',
+))
+# Case-sensitive: the country prefix must be upper case
+_VAT_NUMBER_RXS = tuple(re.compile(p) for p in (
+    r'vat\s*no[:\s]*([A-Z]{2}\d{9,12})',
+    r'vat\s*number[:\s]*([A-Z]{2}\d{9,12})',
+    r'([A-Z]{2}\d{9,12})',
+))
+_RECEIPT_NUMBER_RXS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'receipt[:\s]*#?\s*(\d+)',
+    r'invoice[:\s]*#?\s*(\d+)',
+    r'transaction[:\s]*#?\s*(\d+)',
+    r'(\d{6,})',  # Generic 6+ digit number
+))
+_ITEM_RX = re.compile(r'(.+?)\s+£?\s*(\d+\.?\d*)$')
+
+
+def _to_money(text: str) -> Decimal:
+    """Decimal for an accepted amount; candidates are screened as floats first."""
+    return Decimal(text)
+
+
+def _digest_file(path: str) -> Optional[str]:
+    """BLAKE2b content hash of a file, or None if it cannot be read."""
+    try:
+        h = hashlib.blake2b(digest_size=16)
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+        return h.hexdigest()
+    except OSError:
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def _http_session() -> requests.Session:
+    """
+    Process-wide pooled session for OpenAI and image downloads.
+    
+    Keeps TLS connections alive across OCRService instances and retries
+    rate-limit and transient server errors with exponential backoff.
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET", "POST"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    pool = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry)
+    session.mount("http://", pool)
+    session.mount("https://", pool)
+    return session
+
+
+_OPENAI_CHAT_URL = "https://api.openai.com/v1/chat/completions"
+_OPENAI_ATTEMPTS = 3
+_OPENAI_MAX_BACKOFF = 16
+
+
+class _RequestPacer:
+    """
+    Thread-safe limiter spacing request starts at least 1/rate seconds apart.
+    
+    reserve() books the next free slot and returns how long the caller has to
+    wait for it, so blocking and async callers can share one limiter.
+    """
+    
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate
+        self._next = 0.0
+        self._lock = threading.Lock()
+    
+    def reserve(self) -> float:
+        """Book the next slot and return the delay in seconds until it starts."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.interval
+            return slot - now
+
+
+@functools.lru_cache(maxsize=1)
+def _openai_rate_limiter() -> _RequestPacer:
+    """Process-wide pacer; the OpenAI quota applies to the whole key, not one service."""
+    return _RequestPacer(float(getattr(settings, 'OCR_OPENAI_MAX_RPS', 5)))
+
+
+# asyncio semaphores are bound to one event loop, so keep one per running loop
+_openai_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+
+def _openai_semaphore() -> asyncio.Semaphore:
+    """Cap on concurrent OpenAI calls for the running event loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _openai_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(int(getattr(settings, 'OCR_MAX_CONCURRENCY', 4)))
+        _openai_semaphores[loop] = semaphore
+    return semaphore
+
+
+def _is_rate_limited(response) -> bool:
+    """429s, and quota errors OpenAI sometimes reports under other statuses."""
+    if response.status_code == 429:
+        return True
+    if response.status_code < 400:
+        return False
+    text = response.text.lower()
+    return 'quota' in text or 'rate limit' in text
+
+
+def _max_ocr_bytes() -> int:
+    """Largest image, in bytes, that is sent to an OCR engine."""
+    return getattr(settings, 'MAX_OCR_BYTES', 10 * 1024 * 1024)
+
+
+def _oversized_error(size: int) -> Optional[str]:
+    """Error message for an image over MAX_OCR_BYTES, or None if it fits."""
+    max_bytes = _max_ocr_bytes()
+    if size > max_bytes:
+        return f"Image is too large for OCR ({size} bytes, limit {max_bytes})"
+    return None
+
+
+def _file_oversized_error(image_path: str) -> Optional[str]:
+    """_oversized_error for a file on disk; unreadable files are left to the engines."""
+    try:
+        return _oversized_error(os.path.getsize(image_path))
+    except OSError:
+        return None
+
+
+def _iter_capped(response, chunk_size: int):
+    """
+    Yield the decoded body of a streamed response, refusing it past MAX_OCR_BYTES.
+    
+    A declared Content-Length is checked before reading; the body is then read
+    in chunks and abandoned as soon as it passes the limit.
+    """
+    max_bytes = _max_ocr_bytes()
+    declared = response.headers.get('Content-Length', '')
+    size_error = _oversized_error(int(declared)) if declared.isdigit() else None
+    if size_error:
+        raise ValueError(size_error)
+    received = 0
+    for chunk in response.iter_content(chunk_size=chunk_size):
+        received += len(chunk)
+        if received > max_bytes:
+            raise ValueError(f"Image is too large for OCR (over {max_bytes} bytes)")
+        yield chunk
+
+
+def _download_capped(image_url: str, timeout: int) -> bytes:
+    """Download an image into memory, refusing bodies over MAX_OCR_BYTES."""
+    with _http_session().get(image_url, timeout=timeout, stream=True) as response:
+        response.raise_for_status()
+        return b''.join(_iter_capped(response, chunk_size=1 << 16))
+
+
+def _paddle_conf_threshold() -> float:
+    """Minimum recognition confidence for a PaddleOCR line to be kept."""
+    return float(getattr(settings, 'OCR_PADDLE_CONF', 0.5))
+
+
+# Stand-in for the image URL inside the serialized OpenAI payload; swapped for a
+# base64 data URL or a remote URL
+_IMAGE_PLACEHOLDER = "__RECEIPT_IMAGE_URL__"
+_DATA_URL_PREFIX = b"data:image/jpeg;base64,"
+# Multiple of 3 so per-chunk base64 encodings concatenate without padding
+_B64_CHUNK = 3 * (1 << 18)
+# Re-encode quality for downscaled OCR input; plenty for printed receipt text
+_OCR_JPEG_QUALITY = 85
+
+_OPENAI_VISION_PROMPT = (
+    "Extract all text from this receipt image.\n"
+    "Focus on identifying:\n"
+    "- Merchant/store name\n"
+    "- Date\n"
+    "- Receipt/invoice number\n"
+    "- Individual items and prices\n"
+    "- Subtotal, VAT, and total amounts\n"
+    "- Any VAT numbers\n"
+    "Return the text exactly as it appears on the receipt."
+)
+_OPENAI_VISION_PAYLOAD = {
+    "model": "gpt-4-vision-preview",
+    "messages": [
+        {
+            "role": "user",
+            "content": [
+                {"type": "text", "text": _OPENAI_VISION_PROMPT},
+                {
+                    "type": "image_url",
+                    "image_url": {"url": _IMAGE_PLACEHOLDER}
+                }
+            ]
+        }
+    ],
+    "max_tokens": 1000
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _openai_vision_body_parts() -> Tuple[bytes, bytes]:
+    """The serialized OpenAI Vision payload, split around _IMAGE_PLACEHOLDER."""
+    prefix, suffix = orjson.dumps(_OPENAI_VISION_PAYLOAD).split(_IMAGE_PLACEHOLDER.encode('ascii'))
+    return prefix, suffix
+
+
+def _openai_vision_body(image_path: str) -> bytearray:
+    """
+    JSON body for the OpenAI Vision request with the image's base64 spliced in.
+
+    The file is encoded chunk by chunk straight into a pre-sized buffer, so
+    neither the raw image nor a str copy of its base64 is ever held whole.
+    """
+    prefix, suffix = _openai_vision_body_parts()
+    prefix += _DATA_URL_PREFIX
+    encoded_size = 4 * -(-os.path.getsize(image_path) // 3)
+    body = bytearray(len(prefix) + encoded_size + len(suffix))
+    body[:len(prefix)] = prefix
+    pos = len(prefix)
+    with open(image_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_B64_CHUNK), b''):
+            encoded = base64.b64encode(chunk)
+            body[pos:pos + len(encoded)] = encoded
+            pos += len(encoded)
+    # Also corrects the length if the file changed size while being read
+    body[pos:] = suffix
+    return body
+
+
+def _openai_vision_url_body(image_url: str) -> bytes:
+    """JSON body for the OpenAI Vision request pointing at a remote image URL."""
+    prefix, suffix = _openai_vision_body_parts()
+    # orjson.dumps quotes the string; the placeholder already sits inside quotes
+    return prefix + orjson.dumps(image_url)[1:-1] + suffix
+
+
+def _downscale_for_ocr(image_path: str) -> Optional[str]:
+    """
+    Write a JPEG copy of the image shrunk to OCR_MAX_IMAGE_SIDE on its long side.
+
+    Returns the temporary file's path, or None when the original should be
+    used as is: already small enough, not a decodable image, or no Pillow.
+    """
+    try:
+        from PIL import Image, ImageOps
+    except ImportError:
+        return None
+    
+    max_side = int(getattr(settings, 'OCR_MAX_IMAGE_SIDE', 1600))
+    temp_path = None
+    try:
+        with Image.open(image_path) as im:
+            if max(im.size) <= max_side:
+                return None
+            # Let the JPEG decoder scale by a power of two while decoding
+            im.draft('RGB', (max_side, max_side))
+            im = ImageOps.exif_transpose(im)
+            im.thumbnail((max_side, max_side), Image.LANCZOS)
+            with tempfile.NamedTemporaryFile(prefix='receipt_ocr_', suffix='.jpg', delete=False) as f:
+                temp_path = f.name
+                im.convert('RGB').save(f, 'JPEG', quality=_OCR_JPEG_QUALITY, optimize=True)
+        return temp_path
+    except Exception as e:
+        logger.debug(f"Could not downscale {image_path} for OCR: {e}")
+        if temp_path and os.path.exists(temp_path):
+            os.remove(temp_path)
+        return None
+
+
+def _lru_get(store: OrderedDict, key):
+    with _cache_lock:
+        value = store.get(key)
+        if value is not None:
+            store.move_to_end(key)
+        return value
+
+
+def _lru_put(store: OrderedDict, key, value) -> None:
+    with _cache_lock:
+        store[key] = value
+        store.move_to_end(key)
+        while len(store) > OCR_CACHE_SIZE:
+            store.popitem(last=False)
+
 
 class OCRMethod(Enum):
     """Available OCR methods."""
@@ -31,6 +364,12 @@ class OCRMethod(Enum):
 class OCRService:
     """Service for OCR processing of receipts with multiple engine support."""
     
+    # In-process PaddleOCR engine, loaded on first use and shared by every
+    # instance; views build an OCRService per request
+    _paddle = None
+    _paddle_loaded = False
+    _paddle_lock = threading.Lock()
+    
     def __init__(self, preferred_method: OCRMethod = OCRMethod.PADDLE_OCR):
         """
         Initialize OCR service.
@@ -39,40 +378,83 @@ class OCRService:
             preferred_method: Preferred OCR method to use
         """
         self.preferred_method = preferred_method
-        self.paddle_ocr_engine = None
         self.openai_api_key = getattr(settings, 'OPENAI_API_KEY', None)
         self._initialize_engines()
     
     def _initialize_engines(self):
         """Initialize all available OCR engines."""
-        # Initialize PaddleOCR
-        self._initialize_paddle_ocr()
+        # PaddleOCR is loaded lazily on first use, see paddle_ocr_engine
         
         # Check OpenAI API key availability
         if not self.openai_api_key:
             logger.warning("OpenAI API key not configured, OpenAI Vision API will not be available")
     
-    def _initialize_paddle_ocr(self):
+    @property
+    def paddle_ocr_engine(self):
+        """The shared PaddleOCR engine, or None if it is not available."""
+        return self._get_paddle()
+    
+    @classmethod
+    def _get_paddle(cls):
+        """Load the PaddleOCR engine once per process; a failed load is not retried."""
+        if not cls._paddle_loaded:
+            with cls._paddle_lock:
+                if not cls._paddle_loaded:
+                    cls._paddle = cls._initialize_paddle_ocr()
+                    cls._paddle_loaded = True
+        return cls._paddle
+    
+    @classmethod
+    def _initialize_paddle_ocr(cls):
         """Initialize the PaddleOCR engine."""
         try:
             from paddleocr import PaddleOCR
             
-            self.paddle_ocr_engine = PaddleOCR(
-                lang='en',
-                use_angle_cls=True,
-                use_gpu=False  # Use CPU for better compatibility
-            )
+            engine = PaddleOCR(**cls._paddle_ocr_options(PaddleOCR))
             logger.info("PaddleOCR initialized successfully")
+            return engine
             
         except ImportError:
             logger.warning("PaddleOCR not available - please install with: pip install paddlepaddle paddleocr")
             logger.info("Falling back to OpenAI Vision API or fallback OCR methods")
-            self.paddle_ocr_engine = None
+            return None
         except Exception as e:
             logger.error(f"Failed to initialize PaddleOCR: {e}")
             logger.warning("Falling back to OpenAI Vision API or fallback OCR methods")
-            self.paddle_ocr_engine = None
+            return None
 
+    @staticmethod
+    def _paddle_ocr_options(paddle_ocr_cls) -> Dict[str, Any]:
+        """
+        Constructor options for the installed PaddleOCR build.
+        
+        Runs on CPU with oneDNN kernels, a bounded thread count and single-line
+        recognition batches, which don't parallelize on CPU but each allocate
+        their own arena. Builds that declare `enable_hpi` (PaddleOCR 3.x) pick
+        their fastest runtime themselves.
+        """
+        wanted: Dict[str, Any] = {
+            'lang': 'en',
+            'use_angle_cls': True,
+            'use_gpu': False,  # Use CPU for better compatibility
+            'enable_mkldnn': True,
+            'cpu_threads': int(getattr(settings, 'OCR_PADDLE_CPU_THREADS', 0)) or max(2, (os.cpu_count() or 2) // 2),
+            'rec_batch_num': 1,
+            # Filter low-confidence lines inside the runtime instead of in Python
+            'drop_score': _paddle_conf_threshold(),
+        }
+        try:
+            import inspect
+            params = inspect.signature(paddle_ocr_cls.__init__).parameters
+        except (TypeError, ValueError):
+            return wanted
+        if 'enable_hpi' in params:
+            wanted['enable_hpi'] = True
+        # PaddleOCR 2.x takes everything through **kwargs
+        if any(p.kind is inspect.Parameter.VAR_KEYWORD for p in params.values()):
+            return wanted
+        return {k: v for k, v in wanted.items() if k in params}
+    
     def _normalize_url(self, url: str) -> str:
         """Ensure the image URL is absolute and reachable by external services.
 
@@ -94,6 +476,29 @@ class OCRService:
         except Exception:
             return url
     
+    def _openai_vision_headers(self) -> Dict[str, str]:
+        """Headers for the OpenAI chat completions API."""
+        return {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self.openai_api_key}"
+        }
+    
+    def _openai_vision_request(self, image_path: str) -> Tuple[Dict[str, str], bytearray]:
+        """Headers and JSON body for an OpenAI Vision transcription of the image."""
+        # The prompt is serialized once; the image is base64-encoded straight into the body
+        return self._openai_vision_headers(), _openai_vision_body(image_path)
+    
+    def _openai_vision_result(self, response) -> Tuple[bool, Optional[str], Optional[str]]:
+        """Map a requests or httpx response from the chat completions API."""
+        if response.status_code == 200:
+            result = orjson.loads(response.content)
+            extracted_text = result['choices'][0]['message']['content']
+            return True, extracted_text, None
+        else:
+            error_msg = f"OpenAI API error: {response.status_code} - {response.text}"
+            logger.error(error_msg)
+            return False, None, error_msg
+    
     def _extract_with_openai_vision(self, image_path: str) -> Tuple[bool, Optional[str], Optional[str]]:
         """
         Extract text using OpenAI Vision API.
@@ -108,68 +513,103 @@ class OCRService:
             return False, None, "OpenAI API key not configured"
         
         try:
-            # Read and encode the image
-            with open(image_path, "rb") as image_file:
-                image_data = base64.b64encode(image_file.read()).decode('utf-8')
-            
-            # Prepare the API request
-            headers = {
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {self.openai_api_key}"
-            }
-            
-            payload = {
-                "model": "gpt-4-vision-preview",
-                "messages": [
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": """Extract all text from this receipt image. 
-                                Focus on identifying:
-                                - Merchant/store name
-                                - Date
-                                - Receipt/invoice number
-                                - Individual items and prices
-                                - Subtotal, VAT, and total amounts
-                                - Any VAT numbers
-                                Return the text exactly as it appears on the receipt."""
-                            },
-                            {
-                                "type": "image_url",
-                                "image_url": {
-                                    "url": f"data:image/jpeg;base64,{image_data}"
-                                }
-                            }
-                        ]
-                    }
-                ],
-                "max_tokens": 1000
-            }
+            headers, body = self._openai_vision_request(image_path)
             
             # Make the API request
-            response = requests.post(
-                "https://api.openai.com/v1/chat/completions",
+            delay = _openai_rate_limiter().reserve()
+            if delay:
+                time.sleep(delay)
+            response = _http_session().post(
+                _OPENAI_CHAT_URL,
                 headers=headers,
-                json=payload,
+                data=body,
                 timeout=30
             )
-            
-            if response.status_code == 200:
-                result = response.json()
-                extracted_text = result['choices'][0]['message']['content']
-                return True, extracted_text, None
-            else:
-                error_msg = f"OpenAI API error: {response.status_code} - {response.text}"
-                logger.error(error_msg)
-                return False, None, error_msg
+            return self._openai_vision_result(response)
                 
         except Exception as e:
             error_msg = f"OpenAI Vision API processing failed: {e}"
             logger.error(error_msg)
             return False, None, error_msg
     
+    def _extract_with_openai_vision_url(self, image_url: str) -> Tuple[bool, Optional[str], Optional[str]]:
+        """
+        Extract text using OpenAI Vision API, letting OpenAI fetch the image itself.
+        
+        Args:
+            image_url: Publicly reachable (e.g. Cloudinary) URL of the image
+            
+        Returns:
+            Tuple of (success, extracted_text, error_message)
+        """
+        if not self.openai_api_key:
+            return False, None, "OpenAI API key not configured"
+        
+        try:
+            delay = _openai_rate_limiter().reserve()
+            if delay:
+                time.sleep(delay)
+            response = _http_session().post(
+                _OPENAI_CHAT_URL,
+                headers=self._openai_vision_headers(),
+                data=_openai_vision_url_body(image_url),
+                timeout=30
+            )
+            return self._openai_vision_result(response)
+        
+        except Exception as e:
+            error_msg = f"OpenAI Vision API processing failed: {e}"
+            logger.error(error_msg)
+            return False, None, error_msg
+    
+    async def _extract_with_openai_vision_async(self, image_path: str, client: httpx.AsyncClient) -> Tuple[bool, Optional[str], Optional[str]]:
+        """
+        Async counterpart of _extract_with_openai_vision.
+        
+        At most OCR_MAX_CONCURRENCY calls are in flight per event loop, starts
+        share the process-wide OpenAI rate limit, and rate-limited responses
+        are retried with exponential backoff.
+        """
+        if not self.openai_api_key:
+            return False, None, "OpenAI API key not configured"
+        
+        try:
+            headers, body = self._openai_vision_request(image_path)
+            body = bytes(body)
+            for attempt in range(_OPENAI_ATTEMPTS):
+                async with _openai_semaphore():
+                    delay = _openai_rate_limiter().reserve()
+                    if delay:
+                        await asyncio.sleep(delay)
+                    response = await client.post(_OPENAI_CHAT_URL, headers=headers, content=body)
+                if not _is_rate_limited(response) or attempt == _OPENAI_ATTEMPTS - 1:
+                    break
+                backoff = min(_OPENAI_MAX_BACKOFF, 2 ** attempt)
+                logger.warning("OpenAI rate limited (%s), retrying in %ss", response.status_code, backoff)
+                await asyncio.sleep(backoff)
+            return self._openai_vision_result(response)
+        
+        except Exception as e:
+            error_msg = f"OpenAI Vision API processing failed: {e}"
+            logger.error(error_msg)
+            return False, None, error_msg
+    
+    async def extract_texts_with_openai_async(self, image_paths: List[str]) -> List[Tuple[bool, Optional[str], Optional[str]]]:
+        """
+        Extract text from several images concurrently with OpenAI Vision.
+        
+        Args:
+            image_paths: Paths to the image files
+            
+        Returns:
+            One (success, extracted_text, error_message) tuple per path, in order
+        """
+        # The client's pool is bound to the running loop, so it is scoped to the call
+        async with httpx.AsyncClient(http2=True, timeout=30) as client:
+            return await asyncio.gather(
+                *(self._extract_with_openai_vision_async(path, client) for path in image_paths)
+            )
+    
     def _extract_with_paddle_ocr(self, image_path: str) -> Tuple[bool, Optional[str], Optional[str]]:
         """
         Extract text using Enhanced PaddleOCR.
@@ -205,16 +645,16 @@ class OCRService:
                 if not result or not result[0]:
                     return False, None, "No text detected in image"
                 
-                # Extract text from OCR result
-                extracted_text = []
-                for line in result[0]:
-                    if line and len(line) >= 2:
-                        text = line[1][0]  # Get the text from the OCR result
-                        confidence = line[1][1]  # Get confidence score
-                        if confidence > 0.5:  # Only include text with confidence > 50%
-                            extracted_text.append(text)
-                
-                full_text = '\n'.join(extracted_text)
+                # Extract text from OCR result, keeping only confident lines;
+                # the engine already drops most others via drop_score
+                conf_threshold = _paddle_conf_threshold()
+                full_text = '\n'.join(
+                    text
+                    for line in result[0]
+                    if line and len(line) >= 2
+                    for text, confidence in (line[1][:2],)
+                    if confidence > conf_threshold
+                )
                 return True, full_text, None
                 
             except Exception as e:
@@ -226,7 +666,9 @@ class OCRService:
             return False, None, f"Enhanced PaddleOCR processing failed: {e}"
     
     def _fallback_ocr(self, image_path: str) -> Tuple[bool, Optional[str], Optional[str]]:
-        """Fallback OCR method when other engines are not available."""
+        """Fallback OCR method when other engines are not available (sample text, DEBUG only)."""
+        if not settings.DEBUG:
+            return False, None, "no OCR backend available"
         try:
             # For now, return a mock OCR result
             # In a real implementation, you could use Tesseract or other OCR libraries
@@ -261,22 +703,77 @@ class OCRService:
         if method is None:
             method = self.preferred_method
         
+        size_error = _file_oversized_error(image_path)
+        if size_error:
+            return False, None, size_error
+        
         # Try the specified method first
         if method == OCRMethod.OPENAI_VISION:
-            success, text, error = self._extract_with_openai_vision(image_path)
+            success, text, error = self._cached_engine_text(image_path, method, self._extract_with_openai_vision)
             if success:
                 return True, text, None
+            if not settings.DEBUG:
+                logger.error(f"OpenAI Vision failed: {error}")
+                return False, None, error
             logger.warning(f"OpenAI Vision failed: {error}, trying fallback")
             
         elif method == OCRMethod.PADDLE_OCR:
-            success, text, error = self._extract_with_paddle_ocr(image_path)
+            success, text, error = self._cached_engine_text(image_path, method, self._extract_with_paddle_ocr)
             if success:
                 return True, text, None
+            if not settings.DEBUG:
+                logger.error(f"PaddleOCR failed: {error}")
+                return False, None, error
             logger.warning(f"PaddleOCR failed: {error}, trying fallback")
         
-        # If specified method failed or is fallback, try fallback
+        # If specified method failed or is fallback, try fallback (sample text outside production)
         return self._fallback_ocr(image_path)
     
+    def _cached_engine_text(self, image_path: str, method: OCRMethod, extract) -> Tuple[bool, Optional[str], Optional[str]]:
+        """
+        Run an OCR engine through the content-hash cache.
+        
+        Identical image bytes read with the same method skip the engine call.
+        OpenAI results are also kept in Django's cache so they survive restarts.
+        Only successful extractions are cached.
+        """
+        digest = _digest_file(image_path)
+        if digest is None:
+            return self._with_ocr_image(image_path, extract)
+        
+        key = (digest, method.value)
+        text = _lru_get(_text_cache, key)
+        if text is not None:
+            logger.debug("OCR cache hit for %s (%s)", digest, method.value)
+            return True, text, None
+        
+        shared_key = f"ocr:text:{method.value}:{digest}" if method == OCRMethod.OPENAI_VISION else None
+        if shared_key:
+            text = cache.get(shared_key)
+            if text is not None:
+                _lru_put(_text_cache, key, text)
+                return True, text, None
+        
+        success, text, error = self._with_ocr_image(image_path, extract)
+        if success and text is not None:
+            _lru_put(_text_cache, key, text)
+            if shared_key:
+                cache.set(shared_key, text, timeout=getattr(settings, 'OCR_RESULT_CACHE_TTL', 7 * 24 * 3600))
+        return success, text, error
+    
+    def _with_ocr_image(self, image_path: str, fn):
+        """
+        Return fn(path) for the image, downscaled first if it is oversized.
+        
+        The cache above is keyed on the original bytes, so hits skip the resize.
+        """
+        scaled_path = _downscale_for_ocr(image_path)
+        try:
+            return fn(scaled_path or image_path)
+        finally:
+            if scaled_path and os.path.exists(scaled_path):
+                os.remove(scaled_path)
+    
     def extract_text_from_image_with_method(self, image_path: str, method: OCRMethod) -> Tuple[bool, Optional[str], Optional[str]]:
         """
         Extract text from an image file using a specific method.
@@ -301,28 +798,42 @@ class OCRService:
             Tuple of (success, extracted_text, error_message)
         """
         try:
-            # Download image from URL
-            response = requests.get(image_url, timeout=30)
-            response.raise_for_status()
-            
-            # Save to temporary file
-            temp_path = f"/tmp/receipt_{datetime.now().timestamp()}.jpg"
-            with open(temp_path, 'wb') as f:
-                f.write(response.content)
+            # OpenAI can fetch HTTPS images itself, so skip the download and base64 body
+            if self.preferred_method == OCRMethod.OPENAI_VISION and image_url.startswith('https://'):
+                success, text, error = self._extract_with_openai_vision_url(image_url)
+                if success:
+                    return True, text, None
+                logger.warning(f"OpenAI Vision by URL failed: {error}, downloading instead")
             
-            try:
-                # Extract text from temporary file
-                success, text, error = self.extract_text_from_image(temp_path)
-                return success, text, error
-            finally:
-                # Clean up temporary file
-                if os.path.exists(temp_path):
-                    os.remove(temp_path)
+            # Download image from URL and extract text from the temporary file
+            return self._with_downloaded(image_url, self.extract_text_from_image)
                     
         except Exception as e:
             logger.error(f"Failed to process image from URL: {e}")
             return False, None, str(e)
     
+    def _with_downloaded(self, image_url: str, fn, timeout: int = 30):
+        """
+        Stream an image URL to a temporary file and return fn(temp_path).
+        
+        The body is copied to disk in 1 MiB chunks rather than buffered in
+        memory and is refused once it passes MAX_OCR_BYTES; the file is removed
+        afterwards even if fn raises.
+        """
+        temp_path = None
+        try:
+            with _http_session().get(image_url, timeout=timeout, stream=True) as response:
+                response.raise_for_status()
+                with tempfile.NamedTemporaryFile(prefix='receipt_', suffix='.jpg', delete=False) as f:
+                    temp_path = f.name
+                    for chunk in _iter_capped(response, chunk_size=1 << 20):
+                        f.write(chunk)
+            return fn(temp_path)
+        finally:
+            # Clean up temporary file
+            if temp_path and os.path.exists(temp_path):
+                os.remove(temp_path)
+    
     def extract_receipt_data(self, image_path: str, method: Optional[OCRMethod] = None) -> Tuple[bool, Optional[OCRData], Optional[str]]:
         """
         Extract structured receipt data from an image.
@@ -334,6 +845,10 @@ class OCRService:
         Returns:
             Tuple of (success, ocr_data, error_message)
         """
+        size_error = _file_oversized_error(image_path)
+        if size_error:
+            return False, None, size_error
+        
         try:
             # Try enhanced PaddleOCR for structured data first
             if method is None or method == OCRMethod.PADDLE_OCR:
@@ -344,33 +859,7 @@ class OCRService:
                     result = enhanced_service.process_receipt_image(image_path)
                     
                     if result["success"]:
-                        # Convert enhanced result to OCRData format
-                        ocr_data = OCRData(
-                            merchant_name=result.get("merchant", ""),
-                            total_amount=str(result.get("total", "")) if result.get("total") else None,
-                            date=result.get("date", ""),
-                            receipt_number=result.get("invoice_number", ""),
-                            vat_amount=str(result.get("vat", "")) if result.get("vat") else None,
-                            vat_number="",  # Enhanced service doesn't extract this yet
-                            currency=result.get("currency", "£"),
-                            category=result.get("category", ""),
-                            payment_method=result.get("payment_method", ""),
-                            confidence_score=result.get("ocr_confidence", 0.0),
-                            raw_text=result.get("raw_text", ""),
-                            items=result.get("items", []),
-                            additional_data={
-                                "subtotal": result.get("subtotal"),
-                                "vat_rate": result.get("vat_rate"),
-                                "receipt_type": result.get("receipt_type"),
-                                "layout_type": result.get("layout_type"),
-                                "is_thermal": result.get("is_thermal"),
-                                "needs_review": result.get("needs_review"),
-                                "processing_time": result.get("processing_time"),
-                                "field_confidence": result.get("field_confidence", {}),
-                                "vat_details": result.get("vat_details", {})
-                            }
-                        )
-                        return True, ocr_data, None
+                        return True, self._ocr_data_from_enhanced(result), None
                         
                 except ImportError:
                     logger.info("Enhanced PaddleOCR not available, falling back to standard OCR")
@@ -378,19 +867,96 @@ class OCRService:
                     logger.warning(f"Enhanced PaddleOCR failed: {e}, falling back to standard OCR")
             
             # Fallback to standard OCR methods
-            success, raw_text, error = self.extract_text_from_image(image_path, method)
-            if not success:
-                return False, None, error
-            
-            # Parse the extracted text to get structured data
-            ocr_data = self._parse_receipt_text(raw_text)
-            
-            return True, ocr_data, None
+            return self._extract_receipt_data_from_text(image_path, method)
             
         except Exception as e:
             logger.error(f"Receipt data extraction failed: {e}")
             return False, None, str(e)
     
+    def extract_receipt_data_batch(self, image_paths: List[str], batch_size: int = 8, timeout_ms: int = 200) -> List[Tuple[bool, Optional[OCRData], Optional[str]]]:
+        """
+        Extract structured receipt data from several images.
+        
+        Runs the enhanced PaddleOCR pipeline, where image loading, OCR and
+        parsing overlap on separate threads and the OCR stage takes up to
+        `batch_size` receipts at once, flushing early after `timeout_ms`.
+        Receipts the pipeline cannot read fall back to standard OCR one by one.
+        
+        Args:
+            image_paths: Paths to the receipt images
+            batch_size: Most receipts per OCR call
+            timeout_ms: Longest a receipt waits for its batch to fill
+            
+        Returns:
+            One (success, ocr_data, error_message) tuple per path, in order
+        """
+        try:
+            from .enhanced_paddle_ocr import EnhancedPaddleOCRService
+            
+            results = EnhancedPaddleOCRService().process_receipt_images_batch(
+                image_paths, max_batch=batch_size, max_wait_ms=timeout_ms
+            )
+        except ImportError:
+            logger.info("Enhanced PaddleOCR not available, processing receipts one by one")
+            return [self.extract_receipt_data(path) for path in image_paths]
+        except Exception as e:
+            logger.warning(f"Enhanced PaddleOCR batch failed: {e}, processing receipts one by one")
+            return [self.extract_receipt_data(path) for path in image_paths]
+        
+        extracted = []
+        for path, result in zip(image_paths, results):
+            try:
+                if result["success"]:
+                    try:
+                        extracted.append((True, self._ocr_data_from_enhanced(result), None))
+                        continue
+                    except Exception as e:
+                        logger.warning(f"Enhanced PaddleOCR failed: {e}, falling back to standard OCR")
+                extracted.append(self._extract_receipt_data_from_text(path, None))
+            except Exception as e:
+                logger.error(f"Receipt data extraction failed: {e}")
+                extracted.append((False, None, str(e)))
+        return extracted
+    
+    def _extract_receipt_data_from_text(self, image_path: str, method: Optional[OCRMethod]) -> Tuple[bool, Optional[OCRData], Optional[str]]:
+        """Run text OCR on the image and parse the result."""
+        success, raw_text, error = self.extract_text_from_image(image_path, method)
+        if not success:
+            return False, None, error
+        
+        # Parse the extracted text to get structured data
+        ocr_data = self._parse_receipt_text(raw_text)
+        
+        return True, ocr_data, None
+    
+    def _ocr_data_from_enhanced(self, result: Dict[str, Any]) -> OCRData:
+        """Convert an enhanced PaddleOCR result to OCRData format."""
+        return OCRData(
+            merchant_name=result.get("merchant", ""),
+            total_amount=str(result.get("total", "")) if result.get("total") else None,
+            date=result.get("date", ""),
+            receipt_number=result.get("invoice_number", ""),
+            vat_amount=str(result.get("vat", "")) if result.get("vat") else None,
+            vat_number="",  # Enhanced service doesn't extract this yet
+            currency=result.get("currency", "£"),
+            category=result.get("category", ""),
+            payment_method=result.get("payment_method", ""),
+            confidence_score=result.get("ocr_confidence", 0.0),
+            raw_text=result.get("raw_text", ""),
+            items=result.get("items", []),
+            additional_data={
+                "subtotal": result.get("subtotal"),
+                "vat_rate": result.get("vat_rate"),
+                "receipt_type": result.get("receipt_type"),
+                "layout_type": result.get("layout_type"),
+                "is_thermal": result.get("is_thermal"),
+                "needs_review": result.get("needs_review"),
+                "processing_time": result.get("processing_time"),
+                "field_confidence": result.get("field_confidence", {}),
+                "vat_details": result.get("vat_details", {})
+            }
+        )
+    
     def extract_receipt_data_with_method(self, image_path: str, method: OCRMethod) -> Tuple[bool, Optional[OCRData], Optional[str]]:
         """
         Extract structured receipt data from an image using a specific method.
@@ -449,11 +1015,10 @@ class OCRService:
             # 2) Paddle by file bytes
             try:
                 logger.info("OCRService: attempting Paddle HTTP by-file for %s", image_url)
-                resp_dl = requests.get(image_url, timeout=ocr_timeout)
-                resp_dl.raise_for_status()
+                image_bytes = _download_capped(image_url, ocr_timeout)
                 from infrastructure.ocr.adapters.paddle_http import PaddleOCRHTTPAdapter as _Adapter
                 adapter2 = _Adapter()
-                extraction = adapter2.parse_receipt(file_bytes=resp_dl.content, options={'filename': 'receipt.jpg'})
+                extraction = adapter2.parse_receipt(file_bytes=image_bytes, options={'filename': 'receipt.jpg'})
                 ocr_data = OCRData(
                     merchant_name=extraction.merchant,
                     total_amount=Decimal(str(extraction.total)) if extraction.total is not None else None,
@@ -505,17 +1070,9 @@ class OCRService:
                 except Exception as e3:
                     logger.warning("OCRService: OpenAI Vision failed: %s", e3)
             # 4) Legacy: download and process in-process OCR
-            response = requests.get(image_url, timeout=ocr_timeout)
-            response.raise_for_status()
-            temp_path = f"/tmp/receipt_{datetime.now().timestamp()}.jpg"
-            with open(temp_path, 'wb') as f:
-                f.write(response.content)
-            try:
-                success, ocr_data, error = self.extract_receipt_data(temp_path, method)
-                return success, ocr_data, error
-            finally:
-                if os.path.exists(temp_path):
-                    os.remove(temp_path)
+            return self._with_downloaded(
+                image_url, lambda path: self.extract_receipt_data(path, method), timeout=ocr_timeout
+            )
         except Exception as e:
             logger.error(f"Failed to process receipt from URL: {e}")
             return False, None, str(e)
@@ -536,9 +1093,10 @@ class OCRService:
         else:
             logger.warning("OpenAI API key not configured")
         
-        # Fallback is always available
-        available_methods.append(OCRMethod.FALLBACK)
-        logger.info("Fallback OCR is always available")
+        # Fallback only serves sample text, so it is offered in DEBUG only
+        if settings.DEBUG:
+            available_methods.append(OCRMethod.FALLBACK)
+            logger.info("Fallback OCR is available (DEBUG)")
         
         return available_methods
     
@@ -553,7 +1111,7 @@ class OCRService:
             True if method is available, False otherwise
         """
         if method == OCRMethod.FALLBACK:
-            return True
+            return settings.DEBUG
         elif method == OCRMethod.PADDLE_OCR:
             return self.paddle_ocr_engine is not None
         elif method == OCRMethod.OPENAI_VISION:
@@ -570,29 +1128,57 @@ class OCRService:
         Returns:
             OCRData object with parsed information
         """
-        lines = text.split('\n')
-        
-        # Initialize OCR data
-        ocr_data = OCRData(raw_text=text)
-        
-        # Extract merchant name (usually at the top)
-        ocr_data.merchant_name = self._extract_merchant_name(lines)
-        
-        # Extract total amount
-        ocr_data.total_amount = self._extract_total_amount(lines)
-        
-        # Extract date
-        ocr_data.date = self._extract_date(lines)
+        # Parsing is pure, so identical text always yields the same data
+        key = hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+        cached = _lru_get(_parse_cache, key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+        ocr_data = self._parse_lines(text)
+        _lru_put(_parse_cache, key, copy.deepcopy(ocr_data))
+        return ocr_data
+    
+    def _parse_lines(self, text: str) -> OCRData:
+        """
+        Parse receipt text in a single pass over its lines.
         
-        # Extract VAT information
-        ocr_data.vat_amount = self._extract_vat_amount(lines)
-        ocr_data.vat_number = self._extract_vat_number(lines)
+        Each field keeps its own pattern priority and first-line-wins rule, but
+        all fields are matched while walking the lines once; resolved fields
+        are skipped for the remaining lines. The total is the exception: it is
+        looked for from the bottom up afterwards.
+        """
+        merchant_name = date = vat_amount = vat_number = receipt_number = None
+        # Items are gathered column-wise and only become dicts once, at the end
+        descriptions: List[str] = []
+        prices: List[str] = []
+        lines = [line.strip() for line in text.split('\n')]
         
-        # Extract receipt number
-        ocr_data.receipt_number = self._extract_receipt_number(lines)
+        for index, line in enumerate(lines):
+            # Merchant name is usually at the top
+            if merchant_name is None and index < 5:
+                merchant_name = self._match_merchant_name(line)
+            if date is None:
+                date = self._match_date(line)
+            if vat_amount is None:
+                vat_amount = self._match_vat_amount(line)
+            if vat_number is None:
+                vat_number = self._match_vat_number(line)
+            if receipt_number is None:
+                receipt_number = self._match_receipt_number(line)
+            item = self._match_item(line)
+            if item is not None:
+                descriptions.append(item[0])
+                prices.append(item[1])
         
-        # Extract items
-        ocr_data.items = self._extract_items(lines)
+        ocr_data = OCRData(
+            merchant_name=merchant_name,
+            total_amount=self._find_total_amount(lines),
+            date=date,
+            vat_amount=vat_amount,
+            vat_number=vat_number,
+            receipt_number=receipt_number,
+            items=self._item_dicts(descriptions, prices),
+            raw_text=text,
+        )
         
         # Calculate confidence score (simplified)
         ocr_data.confidence_score = self._calculate_confidence_score(ocr_data)
@@ -602,151 +1188,149 @@ class OCRService:
     def _extract_merchant_name(self, lines: List[str]) -> Optional[str]:
         """Extract merchant name from receipt lines."""
         # Look for merchant name in first few lines
-        for i, line in enumerate(lines[:5]):
-            line = line.strip()
-            if line and len(line) > 3 and len(line) < 100:
-                # Skip lines that look like addresses or phone numbers
-                if not re.search(r'\d{4,}', line) and not re.search(r'@', line):
-                    return line
+        for line in lines[:5]:
+            merchant_name = self._match_merchant_name(line.strip())
+            if merchant_name is not None:
+                return merchant_name
+        return None
+    
+    def _match_merchant_name(self, line: str) -> Optional[str]:
+        if line and len(line) > 3 and len(line) < 100:
+            # Skip lines that look like addresses or phone numbers
+            if '@' not in line and not _ADDR_DIGIT_RX.search(line):
+                return line
         return None
     
     def _extract_total_amount(self, lines: List[str]) -> Optional[Decimal]:
         """Extract total amount from receipt lines."""
-        # Look for total amount patterns
-        total_patterns = [
-            r'total[:\s]*£?\s*(\d+\.?\d*)',
-            r'amount[:\s]*£?\s*(\d+\.?\d*)',
-            r'£\s*(\d+\.?\d*)',
-            r'(\d+\.?\d*)\s*£',
-            r'(\d+\.?\d*)'
-        ]
+        return self._find_total_amount([line.strip() for line in lines])
+    
+    def _find_total_amount(self, lines: List[str]) -> Optional[Decimal]:
+        """
+        Total amount from stripped receipt lines.
         
-        for line in lines:
-            line = line.strip().lower()
-            for pattern in total_patterns:
-                match = re.search(pattern, line)
-                if match:
-                    try:
-                        amount = Decimal(match.group(1))
-                        if 0 < amount < 100000:  # Reasonable amount range
-                            return amount
-                    except (ValueError, TypeError):
-                        continue
+        Totals sit near the bottom, so each tier of _TOTAL_TIERS is scanned from
+        the last line up and a bare number is only used when no labelled or
+        currency-marked amount exists. Within the winning line the largest
+        plausible amount is taken.
+        """
+        for pattern in _TOTAL_TIERS:
+            for line in reversed(lines):
+                amount = self._match_total_amount(line, pattern)
+                if amount is not None:
+                    return amount
         return None
     
+    def _match_total_amount(self, line: str, pattern: re.Pattern) -> Optional[Decimal]:
+        best = best_value = None
+        for match in pattern.finditer(line):
+            amount = match[match.lastindex]
+            try:
+                value = float(amount)
+            except (ValueError, TypeError):
+                continue
+            if 0 < value < 100000 and (best is None or value > best_value):  # Reasonable amount range
+                best, best_value = amount, value
+        return _to_money(best) if best is not None else None
+    
     def _extract_date(self, lines: List[str]) -> Optional[datetime]:
         """Extract date from receipt lines."""
-        # UK date patterns
-        date_patterns = [
-            r'(\d{1,2})[/-](\d{1,2})[/-](\d{2,4})',  # DD/MM/YYYY or DD-MM-YYYY
-            r'(\d{1,2})\s+(\w+)\s+(\d{2,4})',  # DD Month YYYY
-            r'(\d{4})-(\d{1,2})-(\d{1,2})',  # YYYY-MM-DD
-        ]
-        
         for line in lines:
-            line = line.strip()
-            for pattern in date_patterns:
-                match = re.search(pattern, line)
-                if match:
-                    try:
-                        if len(match.groups()) == 3:
-                            day, month, year = match.groups()
-                            
-                            # Handle 2-digit years
-                            if len(year) == 2:
-                                year = f"20{year}"
-                            
-                            # Convert month name to number if needed
-                            if month.isalpha():
-                                month_names = {
-                                    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4,
-                                    'may': 5, 'jun': 6, 'jul': 7, 'aug': 8,
-                                    'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
-                                }
-                                month = month_names.get(month[:3].lower(), 1)
-                            
-                            return datetime(int(year), int(month), int(day))
-                    except (ValueError, TypeError):
-                        continue
+            date = self._match_date(line.strip())
+            if date is not None:
+                return date
+        return None
+    
+    def _match_date(self, line: str) -> Optional[datetime]:
+        match = _DATE_RX.match(line)
+        for name, parts in _DATE_FORMATS:
+            if match.group(name) is None:
+                continue
+            day, month, year = match.group(*parts)
+            try:
+                # Handle 2-digit years
+                if len(year) == 2:
+                    year = f"20{year}"
+                
+                # Convert month name to number if needed
+                if month.isalpha():
+                    month = _MONTHS.get(month[:3].lower(), 1)
+                
+                return datetime(int(year), int(month), int(day))
+            except (ValueError, TypeError, OverflowError):
+                continue
         return None
     
     def _extract_vat_amount(self, lines: List[str]) -> Optional[Decimal]:
         """Extract VAT amount from receipt lines."""
-        vat_patterns = [
-            r'vat[:\s]*£?\s*(\d+\.?\d*)',
-            r'tax[:\s]*£?\s*(\d+\.?\d*)',
-            r'gst[:\s]*£?\s*(\d+\.?\d*)',
-        ]
-        
         for line in lines:
-            line = line.strip().lower()
-            for pattern in vat_patterns:
-                match = re.search(pattern, line)
-                if match:
-                    try:
-                        amount = Decimal(match.group(1))
-                        if 0 < amount < 10000:  # Reasonable VAT range
-                            return amount
-                    except (ValueError, TypeError):
-                        continue
+            amount = self._match_vat_amount(line.strip())
+            if amount is not None:
+                return amount
+        return None
+    
+    def _match_vat_amount(self, line: str) -> Optional[Decimal]:
+        for pattern in _VAT_AMOUNT_RXS:
+            match = pattern.search(line)
+            if match:
+                try:
+                    if 0 < float(match.group(1)) < 10000:  # Reasonable VAT range
+                        return _to_money(match.group(1))
+                except (ValueError, TypeError):
+                    continue
         return None
     
     def _extract_vat_number(self, lines: List[str]) -> Optional[str]:
         """Extract VAT number from receipt lines."""
-        vat_number_patterns = [
-            r'vat\s*no[:\s]*([A-Z]{2}\d{9,12})',
-            r'vat\s*number[:\s]*([A-Z]{2}\d{9,12})',
-            r'([A-Z]{2}\d{9,12})',
-        ]
-        
         for line in lines:
-            line = line.strip()
-            for pattern in vat_number_patterns:
-                match = re.search(pattern, line)
-                if match:
-                    return match.group(1)
+            vat_number = self._match_vat_number(line.strip())
+            if vat_number is not None:
+                return vat_number
+        return None
+    
+    def _match_vat_number(self, line: str) -> Optional[str]:
+        for pattern in _VAT_NUMBER_RXS:
+            match = pattern.search(line)
+            if match:
+                return match.group(1)
         return None
     
     def _extract_receipt_number(self, lines: List[str]) -> Optional[str]:
         """Extract receipt number from receipt lines."""
-        receipt_number_patterns = [
-            r'receipt[:\s]*#?\s*(\d+)',
-            r'invoice[:\s]*#?\s*(\d+)',
-            r'transaction[:\s]*#?\s*(\d+)',
-            r'(\d{6,})',  # Generic 6+ digit number
-        ]
-        
         for line in lines:
-            line = line.strip().lower()
-            for pattern in receipt_number_patterns:
-                match = re.search(pattern, line)
-                if match:
-                    return match.group(1)
+            receipt_number = self._match_receipt_number(line.strip())
+            if receipt_number is not None:
+                return receipt_number
+        return None
+    
+    def _match_receipt_number(self, line: str) -> Optional[str]:
+        for pattern in _RECEIPT_NUMBER_RXS:
+            match = pattern.search(line)
+            if match:
+                return match.group(1)
         return None
     
     def _extract_items(self, lines: List[str]) -> List[Dict[str, Any]]:
         """Extract individual items from receipt lines."""
-        items = []
-        
-        for line in lines:
-            line = line.strip()
-            # Look for item patterns (description + price)
-            item_match = re.search(r'(.+?)\s+£?\s*(\d+\.?\d*)$', line)
-            if item_match:
-                description = item_match.group(1).strip()
-                price = item_match.group(2)
-                
-                if len(description) > 2 and len(description) < 100:
-                    try:
-                        items.append({
-                            'description': description,
-                            'price': Decimal(price),
-                            'quantity': 1
-                        })
-                    except (ValueError, TypeError):
-                        continue
-        
-        return items
+        matches = [item for item in map(self._match_item, map(str.strip, lines)) if item is not None]
+        return self._item_dicts([d for d, _ in matches], [p for _, p in matches])
+    
+    def _match_item(self, line: str) -> Optional[Tuple[str, str]]:
+        # Look for item patterns (description + price); the price stays text until _item_dicts
+        item_match = _ITEM_RX.search(line)
+        if item_match:
+            description = item_match.group(1).strip()
+            
+            if len(description) > 2 and len(description) < 100:
+                return description, item_match.group(2)
+        return None
+    
+    def _item_dicts(self, descriptions: List[str], prices: List[str]) -> List[Dict[str, Any]]:
+        """Items in the OCRData.items shape from parallel description/price columns."""
+        return [
+            {'description': description, 'price': _to_money(price), 'quantity': 1}
+            for description, price in zip(descriptions, prices)
+        ]
     
     def _calculate_confidence_score(self, ocr_data: OCRData) -> float:
         """Calculate confidence score for extracted data."""
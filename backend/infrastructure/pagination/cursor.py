@@ -6,12 +6,15 @@ cursors, which are used for efficient pagination of large datasets.
 """
 
 import base64
-import json
+import binascii
 from typing import Any, Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
-from decimal import Decimal
+from decimal import Decimal, InvalidOperation
 from datetime import datetime
 
+import orjson
+from django.db.models.expressions import RawSQL
+
 
 @dataclass
 class CursorInfo:
@@ -26,7 +29,7 @@ class CursorPagination:
     """
     Cursor-based pagination utility.
     
-    Cursors are base64url-encoded JSON objects containing:
+    Cursors are unpadded base64url-encoded JSON objects containing:
     - sort: the field being sorted on
     - order: asc or desc
     - version: cursor format version for future compatibility
@@ -34,8 +37,26 @@ class CursorPagination:
     """
     
     VERSION = 1
-    SUPPORTED_SORTS = {'date', 'amount', 'merchant', 'confidence'}
-    SUPPORTED_ORDERS = {'asc', 'desc'}
+    SUPPORTED_SORTS = frozenset({'date', 'amount', 'merchant', 'confidence'})
+    SUPPORTED_ORDERS = frozenset({'asc', 'desc'})
+    REQUIRED_FIELDS = frozenset({'sort', 'order', 'v', 'key'})
+    # Database lookup for each API sort field
+    SORT_FIELDS = {
+        'date': 'ocr_data__date',
+        'amount': 'ocr_data__total_amount',
+        'merchant': 'ocr_data__merchant_name',
+        'confidence': 'ocr_data__confidence_score',
+    }
+    # SQL expression and parameter cast for each JSON sort lookup, shared by the
+    # cursor WHERE clause and ORDER BY so both see the same ordering. The
+    # expressions match the (user_id, <expr> DESC, id DESC) indexes from
+    # migration 0003, e.g. receipts_user_amount_id_desc.
+    SORT_EXPRESSIONS = {
+        'ocr_data__date': ("(receipts.ocr_data->>'date')", '::text'),
+        'ocr_data__total_amount': ("((receipts.ocr_data->>'total_amount')::numeric)", '::numeric'),
+        'ocr_data__merchant_name': ("(receipts.ocr_data->>'merchant_name')", '::text'),
+        'ocr_data__confidence_score': ("((receipts.ocr_data->>'confidence_score')::double precision)", '::double precision'),
+    }
     
     @classmethod
     def encode_cursor(cls, sort: str, order: str, sort_value: Any, receipt_id: str) -> str:
@@ -64,7 +85,8 @@ class CursorPagination:
         if isinstance(sort_value, datetime):
             sort_value = sort_value.isoformat()
         elif isinstance(sort_value, Decimal):
-            sort_value = float(sort_value)
+            # Keep the exact decimal text; a float would drift from the stored amount
+            sort_value = str(sort_value)
         
         cursor_data = {
             "sort": sort,
@@ -73,11 +95,8 @@ class CursorPagination:
             "key": [sort_value, receipt_id]
         }
         
-        # Convert to JSON and encode as base64url
-        json_str = json.dumps(cursor_data, separators=(',', ':'))
-        base64_str = base64.urlsafe_b64encode(json_str.encode('utf-8')).decode('utf-8')
-        
-        return base64_str
+        # Convert to compact JSON bytes and encode as base64url without padding
+        return base64.urlsafe_b64encode(orjson.dumps(cursor_data)).rstrip(b'=').decode('ascii')
     
     @classmethod
     def decode_cursor(cls, cursor: str) -> CursorInfo:
@@ -94,13 +113,12 @@ class CursorPagination:
             ValueError: If cursor is invalid or malformed
         """
         try:
-            # Decode base64url
-            json_str = base64.urlsafe_b64decode(cursor.encode('utf-8')).decode('utf-8')
-            cursor_data = json.loads(json_str)
+            # Decode base64url, restoring any padding stripped by encode_cursor
+            raw = cursor.encode('utf-8')
+            cursor_data = orjson.loads(base64.urlsafe_b64decode(raw + b'=' * (-len(raw) % 4)))
             
             # Validate required fields
-            required_fields = {'sort', 'order', 'v', 'key'}
-            if not all(field in cursor_data for field in required_fields):
+            if not isinstance(cursor_data, dict) or not cls.REQUIRED_FIELDS <= cursor_data.keys():
                 raise ValueError("Missing required cursor fields")
             
             # Validate version
@@ -125,7 +143,8 @@ class CursorPagination:
                 key=cursor_data['key']
             )
             
-        except (base64.binascii.Error, json.JSONDecodeError, UnicodeDecodeError) as e:
+        except (binascii.Error, orjson.JSONDecodeError, TypeError) as e:
+            # TypeError: unhashable sort/order values such as lists
             raise ValueError(f"Invalid cursor format: {e}")
     
     @classmethod
@@ -133,32 +152,66 @@ class CursorPagination:
         """
         Build a WHERE clause for cursor-based pagination.
         
+        The clause is a row-value comparison with explicitly cast parameters,
+        which Postgres can answer from a composite (sort, id) index. Rows with
+        no sort value follow Postgres' default placement (first when
+        descending, last when ascending), matching order_by().
+        
         Args:
             cursor_info: Decoded cursor information
-            sort_field: The database field name for sorting
+            sort_field: The database field name (or JSON lookup) for sorting
             
         Returns:
             Tuple of (where_clause, parameters)
+            
+        Raises:
+            ValueError: If the cursor holds an invalid amount
         """
         sort_value, receipt_id = cursor_info.key
+        expression, cast = cls.SORT_EXPRESSIONS.get(sort_field, (sort_field, ''))
         
-        # Convert sort_value back to appropriate type if needed
-        if sort_field == 'date':
+        # Amounts travel as decimal strings; only they need converting back
+        if cursor_info.sort == 'amount' and isinstance(sort_value, str):
             try:
-                if isinstance(sort_value, str):
-                    sort_value = datetime.fromisoformat(sort_value)
-            except ValueError:
-                pass
+                sort_value = Decimal(sort_value)
+            except InvalidOperation:
+                raise ValueError(f"Invalid amount in cursor: {sort_value}")
+        
+        if sort_value is None:
+            # The cursor sits among the NULL sort values, which are ordered by id alone
+            if cursor_info.order == 'desc':
+                return f"({expression} IS NOT NULL OR receipts.id < %s::uuid)", [receipt_id]
+            return f"({expression} IS NULL AND receipts.id > %s::uuid)", [receipt_id]
         
         if cursor_info.order == 'desc':
             # For descending order, get rows with (sort_value, id) < (cursor_sort_value, cursor_id)
-            where_clause = f"({sort_field}, id) < (%s, %s)"
+            where_clause = f"ROW({expression}, receipts.id) < ROW(%s{cast}, %s::uuid)"
         else:
-            # For ascending order, get rows with (sort_value, id) > (cursor_sort_value, cursor_id)
-            where_clause = f"({sort_field}, id) > (%s, %s)"
+            # For ascending order, get rows with (sort_value, id) > (cursor_sort_value, cursor_id),
+            # then the NULL sort values that come last
+            where_clause = f"(ROW({expression}, receipts.id) > ROW(%s{cast}, %s::uuid) OR {expression} IS NULL)"
         
         return where_clause, [sort_value, receipt_id]
     
+    @classmethod
+    def order_by(cls, sort_field: str, order: str) -> List[Any]:
+        """
+        ORDER BY terms matching build_where_clause for the same sort field.
+        
+        Args:
+            sort_field: The database field name (or JSON lookup) for sorting
+            order: Sort order (asc or desc)
+            
+        Returns:
+            Arguments for QuerySet.order_by()
+        """
+        if sort_field not in cls.SORT_EXPRESSIONS:
+            return [f'-{sort_field}', '-id'] if order == 'desc' else [sort_field, 'id']
+        expression = RawSQL(cls.SORT_EXPRESSIONS[sort_field][0], [])
+        if order == 'desc':
+            return [expression.desc(), '-id']
+        return [expression.asc(), 'id']
+    
     @classmethod
     def is_valid_cursor(cls, cursor: str) -> bool:
         """
@@ -1,11 +1,79 @@
+import copy
+import hashlib
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 from django.conf import settings
+from django.core.cache import cache
 from domain.accounts.entities import User
 
 logger = logging.getLogger(__name__)
 
+# The stripe SDK is slow to import, so it is loaded on first use and kept here
+_STRIPE_MOD = None
+_STRIPE_MISSING = False
+# PaymentLink.list plus the three configured Price.retrieve calls
+_STRIPE_FETCH_WORKERS = 4
+
+
+def _get_stripe():
+    """The stripe module, imported once on first use; None if it is not installed."""
+    global _STRIPE_MOD, _STRIPE_MISSING
+    if _STRIPE_MOD is None and not _STRIPE_MISSING:
+        try:
+            import stripe
+            _STRIPE_MOD = stripe
+        except Exception:
+            _STRIPE_MISSING = True
+    return _STRIPE_MOD
+
+
+# Short-lived caches of Stripe reads: plans rarely change and customer data
+# is re-read on every billing page view. Entries are (stored_at, value).
+PLANS_CACHE_TTL = 60
+CUSTOMER_CACHE_TTL = 15
+_CACHE_MAX_ENTRIES = 1024
+# Email -> customer id mappings only change if the customer is deleted
+CUSTOMER_ID_CACHE_TTL = 3600
+_cache_lock = threading.Lock()
+_plans_cache: Dict[Tuple, Tuple[float, dict]] = {}
+_customer_cache: Dict[Tuple, Tuple[float, dict]] = {}
+
+
+def _cache_get(store: Dict[Tuple, Tuple[float, dict]], key: Tuple, ttl: float) -> Optional[dict]:
+    with _cache_lock:
+        entry = store.get(key)
+    if entry is None or time.monotonic() - entry[0] >= ttl:
+        return None
+    # Callers may mutate the result, so hand out a copy
+    return copy.deepcopy(entry[1])
+
+
+def _cache_put(store: Dict[Tuple, Tuple[float, dict]], key: Tuple, value: dict, ttl: float) -> None:
+    now = time.monotonic()
+    value = copy.deepcopy(value)
+    with _cache_lock:
+        # Re-inserted at the end, so dict order stays oldest-first
+        store.pop(key, None)
+        if len(store) >= _CACHE_MAX_ENTRIES:
+            for stale in [k for k, (ts, _) in store.items() if now - ts >= ttl]:
+                del store[stale]
+            # Still full of live entries: drop the oldest ones
+            while len(store) >= _CACHE_MAX_ENTRIES:
+                del store[next(iter(store))]
+        store[key] = (now, value)
+
+
+def _invalidate_customer(customer_id: Optional[str]) -> None:
+    if not customer_id:
+        return
+    with _cache_lock:
+        for key in [k for k in _customer_cache if k[1] == customer_id]:
+            del _customer_cache[key]
+
 
 @dataclass
 class StripeConfig:
@@ -27,28 +95,57 @@ class StripePaymentService:
             webhook_secret=getattr(settings, 'STRIPE_WEBHOOK_SECRET', ''),
             publishable_key=getattr(settings, 'STRIPE_PUBLISHABLE_KEY', ''),
         )
-        self.enabled = bool(self.config.secret_key)
+
+    @property
+    def enabled(self) -> bool:
+        # Checking for the SDK imports it, so only do so once a key is configured
+        return bool(self.config.secret_key) and _get_stripe() is not None
+
+    def _stripe(self):
+        stripe = _get_stripe()
+        stripe.api_key = self.config.secret_key
+        return stripe
+
+    def _customer_cache_key(self, email: str) -> str:
+        # Hashed so any email is a valid cache key; the account part keeps test and live apart
+        account = hashlib.sha256(self.config.secret_key.encode()).hexdigest()[:16]
+        return f"stripe:customer:{account}:{hashlib.sha256(email.lower().encode()).hexdigest()}"
+
+    def _find_customer(self, stripe, email: str) -> Optional[str]:
+        """Existing customer id for an email: indexed search first, then list."""
         try:
-            import stripe  # noqa: F401
+            escaped = email.replace('\\', '\\\\').replace("'", "\\'")
+            res = stripe.Customer.search(query=f"email:'{escaped}'", limit=1)
+            if getattr(res, 'data', None):
+                return res.data[0].id
         except Exception:
-            self.enabled = False
+            # Search is unavailable in some accounts; list still works
+            pass
+        # Search is eventually consistent, so very new customers only show up here
+        res = stripe.Customer.list(email=email, limit=1)
+        if getattr(res, 'data', None):
+            return res.data[0].id
+        return None
 
     def _ensure_customer(self, user: User) -> Optional[str]:
         """Find or create a Stripe customer by email. Returns customer_id or None."""
         if not self.enabled or not user or not user.email:
             return None
         try:
-            import stripe
-            stripe.api_key = self.config.secret_key
+            stripe = self._stripe()
             # Try to find an existing customer by email (best-effort)
             email = user.email if hasattr(user, 'email') else None
             if not email:
                 return None
-            res = stripe.Customer.list(email=email, limit=1)
-            if getattr(res, 'data', None):
-                return res.data[0].id
-            cust = stripe.Customer.create(email=email, name=f"{user.first_name} {user.last_name}")
-            return cust.id
+            key = self._customer_cache_key(email)
+            customer_id = cache.get(key)
+            if customer_id:
+                return customer_id
+            customer_id = self._find_customer(stripe, email)
+            if not customer_id:
+                customer_id = stripe.Customer.create(email=email, name=f"{user.first_name} {user.last_name}").id
+            cache.set(key, customer_id, timeout=CUSTOMER_ID_CACHE_TTL)
+            return customer_id
         except Exception:
             return None
 
@@ -57,8 +154,7 @@ class StripePaymentService:
             logger.info('Stripe disabled; returning no-op checkout session')
             return { 'success': True, 'url': None }
         try:
-            import stripe
-            stripe.api_key = self.config.secret_key
+            stripe = self._stripe()
             # Resolve price id: explicit > env basic > first active recurring price
             pid = price_id or self.config.price_basic
             if not pid:
@@ -94,7 +190,7 @@ class StripePaymentService:
         if not self.enabled:
             return { 'success': True, 'event': None }
         try:
-            import stripe
+            stripe = self._stripe()
             event = stripe.Webhook.construct_event(
                 payload=payload,
                 sig_header=sig_header,
@@ -102,6 +198,7 @@ class StripePaymentService:
             )
             etype = event['type']
             data_obj = event['data']['object'] if event.get('data') else None
+            self._invalidate_caches(etype, data_obj)
             user_id = None
             price_id = None
             plan = None
@@ -148,13 +245,26 @@ class StripePaymentService:
         except Exception as e:
             return { 'success': False, 'message': str(e) }
 
+    def _invalidate_caches(self, etype: str, data_obj: Any) -> None:
+        """Drop cached plans or customer data that a webhook event makes stale."""
+        if etype.startswith(('price.', 'product.', 'payment_link.')):
+            with _cache_lock:
+                _plans_cache.clear()
+        elif etype.startswith(('invoice.', 'payment_method.', 'customer.')) and isinstance(data_obj, dict):
+            if etype == 'customer.deleted' and data_obj.get('email'):
+                cache.delete(self._customer_cache_key(data_obj['email']))
+            customer_id = data_obj.get('customer')
+            if etype.startswith('customer.') and not isinstance(customer_id, str):
+                # Customer events carry the customer itself
+                customer_id = data_obj.get('id')
+            _invalidate_customer(customer_id if isinstance(customer_id, str) else None)
+
     def create_billing_portal(self, customer_id: Optional[str] = None, user: Optional[User] = None, customer_email: Optional[str] = None) -> dict:
         if not self.enabled:
             logger.info('Stripe disabled; returning no-op portal session')
             return { 'success': True, 'url': None }
         try:
-            import stripe
-            stripe.api_key = self.config.secret_key
+            stripe = self._stripe()
             # In a full implementation, we would look up the Stripe customer id by user
             if not customer_id:
                 customer_id = self._ensure_customer(user)
@@ -186,13 +296,43 @@ class StripePaymentService:
                 if key:
                     items.append({ 'id': key, 'nickname': nick, 'currency': None, 'unit_amount': None, 'interval': None })
             return { 'success': True, 'items': items, 'publishable_key': self.config.publishable_key }
+        # Keyed by the account and configured prices so a config change is never served stale
+        key = (
+            hashlib.sha256(self.config.secret_key.encode()).hexdigest()[:16],
+            self.config.price_basic,
+            self.config.price_premium,
+            self.config.price_enterprise,
+        )
+        cached = _cache_get(_plans_cache, key, PLANS_CACHE_TTL)
+        if cached is not None:
+            return cached
+        result = self._fetch_plans()
+        if result.get('success'):
+            _cache_put(_plans_cache, key, result, PLANS_CACHE_TTL)
+        return result
+
+    def _fetch_plans(self) -> dict:
+        """Uncached list_plans lookup against the Stripe API."""
         try:
-            import stripe
-            stripe.api_key = self.config.secret_key
+            stripe = self._stripe()
+            env_selected = [
+                (self.config.price_basic, 'Basic'),
+                (self.config.price_premium, 'Premium'),
+                (self.config.price_enterprise, 'Enterprise'), # Changed from price_platinum
+            ]
+            env_selected = [(pid, nick) for pid, nick in env_selected if pid]
+            # The payment links and env prices are independent round-trips; fetch them concurrently
+            with ThreadPoolExecutor(max_workers=_STRIPE_FETCH_WORKERS) as pool:
+                links_future = pool.submit(stripe.PaymentLink.list, active=True, limit=50, expand=['data.line_items'])
+                price_futures = {
+                    pid: pool.submit(stripe.Price.retrieve, pid, expand=['product'])
+                    for pid in dict.fromkeys(pid for pid, _ in env_selected)
+                }
+
             # Build payment link map first (used in both paths)
             price_id_to_payment_link = {}
             try:
-                links = stripe.PaymentLink.list(active=True, limit=50, expand=['data.line_items'])
+                links = links_future.result()
                 for pl in getattr(links, 'data', []) or []:
                     try:
                         for li in getattr(pl, 'line_items', None).data or []:
@@ -206,12 +346,6 @@ class StripePaymentService:
 
             # If env-configured prices exist, prefer and return ONLY those, in Basic → Premium → Platinum order
             # If 3 plan prices are configured, return only those (and only if active), in Basic→Premium→Platinum order
-            env_selected = [
-                (self.config.price_basic, 'Basic'),
-                (self.config.price_premium, 'Premium'),
-                (self.config.price_enterprise, 'Enterprise'), # Changed from price_platinum
-            ]
-            env_selected = [(pid, nick) for pid, nick in env_selected if pid]
             items = []
             if env_selected:
                 seen = set()
@@ -219,7 +353,7 @@ class StripePaymentService:
                     if not pid or pid in seen:
                         continue
                     try:
-                        pr = stripe.Price.retrieve(pid, expand=['product'])
+                        pr = price_futures[pid].result()
                         # Only include active recurring prices
                         if getattr(pr, 'type', '') != 'recurring' or getattr(pr, 'active', False) is not True:
                             continue
@@ -265,16 +399,11 @@ class StripePaymentService:
                     'payment_link_url': price_id_to_payment_link.get(p.id),
                 })
             # If env prices exist, ensure they are present even if not returned above
-            env_prices = [
-                (self.config.price_basic, 'Basic'),
-                (self.config.price_premium, 'Premium'),
-                (self.config.price_enterprise, 'Enterprise'), # Changed from price_platinum
-            ]
             known_ids = { it['id'] for it in items }
-            for pid, nick in env_prices:
-                if pid and pid not in known_ids:
+            for pid, nick in env_selected:
+                if pid not in known_ids:
                     try:
-                        pr = stripe.Price.retrieve(pid, expand=['product'])
+                        pr = price_futures[pid].result()
                         items.append({
                             'id': pr.id,
                             'nickname': getattr(pr, 'nickname', None) or getattr(pr.product, 'name', None) or nick,
@@ -298,9 +427,12 @@ class StripePaymentService:
         """Return recent invoices for a Stripe customer (sandbox-friendly)."""
         if not self.enabled or not customer_id:
             return { 'success': True, 'items': [] }
+        key = ('invoices', customer_id, limit)
+        cached = _cache_get(_customer_cache, key, CUSTOMER_CACHE_TTL)
+        if cached is not None:
+            return cached
         try:
-            import stripe
-            stripe.api_key = self.config.secret_key
+            stripe = self._stripe()
             invs = stripe.Invoice.list(customer=customer_id, limit=max(1, min(limit, 50)))
             items = []
             for inv in getattr(invs, 'data', []) or []:
@@ -313,7 +445,9 @@ class StripePaymentService:
                     'hosted_invoice_url': getattr(inv, 'hosted_invoice_url', None),
                     'invoice_pdf': getattr(inv, 'invoice_pdf', None),
                 })
-            return { 'success': True, 'items': items }
+            result = { 'success': True, 'items': items }
+            _cache_put(_customer_cache, key, result, CUSTOMER_CACHE_TTL)
+            return result
         except Exception as e:
             logger.warning('Stripe list_invoices failed: %s', e)
             return { 'success': False, 'message': str(e), 'items': [] }
@@ -325,9 +459,12 @@ class StripePaymentService:
         """
         if not self.enabled or not customer_id:
             return { 'success': True, 'items': [] }
+        key = ('payment_methods', customer_id)
+        cached = _cache_get(_customer_cache, key, CUSTOMER_CACHE_TTL)
+        if cached is not None:
+            return cached
         try:
-            import stripe
-            stripe.api_key = self.config.secret_key
+            stripe = self._stripe()
             pms = stripe.PaymentMethod.list(customer=customer_id, type='card')
             cust = stripe.Customer.retrieve(customer_id)
             default_pm = None
@@ -346,7 +483,9 @@ class StripePaymentService:
                     'exp_year': getattr(card, 'exp_year', None) if card else None,
                     'is_default': getattr(pm, 'id', None) == default_pm,
                 })
-            return { 'success': True, 'items': items }
+            result = { 'success': True, 'items': items }
+            _cache_put(_customer_cache, key, result, CUSTOMER_CACHE_TTL)
+            return result
         except Exception as e:
             logger.warning('Stripe list_payment_methods failed: %s', e)
             return { 'success': False, 'message': str(e), 'items': [] }
@@ -355,9 +494,9 @@ class StripePaymentService:
         if not self.enabled or not customer_id or not payment_method_id:
             return { 'success': False, 'message': 'Stripe disabled or missing parameters' }
         try:
-            import stripe
-            stripe.api_key = self.config.secret_key
+            stripe = self._stripe()
             stripe.Customer.modify(customer_id, invoice_settings={'default_payment_method': payment_method_id})
+            _invalidate_customer(customer_id)
             return { 'success': True }
         except Exception as e:
             logger.warning('Stripe set_default_payment_method failed: %s', e)
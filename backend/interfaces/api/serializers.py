@@ -188,6 +188,7 @@ class ReceiptUploadResponseSerializer(serializers.Serializer):
     file_url = serializers.CharField(required=False)
     status = serializers.CharField(required=False)
     ocr_processed = serializers.BooleanField(required=False)
+    ocr_queued = serializers.BooleanField(required=False)
     ocr_data = serializers.DictField(required=False)
     ocr_error = serializers.CharField(required=False)
     error = serializers.CharField(required=False)
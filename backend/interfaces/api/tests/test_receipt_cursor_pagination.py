@@ -0,0 +1,72 @@
+from decimal import Decimal
+from uuid import uuid4
+
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from infrastructure.database.models import User as UserModel, Receipt as ReceiptModel
+
+
+class ReceiptAmountCursorPaginationTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = UserModel.objects.create(
+            id=uuid4(),
+            email='pager@example.com',
+            first_name='Page',
+            last_name='User',
+            is_active=True,
+        )
+        self.client.force_authenticate(user=self.user)
+
+        # Amounts are stored as strings; '9.50' < '10.00' numerically but not as text,
+        # several amounts repeat, and a few receipts have no amount at all
+        amounts = ['9.50', '10.00', '100.00', '2.25', '10.00', '10.00', '75.5', '0.99'] * 4 + [None] * 3
+        for i, amount in enumerate(amounts):
+            ocr_data = {'merchant_name': f'M{i}', 'currency': 'GBP'}
+            if amount is not None:
+                ocr_data['total_amount'] = amount
+            ReceiptModel.objects.create(
+                id=uuid4(),
+                user_id=self.user.id,
+                filename=f'r{i}.jpg',
+                file_size=100,
+                mime_type='image/jpeg',
+                file_url=f'http://example.com/r{i}.jpg',
+                status='processed',
+                receipt_type='purchase',
+                ocr_data=ocr_data,
+                metadata={'custom_fields': {}},
+            )
+        self.expected_count = len(amounts)
+
+    def _page_all(self, order):
+        ids, amounts, cursor = [], [], None
+        for _ in range(10):
+            url = f'/api/v1/receipts/?accountId={self.user.id}&sort=amount&order={order}&limit=12'
+            if cursor:
+                url += f'&cursor={cursor}'
+            resp = self.client.get(url)
+            self.assertEqual(resp.status_code, 200, resp.content)
+            for item in resp.data['items']:
+                ids.append(item['id'])
+                amounts.append(item['amount'])
+            cursor = resp.data['pageInfo']['nextCursor']
+            if not resp.data['pageInfo']['hasNext']:
+                break
+        return ids, amounts
+
+    def test_amount_desc_pages_have_no_gaps_or_duplicates(self):
+        ids, amounts = self._page_all('desc')
+        self.assertEqual(len(ids), self.expected_count)
+        self.assertEqual(len(set(ids)), self.expected_count)
+        # Receipts without an amount come first when descending, then numeric order
+        numeric = [Decimal(str(a)) for a in amounts[3:]]
+        self.assertEqual(numeric, sorted(numeric, reverse=True))
+
+    def test_amount_asc_pages_have_no_gaps_or_duplicates(self):
+        ids, amounts = self._page_all('asc')
+        self.assertEqual(len(ids), self.expected_count)
+        self.assertEqual(len(set(ids)), self.expected_count)
+        numeric = [Decimal(str(a)) for a in amounts[:-3]]
+        self.assertEqual(numeric, sorted(numeric))
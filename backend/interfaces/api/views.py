@@ -807,42 +807,51 @@ class ReceiptParseView(APIView):
     """
     POST /api/v1/receipts/parse?engine=paddle|openai&source=file|url
     - If source=file: multipart upload, stored to Cloudinary first
+      (several "file" parts are parsed together: one OpenAI call, or concurrent Paddle calls)
     - If source=url: JSON body {"url": "..."}
     """
     permission_classes = [IsAuthenticated]
 
     def post(self, request):
+        from application.receipts.ports import OCRProvider
+
+        def call_provider(provider: OCRProvider, *, file_bytes=None, url=None, filename: str = None, upload=None):
+            if upload is not None:
+                # Seekable uploads are streamed into the request body by the Paddle adapter
+                options = {"filename": upload.name, "content_type": upload.content_type}
+                return provider.parse_receipt(file_stream=upload, options=options)
+            options = {"filename": filename} if filename else {}
+            return provider.parse_receipt(file_bytes=file_bytes, url=url, options=options)
+
         try:
             engine = request.query_params.get('engine', getattr(settings, 'OCR_ENGINE_DEFAULT', 'paddle'))
             source = request.query_params.get('source', 'file')
 
             # Prepare providers
-            from application.receipts.ports import OCRProvider
             from infrastructure.storage.adapters.cloudinary_store import CloudinaryStorageAdapter
             from infrastructure.ocr.adapters.paddle_http import PaddleOCRHTTPAdapter
             from infrastructure.ocr.adapters.openai_vision import OpenAIVisionAdapter
 
             storage = CloudinaryStorageAdapter()
 
-            def call_provider(provider: OCRProvider, *, file_bytes=None, url=None, filename: str = None):
-                options = {"filename": filename} if filename else {}
-                return provider.parse_receipt(file_bytes=file_bytes, url=url, options=options)
-
             # Handle input
             if source == 'file':
                 if 'file' not in request.FILES:
                     return Response({"detail": "file is required"}, status=status.HTTP_422_UNPROCESSABLE_ENTITY)
+                files = request.FILES.getlist('file')
+                if len(files) > 1:
+                    return self._parse_batch(files, engine, storage)
                 f = request.FILES['file']
                 if f.size > getattr(settings, 'MAX_RECEIPT_MB', 10) * 1024 * 1024:
                     return Response({"detail": "File too large"}, status=status.HTTP_422_UNPROCESSABLE_ENTITY)
-                file_bytes = f.read()
                 filename = f.name
                 if engine == 'openai':
                     provider = OpenAIVisionAdapter(storage=storage)
-                    extraction = call_provider(provider, file_bytes=file_bytes, filename=filename)
+                    extraction = call_provider(provider, file_bytes=f.read(), filename=filename)
                 else:
+                    # Hand the upload over as a stream; no intermediate bytes copy
                     provider = PaddleOCRHTTPAdapter()
-                    extraction = call_provider(provider, file_bytes=file_bytes, filename=filename)
+                    extraction = call_provider(provider, upload=f)
             else:
                 data = request.data or {}
                 url = data.get('url')
@@ -870,9 +879,10 @@ class ReceiptParseView(APIView):
                     provider = PaddleOCRHTTPAdapter()
                     if source == 'file' and 'file' in request.FILES:
                         f = request.FILES['file']
-                        extraction = provider.parse_receipt(file_bytes=f.read(), options={"filename": f.name})
+                        f.seek(0)
+                        extraction = call_provider(provider, upload=f)
                     else:
-                        extraction = provider.parse_receipt(url=(request.data or {}).get('url'))
+                        extraction = call_provider(provider, url=(request.data or {}).get('url'))
                     from .serializers import ReceiptParseResponseSerializer
                     ser = ReceiptParseResponseSerializer(extraction.model_dump())
                     return Response(ser.data, status=status.HTTP_200_OK)
@@ -880,6 +890,38 @@ class ReceiptParseView(APIView):
                     pass
             return Response({"detail": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+    def _parse_batch(self, files, engine, storage):
+        """Parse several uploaded receipts: one batched OpenAI call, or concurrent Paddle OCR calls."""
+        from asgiref.sync import async_to_sync
+        from infrastructure.ocr.adapters.paddle_http import PaddleOCRHTTPAdapter
+        from infrastructure.ocr.adapters.openai_vision import OpenAIVisionAdapter
+        from .serializers import ReceiptParseResponseSerializer
+
+        max_bytes = getattr(settings, 'MAX_RECEIPT_MB', 10) * 1024 * 1024
+        if any(f.size > max_bytes for f in files):
+            return Response({"detail": "File too large"}, status=status.HTTP_422_UNPROCESSABLE_ENTITY)
+
+        contents = [f.read() for f in files]
+        outcomes = None
+        if engine == 'openai':
+            try:
+                outcomes = OpenAIVisionAdapter(storage=storage).parse_receipts(
+                    contents, options=[{"filename": f.name} for f in files]
+                )
+            except Exception as e:
+                if not getattr(settings, 'FALLBACK_TO_PADDLE', True):
+                    raise
+                logger.warning("OpenAI batch parse failed, falling back to Paddle: %s", e)
+        if outcomes is None:
+            outcomes = async_to_sync(PaddleOCRHTTPAdapter().parse_receipts_batch)(contents)
+        results = []
+        for f, outcome in zip(files, outcomes):
+            if isinstance(outcome, Exception):
+                results.append({"filename": f.name, "detail": str(outcome)})
+            else:
+                results.append({"filename": f.name, **ReceiptParseResponseSerializer(outcome.model_dump()).data})
+        return Response({"results": results}, status=status.HTTP_200_OK)
+
 
 class ReceiptReprocessView(APIView):
     """
@@ -2009,106 +2051,40 @@ class ReceiptListView(APIView):
     def _apply_cursor_pagination(self, queryset, cursor_info, sort):
         """Apply cursor-based pagination to the queryset."""
         from django.db import connection
-        from django.db.models import Q, DecimalField, FloatField, DateField, F
-        from django.db.models.functions import Cast
-        is_pg = connection.vendor == 'postgresql'
-        KeyTextTransform = None
-        if is_pg:
-            try:
-                from django.db.models.fields.json import KeyTextTransform as _KTT  # type: ignore
-                KeyTextTransform = _KTT
-            except Exception:
-                try:
-                    from django.contrib.postgres.fields.jsonb import KeyTextTransform as _KTT  # type: ignore
-                    KeyTextTransform = _KTT
-                except Exception:
-                    is_pg = False
-        if cursor_info.order == 'desc':
-            # For descending order, get rows with (sort_value, id) < (cursor_sort_value, cursor_id)
-            if sort == 'date':
-                # Compare directly on created_at date for robustness
-                queryset = queryset.filter(
-                    Q(created_at__date__lt=cursor_info.key[0]) | (Q(created_at__date=cursor_info.key[0]) & Q(id__lt=cursor_info.key[1]))
-                )
-            elif sort == 'amount' and is_pg and KeyTextTransform:
-                sort_val = Cast(
-                    KeyTextTransform('total_amount', 'ocr_data'),
-                    output_field=DecimalField(max_digits=12, decimal_places=2),
-                )
-                queryset = queryset.annotate(_sort_val=sort_val).filter(
-                    Q(_sort_val__lt=cursor_info.key[0]) | (Q(_sort_val=cursor_info.key[0]) & Q(id__lt=cursor_info.key[1]))
-                )
-            elif sort == 'merchant' and is_pg and KeyTextTransform:
-                queryset = queryset.annotate(_sort_val=KeyTextTransform('merchant_name', 'ocr_data')).filter(
-                    Q(_sort_val__lt=cursor_info.key[0]) | (Q(_sort_val=cursor_info.key[0]) & Q(id__lt=cursor_info.key[1]))
-                )
-            elif sort == 'confidence' and is_pg and KeyTextTransform:
-                sort_val = Cast(KeyTextTransform('confidence_score', 'ocr_data'), output_field=FloatField())
-                queryset = queryset.annotate(_sort_val=sort_val).filter(
-                    Q(_sort_val__lt=cursor_info.key[0]) | (Q(_sort_val=cursor_info.key[0]) & Q(id__lt=cursor_info.key[1]))
-                )
-        else:
-            # For ascending order, get rows with (sort_value, id) > (cursor_sort_value, cursor_id)
-            if sort == 'date':
-                queryset = queryset.filter(
-                    Q(created_at__date__gt=cursor_info.key[0]) | (Q(created_at__date=cursor_info.key[0]) & Q(id__gt=cursor_info.key[1]))
-                )
-            elif sort == 'amount' and is_pg and KeyTextTransform:
-                sort_val = Cast(
-                    KeyTextTransform('total_amount', 'ocr_data'),
-                    output_field=DecimalField(max_digits=12, decimal_places=2),
-                )
-                queryset = queryset.annotate(_sort_val=sort_val).filter(
-                    Q(_sort_val__gt=cursor_info.key[0]) | (Q(_sort_val=cursor_info.key[0]) & Q(id__gt=cursor_info.key[1]))
-                )
-            elif sort == 'merchant' and is_pg and KeyTextTransform:
-                queryset = queryset.annotate(_sort_val=KeyTextTransform('merchant_name', 'ocr_data')).filter(
-                    Q(_sort_val__gt=cursor_info.key[0]) | (Q(_sort_val=cursor_info.key[0]) & Q(id__gt=cursor_info.key[1]))
-                )
-            elif sort == 'confidence' and is_pg and KeyTextTransform:
-                sort_val = Cast(KeyTextTransform('confidence_score', 'ocr_data'), output_field=FloatField())
-                queryset = queryset.annotate(_sort_val=sort_val).filter(
-                    Q(_sort_val__gt=cursor_info.key[0]) | (Q(_sort_val=cursor_info.key[0]) & Q(id__gt=cursor_info.key[1]))
+        from django.db.models import Q
+        from infrastructure.pagination.cursor import CursorPagination
+        if sort == 'date':
+            # Compare directly on created_at date for robustness
+            key_date, key_id = cursor_info.key
+            if cursor_info.order == 'desc':
+                return queryset.filter(
+                    Q(created_at__date__lt=key_date) | (Q(created_at__date=key_date) & Q(id__lt=key_id))
                 )
-        
+            return queryset.filter(
+                Q(created_at__date__gt=key_date) | (Q(created_at__date=key_date) & Q(id__gt=key_id))
+            )
+        if connection.vendor == 'postgresql' and sort in CursorPagination.SORT_FIELDS:
+            # Same expressions as _apply_sorting, so pages neither skip nor repeat rows
+            where_clause, params = CursorPagination.build_where_clause(cursor_info, CursorPagination.SORT_FIELDS[sort])
+            return queryset.extra(where=[where_clause], params=params)
         return queryset
     
     def _apply_sorting(self, queryset, sort, order):
         """Apply sorting to the queryset."""
         from django.db import connection
-        from django.db.models import DecimalField, FloatField, DateField, F
+        from django.db.models import DateField, F
         from django.db.models.functions import Cast
-        is_pg = connection.vendor == 'postgresql'
-        KeyTextTransform = None
-        if is_pg:
-            try:
-                from django.db.models.fields.json import KeyTextTransform as _KTT  # type: ignore
-                KeyTextTransform = _KTT
-            except Exception:
-                try:
-                    from django.contrib.postgres.fields.jsonb import KeyTextTransform as _KTT  # type: ignore
-                    KeyTextTransform = _KTT
-                except Exception:
-                    is_pg = False
+        from infrastructure.pagination.cursor import CursorPagination
         if sort == 'date':
             # order directly on created_at for maximum compatibility
             if order == 'desc':
                 return queryset.order_by('-created_at', '-id')
             return queryset.order_by('created_at', 'id')
-        elif sort == 'amount' and is_pg and KeyTextTransform:
-            sort_val = Cast(
-                KeyTextTransform('total_amount', 'ocr_data'),
-                output_field=DecimalField(max_digits=12, decimal_places=2),
-            )
-        elif sort == 'confidence' and is_pg and KeyTextTransform:
-            sort_val = Cast(KeyTextTransform('confidence_score', 'ocr_data'), output_field=FloatField())
-        elif sort == 'merchant' and is_pg and KeyTextTransform:
-            sort_val = KeyTextTransform('merchant_name', 'ocr_data')
-        else:
-            # Fallback for non-postgres or unsupported sort fields
-            sort_val = Cast(F('created_at'), output_field=DateField())
+        if connection.vendor == 'postgresql' and sort in CursorPagination.SORT_FIELDS:
+            return queryset.order_by(*CursorPagination.order_by(CursorPagination.SORT_FIELDS[sort], order))
 
-        queryset = queryset.annotate(_sort_val=sort_val)
+        # Fallback for non-postgres or unsupported sort fields
+        queryset = queryset.annotate(_sort_val=Cast(F('created_at'), output_field=DateField()))
         if order == 'desc':
             queryset = queryset.order_by('-_sort_val', '-id')
         else:
@@ -4119,54 +4095,19 @@ class TransactionCreateView(APIView):
         """Apply cursor-based pagination to the queryset."""
         from infrastructure.pagination.cursor import CursorPagination
         
-        # Map API sort fields to database fields
-        sort_field_mapping = {
-            'date': 'ocr_data__date',
-            'amount': 'ocr_data__total_amount',
-            'merchant': 'ocr_data__merchant_name',
-            'confidence': 'ocr_data__confidence_score'
-        }
-        
-        db_sort_field = sort_field_mapping.get(sort, 'ocr_data__date')
+        db_sort_field = CursorPagination.SORT_FIELDS.get(sort, 'ocr_data__date')
         
         # Build where clause for cursor pagination
         where_clause, params = CursorPagination.build_where_clause(cursor_info, db_sort_field)
-        
-        # Apply the cursor filter
-        from django.db.models import Q
-        if cursor_info.order == 'desc':
-            # For descending order, get rows with (sort_value, id) < (cursor_sort_value, cursor_id)
-            queryset = queryset.extra(
-                where=[where_clause],
-                params=params
-            )
-        else:
-            # For ascending order, get rows with (sort_value, id) > (cursor_sort_value, cursor_id)
-            queryset = queryset.extra(
-                where=[where_clause],
-                params=params
-            )
-        
-        return queryset
+        return queryset.extra(where=[where_clause], params=params)
     
     def _apply_sorting(self, queryset, sort, order):
         """Apply sorting to the queryset."""
-        # Map API sort fields to database fields
-        sort_field_mapping = {
-            'date': 'ocr_data__date',
-            'amount': 'ocr_data__total_amount',
-            'merchant': 'ocr_data__merchant_name',
-            'confidence': 'ocr_data__confidence_score'
-        }
-        
-        db_sort_field = sort_field_mapping.get(sort, 'ocr_data__date')
-        
-        if order == 'desc':
-            queryset = queryset.order_by(f'-{db_sort_field}', '-id')
-        else:
-            queryset = queryset.order_by(db_sort_field, 'id')
+        from infrastructure.pagination.cursor import CursorPagination
         
-        return queryset
+        # Order by the same expressions the cursor compares
+        db_sort_field = CursorPagination.SORT_FIELDS.get(sort, 'ocr_data__date')
+        return queryset.order_by(*CursorPagination.order_by(db_sort_field, order))
     
     def _build_response(self, result, params, cursor_info):
         """Build the API response with cursor pagination."""
@@ -0,0 +1,16 @@
+"""
+Celery application for smart_accounts project.
+
+Workers are started with ``celery -A smart_accounts worker``; configuration
+is read from the ``CELERY_*`` Django settings.
+"""
+
+import os
+
+from celery import Celery
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "smart_accounts.settings")
+
+app = Celery("smart_accounts")
+app.config_from_object("django.conf:settings", namespace="CELERY")
+app.autodiscover_tasks()
@@ -226,10 +226,24 @@ OCR_TIMEOUT_SECONDS = env.int(
     "OCR_TIMEOUT_SECONDS",
     default=env.int("PADDLE_TIMEOUT_SECONDS", default=25)
 )
+# Seconds an OpenAI Vision transcription stays in the shared cache, keyed by image hash
+OCR_RESULT_CACHE_TTL = env.int("OCR_RESULT_CACHE_TTL", default=7 * 24 * 3600)
+# Run receipt OCR in the Celery worker instead of during the upload request
+OCR_ASYNC_PROCESSING = env.bool("OCR_ASYNC_PROCESSING", default=False)
+# Async OpenAI Vision calls in flight per event loop, and process-wide request starts per second
+OCR_MAX_CONCURRENCY = env.int("OCR_MAX_CONCURRENCY", default=4)
+OCR_OPENAI_MAX_RPS = env.float("OCR_OPENAI_MAX_RPS", default=5.0)
+# CPU inference threads for in-process PaddleOCR; 0 means half the cores
+OCR_PADDLE_CPU_THREADS = env.int("OCR_PADDLE_CPU_THREADS", default=0)
+# Recognition confidence below which in-process PaddleOCR lines are discarded
+OCR_PADDLE_CONF = env.float("OCR_PADDLE_CONF", default=0.5)
 MAX_RECEIPT_MB = env.int(
     "MAX_RECEIPT_MB",
     default=env.int("OCR_MAX_IMAGE_MB", default=10)
 )
+# Files above this are rejected before OCR; larger images are downscaled to this long side
+MAX_OCR_BYTES = env.int("MAX_OCR_BYTES", default=MAX_RECEIPT_MB * 1024 * 1024)
+OCR_MAX_IMAGE_SIDE = env.int("OCR_MAX_IMAGE_SIDE", default=1600)
 PADDLE_OCR_LANGUAGE = env("PADDLEOCR_LANGUAGE", default="en")
 
 # External Paddle FastAPI service
@@ -32,11 +32,14 @@ import os
 AWS_SES_ACCESS_KEY_ID = os.environ.get('AWS_SES_ACCESS_KEY_ID')
 AWS_SES_SECRET_ACCESS_KEY = os.environ.get('AWS_SES_SECRET_ACCESS_KEY')
 AWS_SES_REGION = os.environ.get('AWS_SES_REGION', 'us-east-1')
+# Client-side cap on SES sends per second; keep just under the account quota
+AWS_SES_MAX_RPS = int(os.environ.get('AWS_SES_MAX_RPS', 13))
 
 # Email Backend Configuration
 # You can change this to control email delivery:
 # 'infrastructure.email.aws_ses_backend.DevelopmentAWSSESBackend' - AWS SES with dev logging
 # 'infrastructure.email.aws_ses_backend.AWSSESBackend' - AWS SES production
+# 'infrastructure.email.aws_ses_backend.AsyncAWSSESBackend' - AWS SES via aioboto3, concurrent sends
 # 'django.core.mail.backends.console.EmailBackend' - Console output (default)
 EMAIL_BACKEND = os.environ.get('EMAIL_BACKEND', 'django.core.mail.backends.console.EmailBackend')
 
@@ -103,6 +106,8 @@ CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE
+# Run tasks (e.g. email delivery) inline unless a worker is running
+CELERY_TASK_ALWAYS_EAGER = env.bool('CELERY_TASK_ALWAYS_EAGER', default=True)
 
 # OCR Configuration for Development
 OCR_PROVIDER = env('OCR_PROVIDER', default='openai_vision')
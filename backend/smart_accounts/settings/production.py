@@ -74,6 +74,7 @@ STRIPE_WEBHOOK_SECRET = env('STRIPE_WEBHOOK_SECRET')
 AWS_SES_ACCESS_KEY_ID = env('AWS_SES_ACCESS_KEY_ID')
 AWS_SES_SECRET_ACCESS_KEY = env('AWS_SES_SECRET_ACCESS_KEY')
 AWS_SES_REGION = env('AWS_SES_REGION', default='eu-west-1')
+AWS_SES_MAX_RPS = env.int('AWS_SES_MAX_RPS', default=13)
 
 # Cloudinary Configuration for Production
 CLOUDINARY_CLOUD_NAME = env('CLOUDINARY_CLOUD_NAME')
@@ -0,0 +1,47 @@
+import json
+from unittest.mock import MagicMock
+
+from django.core.mail import EmailMessage, EmailMultiAlternatives
+
+from infrastructure.email.aws_ses_backend import AWSSESBackend
+
+
+def _backend(statuses):
+    backend = AWSSESBackend(fail_silently=False)
+    backend.connection = MagicMock()
+    backend.connection.send_bulk_templated_email.return_value = {'Status': statuses}
+    backend.connection.send_email.return_value = {'MessageId': 'm-1'}
+    AWSSESBackend._registered_templates.clear()
+    return backend
+
+
+def test_identical_messages_share_one_bulk_call_and_count_successes():
+    backend = _backend([{'Status': 'Success'}, {'Status': 'MessageRejected', 'Error': 'nope'}, {'Status': 'Success'}])
+    newsletter = [
+        EmailMultiAlternatives('Hi {{name}}', 'Body', 'noreply@example.com', [f'u{i}@example.com'],
+                               alternatives=[('<p>Body</p>', 'text/html')])
+        for i in range(3)
+    ]
+    other = EmailMessage('Other', 'Different', 'noreply@example.com', ['x@example.com'])
+
+    sent = backend.send_messages(newsletter + [newsletter[0], other])
+
+    # The duplicate is dropped; three recipients go in one bulk call, one rejected
+    assert sent == 2 + 1
+    bulk = backend.connection.send_bulk_templated_email.call_args.kwargs
+    assert bulk['Template'] == 'smart-accounts-bulk-html'
+    assert [d['Destination']['ToAddresses'] for d in bulk['Destinations']] == [['u0@example.com'], ['u1@example.com'], ['u2@example.com']]
+    assert json.loads(bulk['DefaultTemplateData']) == {'subject': 'Hi {{name}}', 'text': 'Body', 'html': '<p>Body</p>'}
+    backend.connection.send_email.assert_called_once()
+
+
+def test_bulk_templates_are_fixed_and_created_once():
+    backend = _backend([{'Status': 'Success'}, {'Status': 'Success'}])
+    for subject in ('First', 'Second'):
+        backend.send_messages([
+            EmailMessage(subject, 'Body', 'noreply@example.com', [to]) for to in ('a@example.com', 'b@example.com')
+        ])
+
+    templates = [c.kwargs['Template'] for c in backend.connection.create_template.call_args_list]
+    assert templates == [{'TemplateName': 'smart-accounts-bulk-text', 'SubjectPart': '{{{subject}}}', 'TextPart': '{{{text}}}'}]
+    assert backend.connection.send_bulk_templated_email.call_count == 2
@@ -0,0 +1,67 @@
+import pytest
+
+cv2 = pytest.importorskip('cv2')
+np = pytest.importorskip('numpy')
+
+from infrastructure.ocr.enhanced_paddle_ocr import EnhancedPaddleOCRService
+
+MERCHANT_BOX = [[0, 0], [40, 0], [40, 10], [0, 10]]
+TOTAL_BOX = [[0, 20], [60, 20], [60, 30], [0, 30]]
+
+
+class FakePaddle:
+    """Detects two boxes per image and names each crop after its width and colour."""
+
+    def __init__(self):
+        self.detect_calls = 0
+        self.recognize_batches = []
+
+    def ocr(self, image, det=True, rec=True, **kwargs):
+        if not rec:
+            self.detect_calls += 1
+            return [[TOTAL_BOX, MERCHANT_BOX]]
+        assert det is False, 'recognition must run on the batched crops only'
+        crops = image[0]
+        self.recognize_batches.append(len(crops))
+        return [[
+            (f'SHOP {crop[0, 0, 0]}' if crop.shape[1] == 40 else f'TOTAL {crop[0, 0, 0]}.00', 0.95)
+            for crop in crops
+        ]]
+
+
+@pytest.fixture
+def service():
+    EnhancedPaddleOCRService._result_cache.clear()
+    svc = EnhancedPaddleOCRService()
+    svc.ocr = FakePaddle()
+    svc._ocr_kwargs = {}
+    yield svc
+    EnhancedPaddleOCRService._result_cache.clear()
+
+
+def _image(tmp_path, value):
+    path = tmp_path / f'receipt-{value}.png'
+    cv2.imwrite(str(path), np.full((40, 80, 3), value, dtype=np.uint8))
+    return str(path)
+
+
+def test_pipeline_detects_per_image_and_recognizes_crops_in_one_batch(service, tmp_path):
+    paths = [_image(tmp_path, 11), str(tmp_path / 'missing.png'), _image(tmp_path, 22), _image(tmp_path, 33)]
+
+    results = service.process_receipt_images_batch(paths, max_batch=8, max_wait_ms=500)
+
+    assert service.ocr.detect_calls == 3
+    assert service.ocr.recognize_batches == [6]
+    # Results keep input order, with crops read top to bottom within each receipt
+    assert [r.get('raw_text') for r in results] == ['SHOP 11\nTOTAL 11.00', None, 'SHOP 22\nTOTAL 22.00', 'SHOP 33\nTOTAL 33.00']
+    assert results[1]['message'] == 'Image not found'
+
+
+def test_pipeline_serves_repeated_images_from_the_result_cache(service, tmp_path):
+    paths = [_image(tmp_path, 44), _image(tmp_path, 55)]
+    first = service.process_receipt_images_batch(paths, max_batch=8, max_wait_ms=500)
+
+    again = service.process_receipt_images_batch(paths, max_batch=8, max_wait_ms=500)
+
+    assert service.ocr.recognize_batches == [4]
+    assert [r['raw_text'] for r in again] == [r['raw_text'] for r in first]
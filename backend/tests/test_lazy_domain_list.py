@@ -0,0 +1,71 @@
+from itertools import islice
+
+from infrastructure.database.repositories import LazyDomainList
+
+
+class FakeQuerySet:
+    def __init__(self, rows):
+        self.rows = rows
+        self.iterations = 0
+        self.pulled = 0
+
+    def iterator(self, chunk_size):
+        self.iterations += 1
+        for row in self.rows:
+            self.pulled += 1
+            yield row
+
+
+class RecordingMapper:
+    def __init__(self):
+        self.batches = []
+
+    def __call__(self, batch):
+        self.batches.append(list(batch))
+        return [f'domain-{row}' for row in batch]
+
+
+def test_iteration_streams_rows_and_maps_them_in_chunks():
+    queryset, mapper = FakeQuerySet(list(range(7))), RecordingMapper()
+    items = LazyDomainList(queryset, mapper, chunk_size=3)
+
+    first = list(islice(iter(items), 2))
+
+    assert first == ['domain-0', 'domain-1']
+    # Only the first chunk was read and mapped
+    assert queryset.pulled == 3 and mapper.batches == [[0, 1, 2]]
+    assert repr(items) == '<LazyDomainList (unevaluated)>'
+
+    assert [item for item in items] == [f'domain-{i}' for i in range(7)]
+    assert mapper.batches[1:] == [[0, 1, 2], [3, 4, 5], [6]]
+
+
+def test_list_runs_the_query_once():
+    queryset = FakeQuerySet(list(range(5)))
+    items = LazyDomainList(queryset, RecordingMapper(), chunk_size=2)
+
+    # list() takes the iterator and then calls len() before pulling a row
+    assert list(items) == [f'domain-{i}' for i in range(5)]
+    assert queryset.iterations == 1
+
+
+def test_len_index_and_truthiness_materialize_once():
+    queryset, mapper = FakeQuerySet(list(range(4))), RecordingMapper()
+    items = LazyDomainList(queryset, mapper, chunk_size=3)
+
+    assert len(items) == 4
+    assert items[1] == 'domain-1'
+    assert items[-1] == 'domain-3'
+    assert items[1:3] == ['domain-1', 'domain-2']
+    assert bool(items) is True
+    assert list(items) == [f'domain-{i}' for i in range(4)]
+    assert 'domain-2' in items
+    assert queryset.iterations == 1
+
+
+def test_empty_result_is_falsy():
+    items = LazyDomainList(FakeQuerySet([]), RecordingMapper())
+
+    assert not items
+    assert len(items) == 0
+    assert list(items) == []
@@ -0,0 +1,17 @@
+from datetime import datetime
+
+import pytest
+
+from infrastructure.ocr.services import OCRService
+
+
+@pytest.mark.parametrize('line, expected', [
+    ('Date: 2024-12-15', datetime(2024, 12, 15)),
+    ('Date: 15/12/2024', datetime(2024, 12, 15)),
+    ('Date: 15-12-24', datetime(2024, 12, 15)),
+    ('15 Dec 2024 14:02', datetime(2024, 12, 15)),
+    ('Ref 123 15/12/2024', datetime(2024, 12, 15)),
+    ('Total 12.50', None),
+])
+def test_match_date(line, expected):
+    assert OCRService()._match_date(line) == expected
@@ -0,0 +1,95 @@
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+
+from infrastructure.ocr import services
+from infrastructure.ocr.services import OCRService, OCRMethod
+
+
+@pytest.fixture(autouse=True)
+def clean_caches():
+    services._text_cache.clear()
+    services._parse_cache.clear()
+    cache.clear()
+    yield
+    services._text_cache.clear()
+    services._parse_cache.clear()
+    cache.clear()
+
+
+def _image(tmp_path, name, content):
+    path = tmp_path / name
+    path.write_bytes(content)
+    return str(path)
+
+
+def test_identical_image_bytes_skip_the_engine(tmp_path):
+    first = _image(tmp_path, 'a.jpg', b'same receipt')
+    copy = _image(tmp_path, 'b.jpg', b'same receipt')
+    other = _image(tmp_path, 'c.jpg', b'other receipt')
+
+    with patch.object(OCRService, '_extract_with_paddle_ocr', return_value=(True, 'TESCO 4.20', None)) as engine:
+        service = OCRService()
+        assert service.extract_text_from_image(first, OCRMethod.PADDLE_OCR) == (True, 'TESCO 4.20', None)
+        assert service.extract_text_from_image(copy, OCRMethod.PADDLE_OCR) == (True, 'TESCO 4.20', None)
+        assert engine.call_count == 1
+
+        service.extract_text_from_image(other, OCRMethod.PADDLE_OCR)
+        assert engine.call_count == 2
+
+
+def test_failed_extractions_are_not_cached(tmp_path):
+    image = _image(tmp_path, 'a.jpg', b'flaky receipt')
+    outcomes = [(False, None, 'engine down'), (True, 'TESCO 4.20', None)]
+
+    with patch.object(OCRService, '_extract_with_paddle_ocr', side_effect=outcomes) as engine:
+        service = OCRService()
+        assert service.extract_text_from_image(image, OCRMethod.PADDLE_OCR)[0] is False
+        assert service.extract_text_from_image(image, OCRMethod.PADDLE_OCR) == (True, 'TESCO 4.20', None)
+        assert engine.call_count == 2
+
+
+def test_openai_text_survives_a_process_restart_via_django_cache(tmp_path):
+    image = _image(tmp_path, 'a.jpg', b'openai receipt')
+
+    with patch.object(OCRService, '_extract_with_openai_vision', return_value=(True, 'ALDI 9.99', None)) as engine:
+        OCRService(OCRMethod.OPENAI_VISION).extract_text_from_image(image, OCRMethod.OPENAI_VISION)
+        # A new process starts with an empty in-memory LRU
+        services._text_cache.clear()
+        result = OCRService(OCRMethod.OPENAI_VISION).extract_text_from_image(image, OCRMethod.OPENAI_VISION)
+
+    assert result == (True, 'ALDI 9.99', None)
+    assert engine.call_count == 1
+
+
+def test_lru_evicts_the_least_recently_used_image(tmp_path, monkeypatch):
+    monkeypatch.setattr(services, 'OCR_CACHE_SIZE', 2)
+    images = [_image(tmp_path, f'{i}.jpg', f'receipt {i}'.encode()) for i in range(3)]
+
+    with patch.object(OCRService, '_extract_with_paddle_ocr', return_value=(True, 'TEXT', None)) as engine:
+        service = OCRService()
+        service.extract_text_from_image(images[0], OCRMethod.PADDLE_OCR)
+        service.extract_text_from_image(images[1], OCRMethod.PADDLE_OCR)
+        service.extract_text_from_image(images[0], OCRMethod.PADDLE_OCR)  # refresh 0
+        service.extract_text_from_image(images[2], OCRMethod.PADDLE_OCR)  # evicts 1
+        assert engine.call_count == 3
+
+        service.extract_text_from_image(images[0], OCRMethod.PADDLE_OCR)
+        assert engine.call_count == 3
+        service.extract_text_from_image(images[1], OCRMethod.PADDLE_OCR)
+        assert engine.call_count == 4
+
+
+def test_parsed_receipts_are_cached_by_text_and_returned_as_copies():
+    service = OCRService()
+    text = 'TESCO STORES\n01/02/2024\nTOTAL £4.20'
+
+    with patch.object(OCRService, '_parse_lines', wraps=service._parse_lines) as parse:
+        first = service._parse_receipt_text(text)
+        first.merchant_name = 'changed by caller'
+        second = service._parse_receipt_text(text)
+
+    assert parse.call_count == 1
+    assert second.merchant_name != 'changed by caller'
+    assert second.total_amount == service._parse_lines(text).total_amount
@@ -0,0 +1,84 @@
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from infrastructure.ocr import services
+from infrastructure.ocr.services import OCRService
+
+
+def _response(chunks, content_length=None):
+    response = MagicMock()
+    response.__enter__.return_value = response
+    response.headers = {'Content-Length': str(content_length)} if content_length is not None else {}
+    response.iter_content.return_value = iter(chunks)
+    return response
+
+
+@pytest.fixture
+def small_limit(settings):
+    settings.MAX_OCR_BYTES = 10
+
+
+def test_download_capped_rejects_declared_length_before_reading(small_limit):
+    response = _response([b'x' * 5], content_length=11)
+    with patch.object(services, '_http_session') as session:
+        session.return_value.get.return_value = response
+        with pytest.raises(ValueError, match='too large'):
+            services._download_capped('https://example.com/r.jpg', timeout=5)
+    response.iter_content.assert_not_called()
+
+
+def test_download_capped_stops_reading_past_the_limit(small_limit):
+    chunks = iter([b'x' * 6, b'x' * 6, b'never read'])
+    with patch.object(services, '_http_session') as session:
+        session.return_value.get.return_value = _response(chunks)
+        with pytest.raises(ValueError, match='too large'):
+            services._download_capped('https://example.com/r.jpg', timeout=5)
+    assert next(chunks) == b'never read'
+
+
+def test_download_capped_returns_body_within_limit(small_limit):
+    with patch.object(services, '_http_session') as session:
+        session.return_value.get.return_value = _response([b'abc', b'def'], content_length=6)
+        assert services._download_capped('https://example.com/r.jpg', timeout=5) == b'abcdef'
+
+
+def test_with_downloaded_stops_writing_past_the_limit(small_limit, tmp_path):
+    chunks = iter([b'x' * 6, b'x' * 6, b'never read'])
+    fn = MagicMock()
+    with patch.object(services, '_http_session') as session, \
+            patch.object(services.tempfile, 'tempdir', str(tmp_path)):
+        session.return_value.get.return_value = _response(chunks)
+        with pytest.raises(ValueError, match='too large'):
+            OCRService()._with_downloaded('https://example.com/r.jpg', fn)
+    fn.assert_not_called()
+    assert next(chunks) == b'never read'
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_with_downloaded_rejects_declared_length_before_writing(small_limit):
+    response = _response([b'x' * 5], content_length=11)
+    fn = MagicMock()
+    with patch.object(services, '_http_session') as session:
+        session.return_value.get.return_value = response
+        with pytest.raises(ValueError, match='too large'):
+            OCRService()._with_downloaded('https://example.com/r.jpg', fn)
+    fn.assert_not_called()
+    response.iter_content.assert_not_called()
+
+
+def test_with_downloaded_passes_file_within_limit(small_limit):
+    with patch.object(services, '_http_session') as session:
+        session.return_value.get.return_value = _response([b'abc', b'def'], content_length=6)
+        assert OCRService()._with_downloaded('https://example.com/r.jpg', lambda path: Path(path).read_bytes()) == b'abcdef'
+
+
+def test_extract_receipt_data_refuses_oversized_file(small_limit, tmp_path):
+    image = tmp_path / 'receipt.jpg'
+    image.write_bytes(b'x' * 11)
+
+    success, data, error = OCRService().extract_receipt_data(str(image))
+
+    assert (success, data) == (False, None)
+    assert 'too large' in error
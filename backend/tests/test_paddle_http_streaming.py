@@ -0,0 +1,40 @@
+import email.parser
+import io
+
+import requests
+
+from infrastructure.ocr.adapters.paddle_http import _MultipartFileBody
+
+
+def _parse(body):
+    raw = b"Content-Type: " + body.content_type.encode() + b"\r\n\r\n" + body.read()
+    return email.parser.BytesParser().parsebytes(raw).get_payload()[0]
+
+
+def test_multipart_body_round_trips_file_part():
+    data = bytes(range(256)) * 1000
+    body = _MultipartFileBody("file", 'a"b.jpg', "image/jpeg", io.BytesIO(data))
+
+    part = _parse(body)
+
+    assert part.get_filename() == "a%22b.jpg"
+    assert part.get_content_type() == "image/jpeg"
+    assert part.get_payload(decode=True) == data
+
+
+def test_multipart_body_is_sized_and_rewindable():
+    stream = io.BytesIO(b"prefix-hello")
+    stream.seek(len(b"prefix-"))
+    body = _MultipartFileBody("file", "x.jpg", None, stream)
+
+    first = body.read()
+    assert len(first) == len(body)
+    assert b"prefix" not in first
+    body.seek(0)
+    assert b"".join(body) == first
+
+    # requests sends it as a sized stream rather than buffering it into bytes
+    body.seek(0)
+    prepared = requests.Request("POST", "http://paddle.invalid/", data=body).prepare()
+    assert prepared.body is body
+    assert prepared.headers["Content-Length"] == str(len(body))
@@ -0,0 +1,46 @@
+import types
+from uuid import uuid4
+
+import pytest
+
+from infrastructure.database.models import User as UserModel, Receipt as ReceiptModel
+from infrastructure.database.repositories import DjangoReceiptRepository
+
+
+@pytest.fixture
+def owner(db):
+    return UserModel.objects.create(id=uuid4(), email='search@example.com', first_name='S', last_name='U', is_active=True)
+
+
+def _receipt(owner, merchant, raw_text=''):
+    return ReceiptModel.objects.create(
+        id=uuid4(), user_id=owner.id, filename='r.jpg', file_size=100, mime_type='image/jpeg',
+        file_url='http://example.com/r.jpg', status='processed', receipt_type='purchase',
+        ocr_data={'merchant_name': merchant, 'raw_text': raw_text}, metadata={'custom_fields': {}},
+    )
+
+
+def _search(owner, query, **kwargs):
+    user = types.SimpleNamespace(id=owner.id)
+    return [r.id for r in DjangoReceiptRepository().search_receipts(user, query, **kwargs)]
+
+
+def test_partial_words_match_by_prefix(owner):
+    tesco = _receipt(owner, 'Tesco Extra')
+    _receipt(owner, 'Sainsburys')
+
+    assert _search(owner, 'tes') == [str(tesco.id)]
+    assert _search(owner, 'tesco ext') == [str(tesco.id)]
+    assert _search(owner, '&:!') == []
+
+
+def test_results_are_ranked_and_pages_are_stable(owner):
+    strong = _receipt(owner, 'Coffee House', 'coffee coffee coffee latte')
+    others = [_receipt(owner, 'Corner Shop', 'coffee') for _ in range(5)]
+
+    ranked = _search(owner, 'coffee')
+    assert ranked[0] == str(strong.id)
+    # Equal ranks fall back to id order, so offset pages neither repeat nor skip rows
+    paged = _search(owner, 'coffee', limit=2) + _search(owner, 'coffee', limit=2, offset=2) + _search(owner, 'coffee', limit=2, offset=4)
+    assert paged == ranked
+    assert sorted(ranked[1:]) == sorted(str(r.id) for r in others)
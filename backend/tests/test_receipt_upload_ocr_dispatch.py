@@ -0,0 +1,95 @@
+import types
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from application.receipts.use_cases import ReceiptUploadUseCase
+from domain.receipts.entities import FileInfo, OCRData
+
+
+class FakeRepo:
+    def __init__(self, duplicate=None):
+        self.duplicate = duplicate
+        self.saved = []
+
+    def save(self, receipt):
+        self.saved.append(receipt.status.value)
+        return receipt
+
+    def find_processed_by_checksum(self, user, sha256):
+        self.checksum = sha256
+        return self.duplicate
+
+
+def _use_case(repo):
+    validation = MagicMock()
+    validation.validate_file.return_value = (True, [])
+    validation.get_file_info.return_value = FileInfo('r.jpg', 3, 'image/jpeg', 'http://example.com/r.jpg')
+    storage = MagicMock()
+    storage.upload_file_from_memory.return_value = (True, 'http://example.com/r.jpg', None)
+    business = MagicMock()
+    business.suggest_category.return_value = None
+    business.is_business_expense.return_value = False
+    return ReceiptUploadUseCase(repo, validation, storage, MagicMock(), business)
+
+
+@pytest.fixture(autouse=True)
+def local_storage(settings):
+    settings.CLOUDINARY_CLOUD_NAME = None
+
+
+def test_duplicate_upload_reuses_earlier_ocr_result(settings):
+    settings.OCR_ASYNC_PROCESSING = True
+    earlier = types.SimpleNamespace(ocr_data=OCRData(merchant_name='Tesco', total_amount=Decimal('4.20')))
+    repo = FakeRepo(duplicate=earlier)
+    use_case = _use_case(repo)
+
+    with patch('application.receipts.tasks.process_receipt_ocr_task.delay') as delay:
+        result = use_case.execute(types.SimpleNamespace(id='u1'), b'abc', 'r.jpg', 'image/jpeg')
+
+    assert result['ocr_processed'] is True and result['ocr_queued'] is False
+    assert result['ocr_data']['merchant_name'] == 'Tesco'
+    assert repo.saved == ['uploaded', 'processed']
+    use_case.ocr_service.extract_receipt_data_from_url.assert_not_called()
+    delay.assert_not_called()
+
+
+def test_async_ocr_is_queued_only_after_commit(db, settings, django_capture_on_commit_callbacks):
+    settings.OCR_ASYNC_PROCESSING = True
+    use_case = _use_case(FakeRepo())
+
+    with patch('application.receipts.tasks.process_receipt_ocr_task.delay') as delay:
+        with django_capture_on_commit_callbacks(execute=False) as callbacks:
+            result = use_case.execute(types.SimpleNamespace(id='u1'), b'abc', 'r.jpg', 'image/jpeg')
+        delay.assert_not_called()
+        callbacks[0]()
+
+    assert result['ocr_queued'] is True
+    delay.assert_called_once_with(result['receipt_id'], None)
+
+
+def test_checksum_lookup_only_returns_processed_receipts_of_the_user(db):
+    from uuid import uuid4
+    from infrastructure.database.models import User as UserModel, Receipt as ReceiptModel
+    from infrastructure.database.repositories import DjangoReceiptRepository
+
+    def receipt(owner, status):
+        return ReceiptModel.objects.create(
+            id=uuid4(), user_id=owner.id, filename='r.jpg', file_size=3, mime_type='image/jpeg',
+            file_url='http://example.com/r.jpg', status=status, receipt_type='purchase',
+            ocr_data={'merchant_name': 'Tesco', 'total_amount': '4.20'},
+            metadata={'custom_fields': {'sha256': 'abc'}},
+        )
+
+    owner, other = (
+        UserModel.objects.create(id=uuid4(), email=f'{name}@example.com', first_name=name, last_name='U', is_active=True)
+        for name in ('owner', 'other')
+    )
+    receipt(owner, 'uploaded')
+    receipt(other, 'processed')
+    repo = DjangoReceiptRepository()
+
+    assert repo.find_processed_by_checksum(owner, 'abc') is None
+    processed = receipt(owner, 'processed')
+    assert repo.find_processed_by_checksum(owner, 'abc').id == str(processed.id)
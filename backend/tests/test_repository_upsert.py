@@ -0,0 +1,58 @@
+from uuid import uuid4
+
+import pytest
+
+from domain.accounts.entities import User as DomainUser, BusinessProfile, UserType
+from domain.common.entities import Email
+from domain.receipts.entities import Receipt as DomainReceipt, FileInfo, OCRData, ReceiptStatus
+from infrastructure.database.models import User as UserModel, Receipt as ReceiptModel
+from infrastructure.database.repositories import DjangoUserRepository, DjangoReceiptRepository
+
+
+def _domain_user(user_id, first_name='Ada', password_hash='hashed-secret'):
+    return DomainUser(
+        id=user_id,
+        email=Email('upsert@example.com'),
+        password_hash=password_hash,
+        first_name=first_name,
+        last_name='Lovelace',
+        user_type=UserType.INDIVIDUAL,
+        business_profile=BusinessProfile(company_name='Engines Ltd', business_type='sole_trader'),
+    )
+
+
+@pytest.mark.django_db
+def test_user_save_inserts_then_updates_without_touching_password():
+    repo = DjangoUserRepository()
+    user_id = str(uuid4())
+
+    repo.save(_domain_user(user_id))
+    row = UserModel.objects.get(id=user_id)
+    assert (row.first_name, row.password) == ('Ada', 'hashed-secret')
+
+    repo.save(_domain_user(user_id, first_name='Augusta', password_hash='ignored-on-update'))
+    row = UserModel.objects.get(id=user_id)
+    assert (row.first_name, row.password) == ('Augusta', 'hashed-secret')
+    assert UserModel.objects.filter(email='upsert@example.com').count() == 1
+    # The repository's cached read sees the update
+    assert repo.find_by_id(user_id).first_name == 'Augusta'
+
+
+@pytest.mark.django_db
+def test_receipt_save_inserts_then_updates_and_keeps_stored_ocr_data():
+    user_repo, repo = DjangoUserRepository(), DjangoReceiptRepository()
+    owner = user_repo.save(_domain_user(str(uuid4())))
+    receipt_id = str(uuid4())
+    file_info = FileInfo('r.jpg', 100, 'image/jpeg', 'http://example.com/r.jpg')
+
+    receipt = DomainReceipt(id=receipt_id, user=owner, file_info=file_info)
+    receipt.process_ocr_data(OCRData(merchant_name='Tesco'))
+    repo.save(receipt)
+    assert ReceiptModel.objects.get(id=receipt_id).ocr_data['merchant_name'] == 'Tesco'
+
+    # A receipt saved without OCR data leaves the stored JSON alone
+    repo.save(DomainReceipt(id=receipt_id, user=owner, file_info=file_info, status=ReceiptStatus.FAILED))
+    row = ReceiptModel.objects.get(id=receipt_id)
+    assert row.status == 'failed'
+    assert row.ocr_data['merchant_name'] == 'Tesco'
+    assert ReceiptModel.objects.filter(user_id=owner.id).count() == 1
@@ -0,0 +1,162 @@
+import types
+
+import pytest
+
+from infrastructure.payment import services as payment
+from infrastructure.payment.services import StripeConfig, StripePaymentService
+
+
+class Obj(dict):
+    """Dict with attribute access, like StripeObject."""
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name)
+
+
+class FakeStripe:
+    def __init__(self):
+        self.calls = []
+        self.event = None
+        self.Price = types.SimpleNamespace(retrieve=self._price)
+        self.PaymentLink = types.SimpleNamespace(list=lambda **kw: self._call('PaymentLink.list', Obj(data=[])))
+        self.Invoice = types.SimpleNamespace(list=lambda **kw: self._call('Invoice.list', Obj(data=[Obj(id='in_1')])))
+        self.PaymentMethod = types.SimpleNamespace(list=lambda **kw: self._call('PaymentMethod.list', Obj(data=[])))
+        self.Customer = types.SimpleNamespace(
+            retrieve=lambda customer_id: Obj(invoice_settings=Obj(default_payment_method=None)),
+            modify=lambda *args, **kw: None,
+        )
+        self.Webhook = types.SimpleNamespace(construct_event=lambda **kw: self.event)
+
+    def _call(self, name, result):
+        self.calls.append(name)
+        return result
+
+    def _price(self, price_id, expand=None):
+        self.calls.append('Price.retrieve')
+        return Obj(id=price_id, type='recurring', active=True, nickname=None, currency='gbp', unit_amount=500,
+                   recurring=Obj(interval='month'), product=Obj(id='prod_1', name='Plan', metadata={}, images=[]))
+
+    def count(self, name):
+        return self.calls.count(name)
+
+
+@pytest.fixture
+def stripe(monkeypatch):
+    fake = FakeStripe()
+    monkeypatch.setattr(payment, '_STRIPE_MOD', fake)
+    payment._plans_cache.clear()
+    payment._customer_cache.clear()
+    yield fake
+    payment._plans_cache.clear()
+    payment._customer_cache.clear()
+
+
+@pytest.fixture
+def service(stripe):
+    return StripePaymentService(StripeConfig('sk_test', 'price_b', 'price_p', 'price_e', 'whsec', 'pk_test'))
+
+
+def _expire(store, ttl):
+    for key, (stored_at, value) in list(store.items()):
+        store[key] = (stored_at - ttl, value)
+
+
+def test_plans_are_cached_for_the_ttl_and_handed_out_as_copies(service, stripe):
+    first = service.list_plans()
+    first['items'].clear()
+
+    assert service.list_plans()['items']
+    assert stripe.count('PaymentLink.list') == 1
+
+    _expire(payment._plans_cache, payment.PLANS_CACHE_TTL)
+    service.list_plans()
+    assert stripe.count('PaymentLink.list') == 2
+
+
+def test_customer_reads_are_cached_per_customer(service, stripe):
+    service.list_invoices('cus_1')
+    service.list_invoices('cus_1')
+    service.list_invoices('cus_2')
+    service.list_payment_methods('cus_1')
+    service.list_payment_methods('cus_1')
+
+    assert stripe.count('Invoice.list') == 2
+    assert stripe.count('PaymentMethod.list') == 1
+
+
+@pytest.mark.parametrize('event_type, data, cleared, kept', [
+    ('price.updated', {'id': 'price_b'}, 'PaymentLink.list', 'Invoice.list'),
+    ('invoice.paid', {'id': 'in_1', 'customer': 'cus_1'}, 'Invoice.list', 'PaymentLink.list'),
+    ('customer.updated', {'id': 'cus_1'}, 'Invoice.list', 'PaymentLink.list'),
+])
+def test_webhooks_drop_only_the_reads_they_make_stale(service, stripe, event_type, data, cleared, kept):
+    service.list_plans()
+    service.list_invoices('cus_1')
+    stripe.event = Obj(type=event_type, data=Obj(object=dict(data)))
+
+    assert service.handle_webhook(b'{}', 'sig')['success']
+    service.list_plans()
+    service.list_invoices('cus_1')
+
+    assert stripe.count(cleared) == 2
+    assert stripe.count(kept) == 1
+
+
+def test_store_evicts_oldest_live_entries_when_full(monkeypatch):
+    monkeypatch.setattr(payment, '_CACHE_MAX_ENTRIES', 3)
+    store = {}
+    for i in range(5):
+        payment._cache_put(store, ('k', i), {'i': i}, ttl=60)
+
+    assert list(store) == [('k', 2), ('k', 3), ('k', 4)]
+
+    # Refreshing a key moves it to the young end
+    payment._cache_put(store, ('k', 2), {'i': 2}, ttl=60)
+    payment._cache_put(store, ('k', 5), {'i': 5}, ttl=60)
+    assert list(store) == [('k', 4), ('k', 2), ('k', 5)]
+
+
+@pytest.fixture
+def customers(stripe):
+    from django.core.cache import cache
+    cache.clear()
+    stripe.Customer.search = lambda **kw: stripe._call('Customer.search', Obj(data=[]))
+    stripe.Customer.list = lambda **kw: stripe._call('Customer.list', Obj(data=[]))
+    stripe.Customer.create = lambda **kw: stripe._call('Customer.create', Obj(id='cus_new'))
+    yield stripe
+    cache.clear()
+
+
+def test_customer_id_is_cached_by_email(service, customers):
+    user = types.SimpleNamespace(email="o'brien@example.com", first_name='Pat', last_name="O'Brien")
+
+    assert service._ensure_customer(user) == 'cus_new'
+    assert service._ensure_customer(types.SimpleNamespace(email="O'Brien@Example.com", first_name='Pat', last_name='B')) == 'cus_new'
+
+    assert customers.calls.count('Customer.create') == 1
+    assert customers.calls.count('Customer.search') == 1
+
+
+def test_customer_deleted_webhook_forgets_the_cached_id(service, customers):
+    user = types.SimpleNamespace(email='gone@example.com', first_name='Gone', last_name='User')
+    service._ensure_customer(user)
+    customers.event = Obj(type='customer.deleted', data=Obj(object={'id': 'cus_new', 'email': 'gone@example.com'}))
+
+    service.handle_webhook(b'{}', 'sig')
+    service._ensure_customer(user)
+
+    assert customers.calls.count('Customer.create') == 2
+
+
+def test_customer_ids_are_kept_apart_per_stripe_account(customers):
+    user = types.SimpleNamespace(email='same@example.com', first_name='Same', last_name='User')
+    test_mode = StripePaymentService(StripeConfig('sk_test', '', '', '', '', ''))
+    live_mode = StripePaymentService(StripeConfig('sk_live', '', '', '', '', ''))
+
+    test_mode._ensure_customer(user)
+    live_mode._ensure_customer(user)
+
+    assert customers.calls.count('Customer.create') == 2
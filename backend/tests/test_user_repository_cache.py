@@ -0,0 +1,69 @@
+from uuid import uuid4
+
+import pytest
+from django.core.cache import cache
+
+from domain.accounts.entities import UserStatus
+from infrastructure.database.models import User as UserModel
+from infrastructure.database.repositories import DjangoUserRepository
+
+
+@pytest.fixture
+def repo(db, settings):
+    settings.USER_REPOSITORY_CACHE_TTL = 300
+    cache.clear()
+    yield DjangoUserRepository()
+    cache.clear()
+
+
+def _user(**fields):
+    defaults = dict(id=uuid4(), email=f'{uuid4().hex}@example.com', first_name='Cache', last_name='User', password='hash',
+                    company_name='Acme', business_type='retail', is_active=True, status='active')
+    return UserModel.objects.create(**{**defaults, **fields})
+
+
+def test_reads_are_cached_until_the_repository_writes(repo):
+    row = _user(first_name='Before')
+    user = repo.find_by_id(str(row.id))
+    assert user.first_name == 'Before'
+
+    # A queryset update sends no signal, so the cached read is still served
+    UserModel.objects.filter(id=row.id).update(first_name='Sneaky')
+    assert repo.find_by_id(str(row.id)).first_name == 'Before'
+    assert repo.find_by_email(row.email).first_name == 'Sneaky'
+
+    user.update_profile(first_name='After')
+    repo.save(user)
+    assert repo.find_by_id(str(row.id)).first_name == 'After'
+    assert repo.find_by_email(row.email).first_name == 'After'
+
+
+def test_model_save_outside_the_repository_invalidates_via_signal(repo):
+    row = _user()
+    assert repo.count_by_status(UserStatus.ACTIVE) == 1
+
+    _user()
+    assert repo.count_by_status(UserStatus.ACTIVE) == 2
+
+    row.first_name = 'Renamed'
+    row.save()
+    assert repo.find_by_id(str(row.id)).first_name == 'Renamed'
+
+
+def test_delete_invalidates_cached_reads(repo):
+    row = _user()
+    assert repo.find_by_id(str(row.id)) is not None
+
+    assert repo.delete(str(row.id)) is True
+    assert repo.find_by_id(str(row.id)) is None
+    assert repo.count_by_status(UserStatus.ACTIVE) == 0
+
+
+def test_missing_version_key_starts_a_fresh_namespace(repo):
+    row = _user(first_name='Before')
+    repo.find_by_id(str(row.id))
+    cache.delete(DjangoUserRepository.CACHE_VERSION_KEY)
+    UserModel.objects.filter(id=row.id).update(first_name='After')
+
+    repo._invalidate_cache()
+    assert repo.find_by_id(str(row.id)).first_name == 'After'